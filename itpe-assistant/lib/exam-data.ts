@@ -0,0 +1,149 @@
+/**
+ * Exam analysis data exported by scripts/export_web.py
+ *
+ * The export writes pre-sharded, minified JSON under public/data/exam/:
+ * a small manifest plus per-round, per-category and per-keyword shards whose
+ * file names carry a content hash. Only the manifest needs revalidation; the
+ * shards are immutable and are fetched on demand for the slice being rendered.
+ */
+
+const BASE_URL = "/data/exam";
+
+export interface ManifestRound {
+  round: string;
+  total: number;
+  file: string;
+}
+
+export interface ManifestCategory {
+  id: string;
+  name: string;
+  total: number;
+  file: string;
+}
+
+export interface ExamManifest {
+  version: number;
+  rounds: ManifestRound[];
+  categories: ManifestCategory[];
+  counts: Record<string, number[]>; // round -> counts in `categories` order
+  keywords: {
+    shards: number;
+    hash: "fnv1a32";
+    count: number;
+    files: string[];
+  };
+}
+
+export interface RoundQuestion {
+  period: string;
+  number: string;
+  title: string;
+  keywords: string[];
+  details: string[];
+  category: string; // ManifestCategory.id
+  matched: string[];
+}
+
+export interface RoundShard {
+  round: string;
+  total: number;
+  categories: Record<string, number>;
+  questions: RoundQuestion[];
+}
+
+// [round, period, number, title]
+export type QuestionRef = [string, string, string, string];
+
+export interface CategoryShard {
+  id: string;
+  name: string;
+  window: number; // moving average window (rounds)
+  trend: {
+    round: string;
+    count: number;
+    share: number;
+    average: number;
+    window: number; // rounds actually averaged (< window for the first rounds)
+  }[];
+  questions: QuestionRef[];
+}
+
+export interface KeywordEntry {
+  label: string;
+  labels: string[];
+  postings: QuestionRef[];
+}
+
+export type KeywordShard = Record<string, KeywordEntry>;
+
+const shardCache = new Map<string, Promise<unknown>>();
+
+async function fetchJson<T>(url: string, init?: RequestInit): Promise<T> {
+  const response = await fetch(url, init);
+  if (!response.ok) {
+    throw new Error(`Failed to load ${url}: ${response.status}`);
+  }
+  return response.json() as Promise<T>;
+}
+
+function fetchShard<T>(file: string): Promise<T> {
+  let shard = shardCache.get(file);
+  if (!shard) {
+    shard = fetchJson<T>(`${BASE_URL}/${file}`, { cache: "force-cache" });
+    shard.catch(() => shardCache.delete(file));
+    shardCache.set(file, shard);
+  }
+  return shard as Promise<T>;
+}
+
+export function getManifest(): Promise<ExamManifest> {
+  return fetchJson<ExamManifest>(`${BASE_URL}/manifest.json`, {
+    cache: "no-cache",
+  });
+}
+
+export async function getRound(
+  manifest: ExamManifest,
+  round: string | number,
+): Promise<RoundShard | null> {
+  const entry = manifest.rounds.find((r) => r.round === String(round));
+  return entry ? fetchShard<RoundShard>(entry.file) : null;
+}
+
+export async function getCategory(
+  manifest: ExamManifest,
+  id: string,
+): Promise<CategoryShard | null> {
+  const entry = manifest.categories.find((c) => c.id === id);
+  return entry ? fetchShard<CategoryShard>(entry.file) : null;
+}
+
+/** Same normalization as scripts/keyword_index.py (lowercase, single spaces) */
+export function normalizeKeyword(keyword: string): string {
+  return keyword.toLowerCase().split(/\s+/).filter(Boolean).join(" ");
+}
+
+/** FNV-1a 32-bit over UTF-8 bytes, matching export_web.fnv1a */
+export function fnv1a(text: string): number {
+  let hash = 0x811c9dc5;
+  for (const byte of new TextEncoder().encode(text)) {
+    hash = Math.imul(hash ^ byte, 0x01000193) >>> 0;
+  }
+  return hash;
+}
+
+export function keywordBucket(keyword: string, shards: number): number {
+  return fnv1a(normalizeKeyword(keyword)) % shards;
+}
+
+export async function getKeyword(
+  manifest: ExamManifest,
+  keyword: string,
+): Promise<KeywordEntry | null> {
+  const { shards, files } = manifest.keywords;
+  const shard = await fetchShard<KeywordShard>(
+    files[keywordBucket(keyword, shards)],
+  );
+  return shard[normalizeKeyword(keyword)] ?? null;
+}
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+회차 × 교시 × 카테고리 집계 큐브
+
+분석된 회차의 문제 수와 매칭 키워드 수를 (회차, 교시, 카테고리) 칸마다 세어 정수 배열
+두 개(array 모듈)로 data/exam_results/.aggregate_cube.pickle에 저장합니다. 리포트는
+회차별 문제 전체를 읽지 않고 이 큐브만으로 회차 비교, 비율 추이, 이동평균을 계산합니다.
+
+갱신:
+- analyze.py가 회차 하나를 저장하면 그 회차의 칸만 교체 (update_round)
+- 저장소(exam_store.sqlite3)나 회차별 JSON 파일이 다른 경로로 바뀌었으면 다음 로드 때 코퍼스에서 한 번에 다시 생성
+
+사용법:
+    import aggregate_cube
+
+    cube = aggregate_cube.load_cube()
+    cube.category_counts("137")            # {카테고리: 문제 수}
+    cube.shares("137")                     # {카테고리: 비율(%)}
+    cube.moving_average("5. 정보보안", 3)   # [(회차, 최근 3회 평균 비율), ...]
+
+    python aggregate_cube.py               # 큐브 갱신 후 회차별 요약 출력
+    python aggregate_cube.py --rebuild     # 강제 재생성
+"""
+
+import os
+import pickle
+import sys
+from array import array
+
+import corpus
+import exam_store
+import profiling
+from syllabus_compiler import get_syllabus_structure
+
+# 저장 형식을 바꾸면 올려서 기존 큐브를 무효화
+CUBE_VERSION = 1
+
+# 칸 값 배열 형식 (플랫폼과 관계없이 8바이트 부호 있는 정수)
+TYPECODE = "q"
+
+MEASURES = ("questions", "keywords")
+
+
+def zeros(size):
+    """값이 0인 칸 size개"""
+    return array(TYPECODE, bytes(size * array(TYPECODE).itemsize))
+
+
+def cube_path():
+    """현재 저장소 옆의 큐브 경로"""
+    return exam_store.STORE_PATH.with_name(".aggregate_cube.pickle")
+
+
+class AggregateCube:
+    """(회차, 교시, 카테고리) -> 문제 수 / 매칭 키워드 수
+
+    회차는 오름차순이며 칸 값은 회차 -> 교시 -> 카테고리 순으로 한 배열에 이어 붙어 있어,
+    회차 하나의 칸은 연속된 구간 하나입니다.
+    """
+
+    def __init__(self, rounds=(), periods=(), categories=()):
+        self.rounds = list(rounds)
+        self.periods = list(periods)
+        self.categories = list(categories)
+        self._values = {measure: zeros(len(self.rounds) * self._round_size()) for measure in MEASURES}
+
+    def _round_size(self):
+        return len(self.periods) * len(self.categories)
+
+    def _round_slice(self, exam_num):
+        position = self.rounds.index(str(exam_num))
+        size = self._round_size()
+        return slice(position * size, (position + 1) * size)
+
+    def has_round(self, exam_num):
+        """회차 집계가 있는지"""
+        return str(exam_num) in self.rounds
+
+    def _relayout(self, periods, categories):
+        """교시/카테고리 목록을 늘리고 기존 칸 값을 새 위치로 옮김"""
+        old_periods, old_categories = self.periods, self.categories
+        old_values = self._values
+        self.periods, self.categories = periods, categories
+        self._values = {measure: zeros(len(self.rounds) * self._round_size()) for measure in MEASURES}
+
+        period_ids = [periods.index(period) for period in old_periods]
+        category_ids = [categories.index(category) for category in old_categories]
+        old_size = len(old_periods) * len(old_categories)
+        for round_id in range(len(self.rounds)):
+            for old_p, new_p in enumerate(period_ids):
+                for old_c, new_c in enumerate(category_ids):
+                    old = round_id * old_size + old_p * len(old_categories) + old_c
+                    new = (round_id * len(periods) + new_p) * len(categories) + new_c
+                    for measure in MEASURES:
+                        self._values[measure][new] = old_values[measure][old]
+
+    def set_round(self, exam_num, cells):
+        """회차 칸 전체 교체 (cells: {(교시, 카테고리): (문제 수, 매칭 키워드 수)})"""
+        exam_num = str(exam_num)
+        periods = self.periods + [p for p in dict.fromkeys(p for p, _ in cells) if p not in self.periods]
+        categories = self.categories + [c for c in dict.fromkeys(c for _, c in cells) if c not in self.categories]
+        if periods != self.periods or categories != self.categories:
+            self._relayout(periods, categories)
+
+        size = self._round_size()
+        if exam_num not in self.rounds:
+            keys = [exam_store.exam_sort_key(n) for n in self.rounds]
+            position = sum(1 for key in keys if key < exam_store.exam_sort_key(exam_num))
+            self.rounds.insert(position, exam_num)
+            for values in self._values.values():
+                values[position * size:position * size] = zeros(size)
+
+        block = self._round_slice(exam_num)
+        row = {measure: [0] * size for measure in MEASURES}
+        for (period, category), counts in cells.items():
+            offset = self.periods.index(period) * len(self.categories) + self.categories.index(category)
+            for measure, count in zip(MEASURES, counts):
+                row[measure][offset] = count
+        for measure in MEASURES:
+            self._values[measure][block] = array(TYPECODE, row[measure])
+
+    def remove_round(self, exam_num):
+        """회차 칸 제거"""
+        if self.has_round(exam_num):
+            block = self._round_slice(exam_num)
+            for values in self._values.values():
+                del values[block]
+            self.rounds.remove(str(exam_num))
+
+    def period_counts(self, exam_num, measure="questions"):
+        """회차의 {교시: {카테고리: 값}}"""
+        values = self._values[measure][self._round_slice(exam_num)]
+        width = len(self.categories)
+        return {
+            period: dict(zip(self.categories, values[i * width:(i + 1) * width]))
+            for i, period in enumerate(self.periods)
+        }
+
+    def category_counts(self, exam_num, measure="questions"):
+        """회차의 {카테고리: 값} (교시 합계, 카테고리 순서 유지)"""
+        values = self._values[measure][self._round_slice(exam_num)]
+        width = len(self.categories)
+        return {category: sum(values[c::width]) for c, category in enumerate(self.categories)}
+
+    def total(self, exam_num, measure="questions"):
+        """회차의 값 합계"""
+        return sum(self._values[measure][self._round_slice(exam_num)])
+
+    def shares(self, exam_num):
+        """회차의 {카테고리: 문제 수 비율(%)}"""
+        counts = self.category_counts(exam_num)
+        total = sum(counts.values())
+        return {category: (count / total * 100) if total > 0 else 0 for category, count in counts.items()}
+
+    def share_trend(self, category, rounds=None):
+        """[(회차, 카테고리 비율(%)), ...] (회차 오름차순, rounds로 회차 제한)"""
+        rounds = self.rounds if rounds is None else [n for n in self.rounds if n in {str(r) for r in rounds}]
+        return [(exam_num, self.shares(exam_num).get(category, 0)) for exam_num in rounds]
+
+    def moving_average(self, category, window, rounds=None):
+        """[(회차, 그 회차까지 최근 window개 회차의 평균 비율(%)), ...] (앞쪽은 있는 회차만 평균)"""
+        trend = self.share_trend(category, rounds)
+        averages = []
+        running = 0.0
+        for i, (exam_num, share) in enumerate(trend):
+            running += share
+            if i >= window:
+                running -= trend[i - window][1]
+            averages.append((exam_num, running / min(i + 1, window)))
+        return averages
+
+    def to_state(self, store=None):
+        """저장용 상태 (배열은 바이트열로)"""
+        return {
+            "version": CUBE_VERSION,
+            "store": store,
+            "rounds": self.rounds,
+            "periods": self.periods,
+            "categories": self.categories,
+            "values": {measure: values.tobytes() for measure, values in self._values.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """to_state() 결과로 큐브 복원"""
+        cube = cls.__new__(cls)
+        cube.rounds = state["rounds"]
+        cube.periods = state["periods"]
+        cube.categories = state["categories"]
+        cube._values = {}
+        for measure, raw in state["values"].items():
+            cube._values[measure] = array(TYPECODE)
+            cube._values[measure].frombytes(raw)
+        return cube
+
+
+def round_cells(questions, categorized, categories):
+    """analyze_exam의 교시별 문제/분류 결과 -> {(교시, 카테고리): (문제 수, 매칭 키워드 수)}
+
+    출제기준 카테고리가 아닌 분류는 "미분류"로 셉니다 (analyze_exam 집계와 같은 규칙).
+    """
+    cells = {}
+    for period in questions:
+        for question_categories, matched_keywords in categorized[period]:
+            for category in question_categories:
+                if category not in categories:
+                    category = exam_store.UNCATEGORIZED
+                count, keywords = cells.get((period, category), (0, 0))
+                cells[(period, category)] = (count + 1, keywords + len(matched_keywords))
+    return cells
+
+
+def build_cube(data=None):
+    """코퍼스(get_corpus() 결과)의 분석된 회차 전체로 큐브 생성"""
+    data = data or corpus.get_corpus()
+    categories = list(get_syllabus_structure()) + [exam_store.UNCATEGORIZED]
+    cube = AggregateCube(periods=[], categories=categories)
+    for exam_num in (n for n in data["exams"] if n in data["analyzed"]):
+        cells = {}
+        for question in data["by_exam"].get(exam_num, []):
+            category = question.category if question.category in categories else exam_store.UNCATEGORIZED
+            count, keywords = cells.get((question.period, category), (0, 0))
+            cells[(question.period, category)] = (count + 1, keywords + len(question.matched_keywords or ()))
+        cube.set_round(exam_num, cells)
+    return cube
+
+
+def read_cube(path, state):
+    """저장소/JSON 파일 상태(corpus.source_state())가 같은 큐브 (없거나 오래되었으면 None)"""
+    try:
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if saved.get("version") != CUBE_VERSION or saved.get("store") != state:
+        return None
+    return AggregateCube.from_state(saved)
+
+
+def write_cube(cube, path, state):
+    """큐브 저장 (다른 프로세스가 읽는 중에도 안전하도록 임시 파일 후 교체)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(cube.to_state(state), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_cube(rebuild=False):
+    """저장된 큐브를 읽고, 없거나 저장소/JSON 파일이 바뀌었으면 코퍼스에서 다시 생성해 저장"""
+    if not exam_store.STORE_PATH.exists():
+        exam_store.get_store()
+    path = cube_path()
+
+    with profiling.stage("load cube"):
+        cube = None if rebuild else read_cube(path, corpus.source_state())
+        if cube is None:
+            # 코퍼스를 읽은 시점의 상태로 기록 (생성 중 다른 프로세스가 저장소를 바꿨으면 다음 로드 때 다시 생성)
+            data = corpus.get_corpus()
+            cube = build_cube(data)
+            write_cube(cube, path, corpus.corpus_state(data))
+    return cube
+
+
+def update_round(exam_num, questions, categorized, categories, previous_state):
+    """analyze_exam이 회차를 저장한 직후 호출: 그 회차의 칸만 교체 -> 갱신 여부
+
+    previous_state는 저장 직전의 저장소/JSON 파일 상태(corpus.source_state())입니다. 큐브가 그 상태와
+    일치할 때만 갱신하며, 아니면 그대로 두어 다음 로드 때 다시 생성되게 합니다.
+    """
+    path = cube_path()
+    cube = read_cube(path, previous_state)
+    if cube is None:
+        return False
+    cube.set_round(exam_num, round_cells(questions, categorized, categories))
+    write_cube(cube, path, corpus.source_state())
+    return True
+
+
+def main():
+    """메인 함수"""
+    cube = load_cube(rebuild="--rebuild" in sys.argv)
+    print(f"✓ 집계 큐브: {cube_path()}")
+    print(f"  - {len(cube.rounds)}개 회차 × {len(cube.periods)}개 교시 × {len(cube.categories)}개 카테고리")
+    print()
+    print(f"{'회차':<6} {'문제':>5} {'매칭 키워드':>9}  최다 출제 영역")
+    print("-" * 100)
+    for exam_num in cube.rounds:
+        counts = cube.category_counts(exam_num)
+        top = max(counts.items(), key=lambda x: x[1] if x[0] != exam_store.UNCATEGORIZED else 0)
+        print(f"{exam_num + '회':<6} {cube.total(exam_num):>5} {cube.total(exam_num, 'keywords'):>12}  "
+              f"{top[0]} ({top[1]}문제)")
+
+
+if __name__ == "__main__":
+    with profiling.session("aggregate_cube"):
+        main()
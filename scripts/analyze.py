@@ -8,259 +8,41 @@ exam_data_helper.py로 입력한 데이터를 기반으로 출제기준 매칭 
     python analyze.py 137              # 137회 분석
     python analyze.py 136 137          # 136회, 137회 분석
     python analyze.py 136 137 --quiet  # 간략 출력
+    python analyze.py --all            # 전체 회차 일괄 분석 (NumPy/SciPy 필요)
+    python analyze.py 129 130 131 --jobs 4  # 프로세스 4개로 병렬 분석
+    python analyze.py 137 --force      # 캐시 무시하고 재분석
 """
 
+import hashlib
+import io
 import json
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+import aggregate_cube
+import corpus
+import exam_store
+import profiling
+from syllabus_compiler import get_syllabus_index, get_syllabus_structure
+
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "exam_results"
+CACHE_DIR = DATA_DIR / ".analysis_cache"
 
-# 출제기준 구조
-SYLLABUS_STRUCTURE = {
-    "1. 정보 전략 및 관리": {
-        "세부항목": [
-            "정보전략", "정보기술 전략", "비즈니스", "정보기술 환경분석", "아키텍처 설계",
-            "투자성과", "경영정보", "경영전략", "정보시스템 개선", "AI윤리", "IT감리",
-            "통계", "가설검정", "프로젝트 관리", "SLA", "재해복구", "A/B 테스팅", "대가산정",
-            "SCM", "공급망", "PMO", "갈등관리", "팀", "디지털전환", "AX", "ISP", "ISMP",
-            "WBS", "ESG", "투자분석", "차세대 시스템", "AHP", "의사결정", "분포", "베르누이",
-            "기하 분포", "ISO 21500", "DSML", "요구사항 관리", "디지털 트랜스포메이션",
-            "Digital Transformation", "BPR", "t-검정", "독립표본", "대응 표본",
-            "전략적 기업경영", "Strategic Enterprise Management", "SWOT", "경영환경 분석",
-            "ITSM", "서비스 관리", "기술수용모델", "TAM", "Technology Acceptance Model",
-            "BCP", "Business Continuity Planning", "DRS", "Disaster Recovery System"
-        ],
-        "키워드": ["정보전략", "경영", "감리", "프로젝트", "통계", "SLA", "재해복구", "테스팅",
-                  "대가산정", "SCM", "공급망", "PMO", "갈등", "AX", "디지털전환", "ISP", "ISMP",
-                  "WBS", "ESG", "투자분석", "투자성과", "차세대", "개선", "AHP", "의사결정",
-                  "분포", "Bernoulli", "Geometric", "ISO", "DSML", "요구사항",
-                  "Digital Transformation", "트랜스포메이션", "BPR", "t-검정", "검정", "SWOT",
-                  "경영환경", "ITSM", "서비스 관리", "TAM", "Technology Acceptance", "기술수용",
-                  "BCP", "Business Continuity", "DRS", "Disaster Recovery"]
-    },
-    "2. 소프트웨어 공학": {
-        "세부항목": [
-            "소프트웨어 개발방법론", "SW아키텍처", "UI/UX", "시스템SW", "프로그래밍",
-            "임베디드", "테스트", "리팩토링", "운영", "유지보수", "품질", "SW 안전",
-            "UML", "다이어그램", "인스펙션", "검토", "제품계열", "DevOps", "DevSecOps",
-            "라이프사이클", "자동화", "AOP", "결합도", "Coupling", "캡슐화", "Encapsulation",
-            "화이트박스", "블랙박스", "디자인패턴", "Design Pattern", "Agile", "EDA",
-            "Event Driven Architecture", "아키텍처 토폴로지", "노코드", "no-code",
-            "요구사항명세서", "DataOps", "데이터옵스", "빅데이터 감리", "폭포수",
-            "애자일", "아키텍처 스타일", "통합 테스트", "Integration Test",
-            "소프트웨어 안전성", "SBOM", "Software Bill of Material", "규모산정",
-            "정보은닉", "Information Hiding", "REST API", "RESTful", "API 설계",
-            "뮤테이션 테스트", "Mutation Test", "요구공학", "Requirement Engineering",
-            "형상관리", "Configuration Management", "Baseline", "기준선"
-        ],
-        "키워드": ["소프트웨어", "테스트", "감리", "UML", "다이어그램", "개발", "설계",
-                  "역공학", "재공학", "인스펙션", "검토", "제품계열", "DevOps", "DevSecOps",
-                  "라이프사이클", "자동화", "품질", "AOP", "결합도", "Coupling", "캡슐화",
-                  "Encapsulation", "화이트박스", "블랙박스", "White Box", "Black Box",
-                  "리팩토링", "Refactoring", "디자인패턴", "Design Pattern", "Agile", "EDA",
-                  "Event Driven", "아키텍처", "노코드", "no-code", "요구사항명세서",
-                  "DataOps", "데이터옵스", "빅데이터", "폭포수", "애자일", "통합 테스트",
-                  "Integration", "안전성", "SBOM", "규모산정", "정보은닉", "REST", "API",
-                  "RESTful", "뮤테이션", "Mutation", "요구공학", "Requirement Engineering",
-                  "형상관리", "Configuration", "Baseline", "기준선"]
-    },
-    "3. 자료처리": {
-        "세부항목": [
-            "자료구조", "데이터모델링", "데이터베이스", "DBMS", "분산파일", "데이터마이닝",
-            "데이터 품질", "빅데이터", "트리", "연관 규칙", "트랜잭션", "벡터 데이터베이스",
-            "정규형", "정규화", "다치종속", "BCNF", "아웃라이어", "이상치", "F1-score",
-            "Clustering", "DBSCAN", "트리정렬", "Tree Sort", "Data Mining", "이상현상",
-            "Anomaly", "Relation", "릴레이션", "품질관리", "병행 제어", "거버넌스",
-            "블록체인", "Decision Tree", "의사결정나무", "음성데이터", "차원 축소",
-            "Dimensionality Reduction", "데이터 표준화", "Data Visualization",
-            "데이터 시각화", "Data Structure", "학습용 데이터", "정렬 알고리즘",
-            "점추정", "구간추정", "통계 추정", "다중공선성", "Multicollinearity",
-            "스택", "큐", "리스트", "선형 자료구조", "TF-IDF", "형태소 분석",
-            "Term Frequency", "Inverse Document Frequency", "텍스트 마이닝",
-            "NoSQL", "CRUD", "매트릭스", "RDBMS", "관계형 데이터베이스",
-            "다자간 계산", "MPC", "Multi-Party Computation", "정적 SQL", "동적 SQL",
-            "Static SQL", "Dynamic SQL", "SQL 비교", "알고리즘", "복잡도",
-            "O-Notation", "Big O", "시간복잡도", "다차원 색인구조", "Multidimensional Index Structure",
-            "색인구조", "Index Structure", "다차원", "인덱스", "팬텀충돌", "Phantom Conflict",
-            "팬텀", "확장성 해싱", "Extendible Hashing", "해싱", "Hashing"
-        ],
-        "키워드": ["자료구조", "데이터", "DB", "트리", "마이닝", "트랜잭션", "벡터",
-                  "정규형", "정규화", "아웃라이어", "이상치", "F1", "Clustering",
-                  "DBSCAN", "Tree Sort", "Data Mining", "Transaction", "Anomaly",
-                  "Relation", "릴레이션", "이상현상", "품질관리", "품질", "병행 제어",
-                  "거버넌스", "블록체인", "Decision Tree", "음성", "차원 축소",
-                  "Dimensionality", "표준화", "시각화", "Visualization", "Data Structure",
-                  "학습용", "정렬", "점추정", "구간추정", "추정", "다중공선성", "Multicollinearity",
-                  "스택", "큐", "리스트", "선형 자료", "TF-IDF", "형태소", "Term Frequency",
-                  "텍스트 마이닝", "NoSQL", "CRUD", "매트릭스", "RDBMS", "관계형",
-                  "MPC", "Multi-Party", "다자간", "정적 SQL", "동적 SQL", "Static SQL",
-                  "Dynamic SQL", "알고리즘", "복잡도", "O-Notation", "Big O", "시간복잡도",
-                  "색인구조", "Index Structure", "다차원", "인덱스", "Multidimensional",
-                  "팬텀충돌", "Phantom Conflict", "팬텀", "해싱", "Hashing", "Extendible"]
-    },
-    "4. 컴퓨터 시스템 및 정보통신": {
-        "세부항목": [
-            "운영체제", "시스템 프로그래밍", "수치해석", "가상화", "인프라",
-            "네트워크", "프로토콜", "통신시스템", "라우팅", "캐시", "메모리", "스케줄링",
-            "클라우드", "서버리스", "FaaS", "BaaS", "CXL", "PCIe", "인터커넥트",
-            "세그먼테이션", "동기화", "병렬처리", "메모리 누수", "Virtualization",
-            "인프라 아키텍처", "코드형 인프라", "IaC", "VXLAN", "LAN", "서브네팅",
-            "subnetting", "TCP", "Transmission Control Protocol", "NFC",
-            "Near Field Communication", "Service Model", "Deployment Model",
-            "오토 스케일링", "Auto Scaling", "페이징", "소켓 통신", "Socket",
-            "ELK", "Elasticsearch", "Logstash", "Kibana", "로그 분석",
-            "SCTP", "Stream Control Transmission Protocol", "전송 프로토콜",
-            "VPN", "Virtual Private Network", "5G", "특화망", "handshake",
-            "RIP", "Routing Information Protocol", "OSPF", "Open Shortest Path First",
-            "라우팅 프로토콜", "Routing Protocol", "인터미턴트 컴퓨팅", "Intermittent Computing",
-            "간헐적 컴퓨팅", "IBN", "Intent-Based Networking", "의도 기반 네트워킹",
-            "IEEE 802", "무선랜", "표준", "IPC", "Inter Process Communication", "프로세스 간 통신",
-            "쿠버네티스", "Kubernetes", "컨테이너 오케스트레이션"
-        ],
-        "키워드": ["운영체제", "네트워크", "프로토콜", "라우팅", "캐시", "메모리", "스케줄링",
-                  "클라우드", "서버리스", "CXL", "세그먼테이션", "동기화", "누수",
-                  "가상화", "Virtualization", "인프라", "IaC", "VXLAN", "LAN", "서브네팅",
-                  "subnetting", "TCP", "Congestion", "NFC", "Near Field", "Service Model",
-                  "Deployment", "오토 스케일링", "Auto Scaling", "페이징", "소켓", "Socket",
-                  "ELK", "Elasticsearch", "Logstash", "Kibana", "로그", "SCTP",
-                  "Stream Control", "전송", "VPN", "Virtual Private", "5G", "특화망", "handshake",
-                  "RIP", "OSPF", "Routing Information", "Open Shortest Path", "라우팅 프로토콜",
-                  "인터미턴트", "Intermittent", "간헐적", "IBN", "Intent-Based", "IEEE", "802", "무선랜",
-                  "IPC", "Inter Process", "프로세스 간 통신", "쿠버네티스", "Kubernetes", "컨테이너"]
-    },
-    "5. 정보보안": {
-        "세부항목": [
-            "암호화", "보안시스템", "보안엔지니어링", "관리적 보안", "포렌식",
-            "개인정보보호", "보안 취약점", "악성코드", "백도어", "CC", "인증", "평가",
-            "타원곡선", "ECC", "E2E", "제로트러스트", "공급망 보안", "NOMA",
-            "접근제어", "Access Control", "LDAP", "인포스틸러", "Infostealer",
-            "리스크 관리", "CSP 보안", "드론 보안", "블록 암호화", "디지털 포렌식",
-            "클라우드 보안", "보안 위협", "보안 문제", "보안 요소", "크리덴셜 스터핑",
-            "Credential Stuffing", "Zero Trust Security", "제로 트러스트 보안",
-            "ISMS", "Information Security Management System", "안전성 확보조치",
-            "ISA/IEC 62443", "산업 보안", "ICS 보안", "큐싱", "Qshing", "피싱",
-            "TPM", "Trusted Platform Module", "하드웨어 보안", "신뢰 플랫폼",
-            "FIPS", "Federal Information Processing Standard", "암호 표준",
-            "CBPR", "Cross Border Privacy Rules", "국제 개인정보", "마이데이터",
-            "동형암호", "Homomorphic Encryption", "안티포렌식", "Anti-Forensic",
-            "전자봉투", "PbD", "Privacy by Design", "SIEM", "SOAR",
-            "Security Information & Event Management", "Security Orchestration",
-            "보안 정보", "이벤트 관리", "보안 오케스트레이션"
-        ],
-        "키워드": ["보안", "암호", "포렌식", "취약점", "악성코드", "백도어", "BPFdoor",
-                  "CC", "인증", "ECC", "타원곡선", "E2E", "제로트러스트", "개인정보", "안심구역",
-                  "NOMA", "접근제어", "Access Control", "LDAP", "인포스틸러", "Infostealer",
-                  "리스크", "CSP", "드론", "블록 암호", "디지털 포렌식", "클라우드 보안", "위협",
-                  "보안 문제", "보안 요소", "크리덴셜", "Credential", "Stuffing", "Zero Trust",
-                  "ISMS", "확보조치", "ISA", "IEC", "62443", "산업 보안", "ICS", "큐싱", "Qshing",
-                  "TPM", "Trusted Platform", "하드웨어 보안", "신뢰", "FIPS", "Federal Information",
-                  "암호 표준", "CBPR", "Cross Border", "Privacy Rules", "마이데이터",
-                  "동형암호", "Homomorphic", "안티포렌식", "Anti-Forensic", "전자봉투",
-                  "PbD", "Privacy by Design", "SIEM", "SOAR", "Security Information",
-                  "Security Orchestration", "이벤트 관리", "오케스트레이션"]
-    },
-    "6. 최신기술, 법규 및 정책": {
-        "세부항목": [
-            "인공지능", "AI", "영상", "그래픽", "IoT", "모바일", "클라우드",
-            "스마트팩토리", "전자정부법", "개인정보보호법", "소프트웨어진흥법",
-            "데이터산업법", "MCP", "Transformer", "GNN", "MoE",
-            "초거대 AI", "TEXT2SQL", "범용 AI", "GPAI", "에이전틱", "Agentic",
-            "LLM", "Large Language Model", "거대 언어 모델", "생성형AI", "윤리", "화이트레이블", "마케팅", "프록시",
-            "디지털 플랫폼", "딥뷰", "DeepView", "반도체", "정보보호 제품", "신속 확인",
-            "6G", "이동통신", "메타버스", "디지털 역기능", "Machine Learning",
-            "머신러닝", "웹3.0", "최적화 알고리즘", "딥러닝", "Deep Learning",
-            "파운데이션 모델", "Foundation", "LangChain", "프레임워크",
-            "예지정비", "Predictive Maintenance", "설비 정비", "딥페이크", "Deepfake",
-            "슈퍼앱", "인공신경망", "PLM", "Pre-trained Language Model", "신뢰성",
-            "RAG", "Retrieval Augmented Generation", "검색 증강 생성", "SaaS",
-            "Software as a Service", "다크패턴", "Dark Pattern", "IT 거버넌스",
-            "IT Governance", "거버넌스", "Governance", "군집분석", "Clustering Analysis",
-            "Self Organization Map", "PR 곡선", "ROC 곡선", "Precision Recall",
-            "Receiver Operating Characteristic", "성능지표", "실루엣 계수", "Silhouette Coefficient",
-            "실루엣", "VAE", "Variational AutoEncoder", "오토인코더", "AGI", "ANI",
-            "Artificial General Intelligence", "Artificial Narrow Intelligence",
-            "범용 인공지능", "약한 인공지능", "프롬프트 엔지니어링", "Prompt Engineering", "프롬프트",
-            "혼동행렬", "Confusion Matrix"
-        ],
-        "키워드": ["AI", "인공지능", "GNN", "Transformer", "MoE", "초거대", "클라우드",
-                  "TEXT2SQL", "거버넌스", "검인증", "GPAI", "범용", "Agentic",
-                  "에이전틱", "LLM", "Large Language", "거대 언어", "MCP", "생성형", "윤리", "화이트레이블", "프록시",
-                  "디지털 플랫폼", "정부", "딥뷰", "DeepView", "반도체", "정보보호 제품", "법규", "정책",
-                  "6G", "이동통신", "메타버스", "디지털 역기능", "Machine Learning", "머신러닝",
-                  "웹3.0", "Optimization", "딥러닝", "Deep Learning", "파운데이션", "Foundation",
-                  "LangChain", "프레임워크", "예지정비", "Predictive Maintenance", "설비",
-                  "딥페이크", "Deepfake", "슈퍼앱", "신경망", "PLM", "Pre-trained", "신뢰성",
-                  "RAG", "Retrieval Augmented", "검색 증강", "SaaS", "Software as a Service",
-                  "다크패턴", "Dark Pattern", "IT 거버넌스", "Governance", "거버넌스",
-                  "군집분석", "Clustering Analysis", "Self Organization", "PR 곡선", "ROC",
-                  "Precision Recall", "Receiver Operating", "성능지표", "실루엣", "Silhouette",
-                  "VAE", "Variational", "AutoEncoder", "오토인코더", "AGI", "ANI",
-                  "General Intelligence", "Narrow Intelligence", "범용", "프롬프트", "Prompt Engineering",
-                  "혼동행렬", "Confusion Matrix"]
-    }
-}
-
-
-def is_keyword_match(keyword, text):
-    """키워드가 텍스트에 매칭되는지 확인 (짧은 키워드는 완전 일치만 허용)"""
-    keyword_lower = keyword.lower()
-    text_lower = text.lower()
+# 점수 규칙(categorize_question/SyllabusIndex.score)을 바꾸면 올려서 캐시를 무효화
+SCORING_VERSION = "1"
 
-    # 3글자 이하 영문 키워드는 단어 경계 검사
-    if len(keyword) <= 3 and keyword.isascii():
-        import re
-        # 단어 경계로 정확히 매칭 (대소문자 무시)
-        pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-        return bool(re.search(pattern, text_lower))
 
-    # 일반 포함 검사
-    return keyword_lower in text_lower
-
-
-def categorize_question(question_dict):
+def categorize_question(question_dict, index=None):
     """문제를 출제기준 카테고리에 매칭"""
-    question_keywords = question_dict["키워드"]
-    question_title = question_dict["제목"]
-
-    category_scores = {}
-
-    for category, details in SYLLABUS_STRUCTURE.items():
-        score = 0
-        matched_keywords = []
-
-        # 세부항목 매칭
-        for item in details["세부항목"]:
-            for q_keyword in question_keywords:
-                # 양방향 매칭 (짧은 키워드 처리)
-                if is_keyword_match(item, q_keyword) or is_keyword_match(q_keyword, item):
-                    score += 3
-                    matched_keywords.append(item)
-
-            # 제목에서도 세부항목 매칭
-            if is_keyword_match(item, question_title):
-                score += 3
-                matched_keywords.append(item)
-
-        # 카테고리 키워드 매칭
-        for cat_keyword in details["키워드"]:
-            for q_keyword in question_keywords:
-                # 양방향 매칭 (짧은 키워드 처리)
-                if is_keyword_match(cat_keyword, q_keyword) or is_keyword_match(q_keyword, cat_keyword):
-                    score += 3
-                    matched_keywords.append(cat_keyword)
-
-            # 제목에서도 키워드 매칭 (점수 향상)
-            if is_keyword_match(cat_keyword, question_title):
-                score += 3
-
-        if score > 0:
-            category_scores[category] = {
-                "score": score,
-                "matched_keywords": list(set(matched_keywords))
-            }
+    if index is None:
+        index = get_syllabus_index()
+    category_scores = index.score(question_dict)
 
     if category_scores:
         sorted_categories = sorted(category_scores.items(), key=lambda x: x[1]["score"], reverse=True)
@@ -272,9 +54,64 @@ def categorize_question(question_dict):
     return ["미분류"], []
 
 
-def analyze_exam(exam_num, verbose=True):
-    """특정 회차 분석"""
-    # 문제 데이터 로드
+def categorize_batch(questions, index=None):
+    """여러 문제를 희소 행렬 곱 한 번으로 일괄 분류 (NumPy/SciPy 필요)
+
+    문제×용어 incidence 행렬(키워드 매칭 횟수 + 제목 매칭 여부)과
+    용어×카테고리 가중치 행렬의 곱으로 전체 점수를 구하며,
+    결과는 문제별 categorize_question과 동일합니다.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    if index is None:
+        index = get_syllabus_index()
+
+    keyword_rows, keyword_cols = [], []
+    title_rows, title_cols = [], []
+    for row, question in enumerate(questions):
+        for q_keyword in question["키워드"]:
+            for term_id in index.matching_terms(q_keyword):
+                keyword_rows.append(row)
+                keyword_cols.append(term_id)
+        for term_id in index.scan(question["제목"]):
+            title_rows.append(row)
+            title_cols.append(term_id)
+
+    shape = (len(questions), len(index.terms))
+    keyword_hits = sparse.csr_matrix(
+        (np.ones(len(keyword_rows), dtype=np.int64), (keyword_rows, keyword_cols)), shape=shape)
+    title_hits = sparse.csr_matrix(
+        (np.ones(len(title_rows), dtype=np.int64), (title_rows, title_cols)), shape=shape)
+
+    term_ids, category_ids, counts = zip(*index.category_term_counts())
+    weights = sparse.csr_matrix(
+        (np.array(counts, dtype=np.int64), (term_ids, category_ids)),
+        shape=(len(index.terms), len(index.categories)))
+
+    scores = 3 * ((keyword_hits + title_hits) @ weights).toarray()
+    if profiling.enabled():
+        for category, hits in zip(index.categories, scores.sum(axis=0) // 3):
+            if hits:
+                profiling.count_matches(category, int(hits))
+    # argmax는 동점일 때 앞선 카테고리를 선택 (안정 정렬 기반 기존 로직과 동일)
+    best = scores.argmax(axis=1) if len(questions) else []
+
+    results = []
+    for row in range(len(questions)):
+        if scores[row, best[row]] < 2:
+            results.append((["미분류"], []))
+            continue
+        category = index.categories[best[row]]
+        keyword_terms = keyword_hits.indices[keyword_hits.indptr[row]:keyword_hits.indptr[row + 1]]
+        title_terms = title_hits.indices[title_hits.indptr[row]:title_hits.indptr[row + 1]]
+        results.append(([category], index.matched_terms(category, keyword_terms, title_terms)))
+
+    return results
+
+
+def load_exam_questions(exam_num):
+    """회차별 문제목록 로드 (없으면 None)"""
     questions_path = DATA_DIR / f"{exam_num}회_문제목록.json"
 
     if not questions_path.exists():
@@ -283,110 +120,163 @@ def analyze_exam(exam_num, verbose=True):
         return None
 
     with open(questions_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+        return json.load(f)["questions"]
 
-    questions = data["questions"]
 
-    # 분석 실행
-    if verbose:
-        print("="*100)
-        print(f"{exam_num}회 정보관리기술사 출제기준 매칭 분석")
-        print("="*100)
-        print()
+def find_exam_numbers():
+    """data/exam_results에 문제목록이 있는 모든 회차 (오름차순)"""
+    exam_numbers = [path.name.split("회_")[0] for path in DATA_DIR.glob("*회_문제목록.json")]
+    return sorted((n for n in exam_numbers if n.isdigit()), key=int)
 
-    category_count = {cat: 0 for cat in SYLLABUS_STRUCTURE.keys()}
-    category_count["미분류"] = 0
-    category_questions = {cat: [] for cat in SYLLABUS_STRUCTURE.keys()}
-    category_questions["미분류"] = []
 
-    all_results = {}
+def file_sha256(path):
+    """파일 내용의 SHA-256"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
 
-    for period, period_questions in questions.items():
-        if verbose:
-            print(f"\n{'='*100}")
-            print(f"{period} 분석 (총 {len(period_questions)}문제)")
-            print(f"{'='*100}\n")
-
-        period_results = []
-
-        for question in period_questions:
-            categories, matched_keywords = categorize_question(question)
-            period_results.append({
-                "번호": question["번호"],
-                "제목": question["제목"],
-                "categories": categories,
-                "matched_keywords": matched_keywords
-            })
-
-            for cat in categories:
-                if cat in category_count:
-                    category_count[cat] += 1
-                    category_questions[cat].append(f"{period} {question['번호']}. {question['제목']}")
-                else:
-                    category_count["미분류"] += 1
-                    category_questions["미분류"].append(f"{period} {question['번호']}. {question['제목']}")
-
-            if verbose:
-                print(f"{question['번호']}. {question['제목']}")
-                print(f"   매칭된 출제기준: {', '.join(categories)}")
-                if matched_keywords:
-                    print(f"   매칭 키워드: {', '.join(matched_keywords[:5])}")
-                print()
-
-        all_results[period] = period_results
 
-    # 통계 출력
-    total_questions = sum(category_count.values())
+@lru_cache(maxsize=None)
+def syllabus_fingerprint():
+    """출제기준 구조 + 점수 규칙 버전의 지문"""
+    payload = json.dumps([SCORING_VERSION, get_syllabus_structure()], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    if verbose:
-        print("\n" + "="*100)
-        print("주요항목별 출제 빈도 통계")
-        print("="*100)
-        print()
-        print(f"총 문제 수: {total_questions}개\n")
-        print(f"{'주요항목':<40} {'문제수':>10} {'비율':>10} {'출제율':>10}")
-        print("-"*100)
-
-        for category in SYLLABUS_STRUCTURE.keys():
-            count = category_count[category]
-            percentage = (count / total_questions * 100) if total_questions > 0 else 0
-            bar = "■" * int(percentage / 5)
-            print(f"{category:<40} {count:>10}개 {percentage:>9.1f}% {bar}")
-    else:
-        print(f"✓ {exam_num}회 분석 완료 (총 {total_questions}문제)")
-
-    # 분석 결과 저장 (2가지 형식)
-    # 1. 상세 분석 결과
-    detailed_output = {
-        "분석일자": datetime.now().strftime("%Y-%m-%d"),
-        "시험회차": f"{exam_num}회",
-        "분석결과": all_results,
-        "통계": {
-            "카테고리별_문제수": category_count,
-            "카테고리별_문제목록": category_questions,
-            "총_문제수": total_questions
-        }
-    }
 
-    detailed_path = DATA_DIR / f"{exam_num}회_출제기준_매칭결과_상세.json"
-    with open(detailed_path, "w", encoding="utf-8") as f:
-        json.dump(detailed_output, f, ensure_ascii=False, indent=2)
+def output_paths(exam_num):
+    """회차별 분석 결과 파일 경로 (상세, 리포트용)"""
+    return exam_store.legacy_paths(exam_num, DATA_DIR)[1:]
+
 
-    # 2. 리포트 생성용 형식
-    report_output = {
-        "exam_number": exam_num,
+def load_cached_report(exam_num):
+    """입력/출제기준/결과 파일이 모두 그대로면 저장소의 리포트용 결과를 반환 (아니면 None)"""
+    cache_path = CACHE_DIR / f"{exam_num}회.json"
+    questions_path = DATA_DIR / f"{exam_num}회_문제목록.json"
+    if not cache_path.exists() or not questions_path.exists():
+        return None
+
+    with open(cache_path, "r", encoding="utf-8") as f:
+        cache = json.load(f)
+
+    if cache.get("input_sha256") != file_sha256(questions_path):
+        return None
+    if cache.get("syllabus_fingerprint") != syllabus_fingerprint():
+        return None
+    for path in output_paths(exam_num):
+        if not path.exists() or cache.get("outputs", {}).get(path.name) != file_sha256(path):
+            return None
+
+    return exam_store.load_analysis(exam_store.get_store(), exam_num)
+
+
+def save_cache_entry(exam_num, output_hashes):
+    """분석 메타데이터(입력 해시, 출제기준 지문, 결과 해시, 분석일자) 저장"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache = {
+        "input_sha256": file_sha256(DATA_DIR / f"{exam_num}회_문제목록.json"),
+        "syllabus_fingerprint": syllabus_fingerprint(),
+        "outputs": output_hashes,
         "analysis_date": datetime.now().strftime("%Y-%m-%d"),
-        "questions": questions,
-        "statistics": {
-            "total_questions": total_questions,
-            "category_count": category_count,
-            "category_questions": category_questions
-        }
     }
+    exam_store.write_json(CACHE_DIR / f"{exam_num}회.json", cache)
+
 
-    report_path = DATA_DIR / f"{exam_num}회_분석결과.json"
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(report_output, f, ensure_ascii=False, indent=2)
+def analyze_exam(exam_num, verbose=True, questions=None, categorized=None, force=False, update_cube=True):
+    """특정 회차 분석
+
+    questions/categorized를 넘기면 파일 로드와 문제별 분류를 건너뜁니다.
+    (categorized: 교시 -> 문제 순서대로의 (categories, matched_keywords) 목록)
+    문제목록과 출제기준이 바뀌지 않았으면 캐시된 결과를 반환합니다 (force=True로 무시).
+    update_cube=True면 저장 후 집계 큐브에서 이 회차의 칸만 교체합니다.
+    """
+    # 변경 없으면 캐시 사용
+    if not force:
+        cached = load_cached_report(exam_num)
+        if cached is not None:
+            print(f"✓ {exam_num}회 변경 없음 - 캐시된 분석 결과 사용")
+            return cached
+
+    # 문제 데이터 로드
+    if questions is None:
+        with profiling.stage("load"):
+            questions = load_exam_questions(exam_num)
+        if questions is None:
+            return None
+
+    index = get_syllabus_index()
+
+    # 분류
+    if categorized is None:
+        with profiling.stage("categorize"):
+            categorized = {
+                period: [categorize_question(question, index) for question in period_questions]
+                for period, period_questions in questions.items()
+            }
+
+    # 집계
+    with profiling.stage("aggregate"):
+        category_count = {cat: 0 for cat in index.categories}
+        category_count["미분류"] = 0
+
+        for period_results in categorized.values():
+            for categories, _ in period_results:
+                for cat in categories:
+                    if cat in category_count:
+                        category_count[cat] += 1
+                    else:
+                        category_count["미분류"] += 1
+
+    # 분석 결과 출력
+    if verbose:
+        with profiling.stage("render"):
+            print("="*100)
+            print(f"{exam_num}회 정보관리기술사 출제기준 매칭 분석")
+            print("="*100)
+            print()
+
+            for period, period_questions in questions.items():
+                print(f"\n{'='*100}")
+                print(f"{period} 분석 (총 {len(period_questions)}문제)")
+                print(f"{'='*100}\n")
+
+                for question, (categories, matched_keywords) in zip(period_questions, categorized[period]):
+                    print(f"{question['번호']}. {question['제목']}")
+                    print(f"   매칭된 출제기준: {', '.join(categories)}")
+                    if matched_keywords:
+                        print(f"   매칭 키워드: {', '.join(matched_keywords[:5])}")
+                    print()
+
+    # 통계 출력
+    total_questions = sum(category_count.values())
+
+    with profiling.stage("render"):
+        if verbose:
+            print("\n" + "="*100)
+            print("주요항목별 출제 빈도 통계")
+            print("="*100)
+            print()
+            print(f"총 문제 수: {total_questions}개\n")
+            print(f"{'주요항목':<40} {'문제수':>10} {'비율':>10} {'출제율':>10}")
+            print("-"*100)
+
+            for category in index.categories:
+                count = category_count[category]
+                percentage = (count / total_questions * 100) if total_questions > 0 else 0
+                bar = "■" * int(percentage / 5)
+                print(f"{category:<40} {count:>10}개 {percentage:>9.1f}% {bar}")
+        else:
+            print(f"✓ {exam_num}회 분석 완료 (총 {total_questions}문제)")
+
+    # 분석 결과 저장: 통합 저장소에 한 번 저장한 뒤 기존 JSON 2종을 내보냄
+    # (분석일자는 캐시 메타데이터에 별도 기록)
+    with profiling.stage("write"):
+        store = exam_store.get_store()
+        previous_state = corpus.source_state()
+        exam_store.save_analysis(store, exam_num, questions, categorized, category_count)
+        save_cache_entry(exam_num, exam_store.export_analysis_json(store, exam_num, DATA_DIR))
+        if update_cube:
+            aggregate_cube.update_round(exam_num, questions, categorized, index.categories, previous_state)
+
+        detailed_path, report_path = output_paths(exam_num)
+        report_output = exam_store.load_analysis(store, exam_num)
 
     if verbose:
         print(f"\n\n✓ 분석 결과 저장:")
@@ -396,25 +286,127 @@ def analyze_exam(exam_num, verbose=True):
     return report_output
 
 
+def analyze_all(verbose=True, force=False):
+    """문제목록이 있는 모든 회차를 한 번의 행렬 곱으로 분류한 뒤 회차별 결과 저장
+
+    변경되지 않은 회차는 캐시된 결과를 사용하고, 나머지만 일괄 분류합니다.
+    """
+    exam_numbers = find_exam_numbers()
+    if not exam_numbers:
+        print(f"⚠️  문제목록을 찾을 수 없습니다: {DATA_DIR}")
+        return {}
+
+    reports = {}
+    if not force:
+        for exam_num in exam_numbers:
+            cached = load_cached_report(exam_num)
+            if cached is not None:
+                print(f"✓ {exam_num}회 변경 없음 - 캐시된 분석 결과 사용")
+                reports[exam_num] = cached
+
+    with profiling.stage("load"):
+        exams = {
+            exam_num: load_exam_questions(exam_num)
+            for exam_num in exam_numbers if exam_num not in reports
+        }
+    if not exams:
+        return reports
+
+    flat_questions = [
+        question
+        for questions in exams.values()
+        for period_questions in questions.values()
+        for question in period_questions
+    ]
+
+    start = time.perf_counter()
+    with profiling.stage("categorize"):
+        flat_results = iter(categorize_batch(flat_questions))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"✓ 전체 {len(exams)}개 회차 {len(flat_questions)}문제 일괄 분류 ({elapsed_ms:.1f}ms)")
+
+    for exam_num, questions in exams.items():
+        categorized = {
+            period: [next(flat_results) for _ in period_questions]
+            for period, period_questions in questions.items()
+        }
+        reports[exam_num] = analyze_exam(
+            exam_num, verbose=verbose, questions=questions, categorized=categorized, force=True)
+        if verbose:
+            print("\n")
+
+    return dict(sorted(reports.items(), key=lambda item: int(item[0])))
+
+
+def run_exam(exam_num, verbose=True, force=False):
+    """회차 하나를 분석하고 콘솔 출력을 문자열로 반환 (병렬 실행 시 출력 섞임 방지)"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        try:
+            # 여러 프로세스가 큐브를 동시에 고치지 않도록 갱신하지 않음 (다음 로드 때 다시 생성)
+            analyze_exam(exam_num, verbose=verbose, force=force, update_cube=False)
+        except Exception as e:
+            print(f"✗ {exam_num}회 분석 중 오류 발생: {e}")
+    return buffer.getvalue()
+
+
+def print_usage():
+    """사용법 출력"""
+    print("사용법: python analyze.py <회차번호> [회차번호...] [--quiet] [--jobs N] [--force]")
+    print("       python analyze.py --all [--quiet] [--force]")
+    print("예시:")
+    print("  python analyze.py 137")
+    print("  python analyze.py 136 137")
+    print("  python analyze.py 136 137 --quiet")
+    print("  python analyze.py 129 130 131 132 --jobs 4")
+    print("  python analyze.py --all --quiet")
+    print("  python analyze.py 137 --force")
+
+
 def main():
     """메인 함수"""
     if len(sys.argv) < 2:
-        print("사용법: python analyze.py <회차번호> [회차번호...] [--quiet]")
-        print("예시:")
-        print("  python analyze.py 137")
-        print("  python analyze.py 136 137")
-        print("  python analyze.py 136 137 --quiet")
+        print_usage()
         sys.exit(1)
 
     # 인자 파싱
     args = sys.argv[1:]
     verbose = "--quiet" not in args
-    exam_numbers = [arg for arg in args if arg != "--quiet"]
+    force = "--force" in args
+    jobs = 1
+    if "--jobs" in args:
+        jobs_index = args.index("--jobs")
+        value = args[jobs_index + 1] if jobs_index + 1 < len(args) else ""
+        if not value.isdigit() or int(value) < 1:
+            print(f"⚠️  --jobs에는 1 이상의 정수가 필요합니다: {value or '(없음)'}")
+            print_usage()
+            sys.exit(1)
+        jobs = int(value)
+        del args[jobs_index:jobs_index + 2]
+    exam_numbers = [arg for arg in args if arg not in ("--quiet", "--all", "--force")]
+
+    # 병렬 실행 전에 저장소/출제기준 인덱스를 미리 생성 (프로세스마다 다시 만들지 않도록)
+    exam_store.open_store().close()
+    get_syllabus_index()
+
+    if "--all" in args:
+        analyze_all(verbose=verbose, force=force)
+        return
+
+    # 각 회차 분석 (병렬 실행 시에도 회차 순서대로 출력)
+    if jobs > 1 and len(exam_numbers) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            outputs = executor.map(
+                run_exam, exam_numbers, [verbose] * len(exam_numbers), [force] * len(exam_numbers))
+            for output in outputs:
+                print(output, end="")
+                if verbose:
+                    print("\n")
+        return
 
-    # 각 회차 분석
     for exam_num in exam_numbers:
         try:
-            analyze_exam(exam_num, verbose=verbose)
+            analyze_exam(exam_num, verbose=verbose, force=force)
             if len(exam_numbers) > 1 and verbose:
                 print("\n")
         except Exception as e:
@@ -422,4 +414,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with profiling.session("analyze"):
+        main()
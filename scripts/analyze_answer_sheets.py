@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import List, Tuple
 import json
 
+import profiling
+
 def count_cells(text: str) -> int:
     """
     Count cells in a line following the rule:
@@ -192,10 +194,12 @@ def main():
         print("-" * 80)
 
         # Extract text (placeholder)
-        text = extract_text_from_pdf(str(pdf_path))
+        with profiling.stage("load"):
+            text = extract_text_from_pdf(str(pdf_path))
 
         # Analyze
-        results = analyze_answer_sheet(text, pdf_path.name)
+        with profiling.stage("parse"):
+            results = analyze_answer_sheet(text, pdf_path.name)
         all_results.append(results)
 
         # Print summary
@@ -237,10 +241,12 @@ def main():
 
     # Save results to JSON
     output_file = Path('data/answer_sheet_analysis.json')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_results, f, ensure_ascii=False, indent=2)
+    with profiling.stage("write"):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(all_results, f, ensure_ascii=False, indent=2)
 
     print(f"\n✅ Results saved to: {output_file}")
 
 if __name__ == '__main__':
-    main()
+    with profiling.session("analyze_answer_sheets"):
+        main()
@@ -1,12 +1,45 @@
 #!/usr/bin/env python3
 """
 129~137회 중복 문제 분석 스크립트
+
+- 완전 중복: 번호/따옴표를 제거한 제목이 같은 문제
+- 유사 표현 재출제: 문자 3-gram MinHash 서명을 LSH 밴드로 묶어 후보 쌍만 비교하고,
+  자카드 유사도가 기준 이상인 쌍을 묶음(cluster)으로 출력 (자카드가 낮은 쌍은 대부분 후보에서
+  빠지지만, 후보 수는 비슷한 쌍의 수에 비례하므로 여전히 문제 수의 제곱에 비례해 늘어남.
+  문제 수가 적으면 모든 쌍을 직접 비교)
+- 키워드 기반 유사 주제: 괄호 안 영문 약어/기술 용어 사전의 용어가 여러 회차에 나온 경우
 """
 
-import json
-import os
 from collections import defaultdict
+from itertools import combinations
+import random
 import re
+import zlib
+
+import corpus
+import profiling
+from term_dictionary import extract_terms
+
+# 유사 표현 재출제 판정 기준 (문자 3-gram 집합의 자카드 유사도)
+SHINGLE_SIZE = 3
+NEAR_DUPLICATE_THRESHOLD = 0.5
+
+# LSH 밴드 구성: 서명 길이 = 밴드 수 × 밴드당 행 수
+# 후보가 될 확률 1 - (1 - J^4)^48: 자카드 0.5 ≈ 95.5%, 0.3 ≈ 32%, 0.1 ≈ 0.5%
+# (bench_near_duplicates.py 기준 recall은 32×3과 거의 같고 후보 쌍은 1.5~3배 적음.
+#  20×5, 16×6은 후보가 더 적지만 기준 근처(0.5~0.55) 실제 쌍을 놓쳐 recall 80% 이하)
+LSH_BANDS = 48
+LSH_ROWS = 4
+
+# 전체 쌍이 이보다 적으면 MinHash 서명 없이 모든 쌍을 직접 비교 (실제 기출 규모에서는 더 빠름)
+BRUTE_FORCE_MAX_PAIRS = 50_000
+
+MERSENNE_PRIME = (1 << 61) - 1
+
+# 유사도 계산 전에 제거하는 문제 끝 표현 (예: "에 대하여 다음을 설명하시오.")
+QUESTION_ENDING = re.compile(
+    r'(에\s*대하여|에\s*대해서?|에\s*관하여|와\s*관련하여)?\s*(다음을\s*)?'
+    r'(설명|비교|논하|기술|제시|서술)(하시오|하고|하여).*$', re.DOTALL)
 
 def clean_question_title(title):
     """문제 제목에서 번호 등을 제거하고 핵심 키워드만 추출"""
@@ -24,68 +57,205 @@ def extract_keywords_from_title(title):
     acronyms = re.findall(r'\(([A-Z][A-Za-z0-9\s,/&]+)\)', title)
     keywords.update(acronyms)
 
-    # 한글 핵심 키워드 (3글자 이상)
-    korean_words = re.findall(r'[가-힣]{3,}', title)
-    keywords.update(korean_words)
+    # 기술 용어 사전의 용어 (붙여 쓴 복합어는 사전 용어 단위로 분리)
+    keywords.update(extract_terms(title))
 
     return keywords
 
-def main():
+def shingle_text(title):
+    """유사도 비교용 정규화 (번호/문제 끝 표현/공백/기호 제거, 소문자)"""
+    text = QUESTION_ENDING.sub('', clean_question_title(title.replace('"', '')).lower())
+    return re.sub(r'[\W_]+', '', text)
+
+def shingles(text, size=SHINGLE_SIZE):
+    """문자 n-gram 집합 (size보다 짧은 텍스트는 텍스트 자체)"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+def jaccard(a, b):
+    """두 집합의 자카드 유사도"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class MinHasher:
+    """(a·x + b) mod p 해시 함수 묶음으로 n-gram 집합의 MinHash 서명 생성
+
+    n-gram마다 해시 값 벡터를 한 번만 계산해 두고, 서명은 벡터들의 원소별 최솟값으로 구합니다.
+    """
+
+    def __init__(self, num_perm=LSH_BANDS * LSH_ROWS, seed=1):
+        rnd = random.Random(seed)
+        self.params = [(rnd.randrange(1, MERSENNE_PRIME), rnd.randrange(0, MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+        self.vectors = {}
+
+    def vector(self, shingle):
+        """n-gram 하나의 해시 값 벡터"""
+        vector = self.vectors.get(shingle)
+        if vector is None:
+            x = zlib.crc32(shingle.encode('utf-8'))
+            vector = self.vectors[shingle] = tuple((a * x + b) % MERSENNE_PRIME for a, b in self.params)
+        return vector
+
+    def signature(self, shingle_set):
+        """MinHash 서명 (빈 집합은 None)"""
+        if not shingle_set:
+            return None
+        return tuple(map(min, zip(*map(self.vector, shingle_set))))
+
+def lsh_candidate_pairs(signatures, bands=LSH_BANDS, rows=LSH_ROWS):
+    """밴드 중 하나라도 서명이 같은 (i, j) 후보 쌍 (i < j)"""
+    candidates = set()
+    for band in range(bands):
+        start = band * rows
+        buckets = defaultdict(list)
+        for i, signature in enumerate(signatures):
+            if signature is not None:
+                buckets[signature[start:start + rows]].append(i)
+        for members in buckets.values():
+            if len(members) > 1:
+                candidates.update(combinations(members, 2))
+    return candidates
+
+def find_near_duplicates(shingle_sets, threshold=NEAR_DUPLICATE_THRESHOLD, bands=LSH_BANDS, rows=LSH_ROWS,
+                         brute_force_max_pairs=BRUTE_FORCE_MAX_PAIRS):
+    """MinHash/LSH로 자카드 유사도가 threshold 이상인 쌍 찾기 -> ([(i, j, 유사도)], 후보 쌍 수)
+
+    전체 쌍이 brute_force_max_pairs 이하면 모든 쌍을 비교합니다 (후보 쌍 수 = 전체 쌍 수).
+    """
+    total_pairs = len(shingle_sets) * (len(shingle_sets) - 1) // 2
+    if total_pairs <= brute_force_max_pairs:
+        return brute_force_pairs(shingle_sets, threshold), total_pairs
+
+    hasher = MinHasher(bands * rows)
+    signatures = [hasher.signature(shingle_set) for shingle_set in shingle_sets]
+    candidates = lsh_candidate_pairs(signatures, bands, rows)
+
+    pairs = []
+    for i, j in sorted(candidates):
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= threshold:
+            pairs.append((i, j, similarity))
+    return pairs, len(candidates)
+
+def brute_force_pairs(shingle_sets, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """모든 쌍의 자카드 유사도를 직접 계산 (벤치마크 기준값)"""
+    pairs = []
+    for i, j in combinations(range(len(shingle_sets)), 2):
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= threshold:
+            pairs.append((i, j, similarity))
+    return pairs
+
+def cluster_pairs(pairs):
+    """유사 쌍을 연결 요소(union-find)로 묶기 -> [[i, ...], ...] (각 묶음은 오름차순)"""
+    parent = {}
+
+    def find(i):
+        parent.setdefault(i, i)
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j, _ in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters = defaultdict(list)
+    for i in sorted(parent):
+        clusters[find(i)].append(i)
+    return list(clusters.values())
+
+def main(exam_sessions=None):
     # 모든 회차의 문제 수집
     all_questions = []
     question_by_title = defaultdict(list)
     keyword_frequency = defaultdict(lambda: defaultdict(list))  # keyword -> {session: [questions]}
 
-    exam_sessions = range(129, 138)
+    if exam_sessions is None:
+        exam_sessions = range(129, 138)
 
-    for session in exam_sessions:
-        file_path = f'/Users/jyk/projects/sub-note/data/exam_results/{session}회_분석결과.json'
-        if not os.path.exists(file_path):
-            continue
+    with profiling.stage("load"):
+        questions = corpus.load_questions(exam_sessions)
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    for question in questions:
+        session = int(question.exam_number)
+        title = question.title.strip()
 
-        # 각 교시별 문제 처리
-        questions_data = data.get('questions', {})
-        for session_name, questions in questions_data.items():
-            for q in questions:
-                title = q.get('제목', '').strip()
-                number = q.get('번호', '')
-
-                if not title:
-                    continue
-
-                full_id = f"{session}회 {session_name} {number}"
-                cleaned_title = clean_question_title(title)
-
-                all_questions.append({
-                    'session': session,
-                    'session_name': session_name,
-                    'number': number,
-                    'full_id': full_id,
-                    'title': title,
-                    'cleaned_title': cleaned_title
-                })
-
-                # 완전 일치 중복 체크
-                question_by_title[cleaned_title].append(full_id)
-
-                # 키워드 기반 유사도 체크
-                keywords = extract_keywords_from_title(title)
-                for kw in keywords:
-                    keyword_frequency[kw][session].append({
-                        'full_id': full_id,
-                        'title': title
-                    })
+        if not title:
+            continue
 
+        full_id = question.full_id
+        cleaned_title = clean_question_title(title)
+
+        all_questions.append({
+            'session': session,
+            'session_name': question.period,
+            'number': question.number,
+            'full_id': full_id,
+            'title': title,
+            'cleaned_title': cleaned_title
+        })
+
+        # 완전 일치 중복 체크
+        question_by_title[cleaned_title].append(full_id)
+
+        # 키워드 기반 유사도 체크
+        with profiling.stage("extract keywords"):
+            keywords = extract_keywords_from_title(title)
+        for kw in keywords:
+            keyword_frequency[kw][session].append({
+                'full_id': full_id,
+                'title': title
+            })
+
+    with profiling.stage("aggregate"):
+        exact_duplicates = {title: ids for title, ids in question_by_title.items() if len(ids) > 1}
+
+        # 주요 키워드만 필터링 (3회 이상 출제된 것만)
+        frequent_keywords = {kw: sessions for kw, sessions in keyword_frequency.items()
+                            if len(sessions) >= 2 and len(kw) >= 3}
+
+        # 출제 횟수 많은 순으로 정렬
+        sorted_keywords = sorted(frequent_keywords.items(),
+                                key=lambda x: sum(len(qs) for qs in x[1].values()),
+                                reverse=True)
+
+    with profiling.stage("near duplicates"):
+        near_duplicates = find_near_duplicate_clusters(all_questions)
+
+    with profiling.stage("render"):
+        print_report(all_questions, exact_duplicates, near_duplicates, frequent_keywords, sorted_keywords)
+
+def find_near_duplicate_clusters(all_questions, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """다른 회차에 표현만 바꿔 다시 나온 문제 묶음 -> [(문제 목록, 최대 유사도)] (큰 묶음 먼저)"""
+    shingle_sets = [shingles(shingle_text(q['title'])) for q in all_questions]
+    pairs, _ = find_near_duplicates(shingle_sets, threshold)
+    # 같은 회차 안의 비슷한 문제는 재출제가 아니므로 제외
+    pairs = [(i, j, sim) for i, j, sim in pairs
+             if all_questions[i]['session'] != all_questions[j]['session']]
+
+    best = defaultdict(float)
+    for i, j, similarity in pairs:
+        best[i] = max(best[i], similarity)
+        best[j] = max(best[j], similarity)
+
+    clusters = [([all_questions[i] for i in members], max(best[i] for i in members))
+                for members in cluster_pairs(pairs)]
+    return sorted(clusters, key=lambda c: (-len(c[0]), -c[1]))
+
+def print_report(all_questions, exact_duplicates, near_duplicates, frequent_keywords, sorted_keywords):
+    """중복 분석 결과 출력"""
     print('=' * 100)
     print(f'📊 129~137회 정보관리기술사 중복 문제 분석')
     print('=' * 100)
     print(f'\n총 분석 문제 수: {len(all_questions)}개 (9개 회차 × 31문제 = 279개)\n')
 
     # 1. 완전 중복 문제
-    exact_duplicates = {title: ids for title, ids in question_by_title.items() if len(ids) > 1}
     print(f'\n🔁 1. 완전 중복 문제 (제목이 동일한 경우): {len(exact_duplicates)}개')
     print('-' * 100)
 
@@ -97,18 +267,23 @@ def main():
     else:
         print('✅ 완전히 동일한 제목의 문제는 없습니다.')
 
-    # 2. 키워드 기반 유사 문제 (2회 이상 출제)
-    print(f'\n\n🔍 2. 키워드 기반 유사 주제 분석 (2회 이상 출제된 주제)')
+    # 2. 표현만 바뀐 유사 문제 (MinHash/LSH)
+    print(f'\n\n🔂 2. 유사 표현 재출제 (문자 {SHINGLE_SIZE}-gram 자카드 유사도 ≥ {NEAR_DUPLICATE_THRESHOLD}): '
+          f'{len(near_duplicates)}개 묶음')
     print('-' * 100)
 
-    # 주요 키워드만 필터링 (3회 이상 출제된 것만)
-    frequent_keywords = {kw: sessions for kw, sessions in keyword_frequency.items()
-                        if len(sessions) >= 2 and len(kw) >= 3}
+    if near_duplicates:
+        for questions, similarity in near_duplicates:
+            print(f'\n• {len(questions)}문제, 최대 유사도 {similarity:.2f}')
+            for q in questions:
+                title_short = q['title'][:70] + '...' if len(q['title']) > 70 else q['title']
+                print(f'  - {q["full_id"]}: {title_short}')
+    else:
+        print('✅ 표현만 바꿔 다시 출제된 문제는 없습니다.')
 
-    # 출제 횟수 많은 순으로 정렬
-    sorted_keywords = sorted(frequent_keywords.items(),
-                            key=lambda x: sum(len(qs) for qs in x[1].values()),
-                            reverse=True)
+    # 3. 키워드 기반 유사 문제 (2회 이상 출제)
+    print(f'\n\n🔍 3. 키워드 기반 유사 주제 분석 (2회 이상 출제된 주제)')
+    print('-' * 100)
 
     print(f'\n총 {len(sorted_keywords)}개의 키워드가 2회 이상 출제됨\n')
 
@@ -128,10 +303,12 @@ def main():
 
     # 3. 통계 요약
     print('\n\n' + '=' * 100)
-    print('📈 3. 중복 출제 패턴 요약')
+    print('📈 4. 중복 출제 패턴 요약')
     print('=' * 100)
 
     print(f'\n• 완전 중복 문제: {len(exact_duplicates)}개')
+    print(f'• 유사 표현 재출제: {len(near_duplicates)}개 묶음 '
+          f'({sum(len(questions) for questions, _ in near_duplicates)}문제)')
     print(f'• 2회 이상 출제된 키워드: {len(frequent_keywords)}개')
     print(f'• 고유 주제 (1회만 출제): 약 {len(all_questions) - len(exact_duplicates)}개')
 
@@ -147,7 +324,7 @@ def main():
 
     # 4. 결론 및 학습 전략
     print('\n\n' + '=' * 100)
-    print('💡 4. 결론 및 학습 전략 제언')
+    print('💡 5. 결론 및 학습 전략 제언')
     print('=' * 100)
 
     repetition_rate = (len(exact_duplicates) / len(all_questions)) * 100
@@ -168,4 +345,5 @@ def main():
     print('   → 키워드별 다양한 관점(개념, 구성요소, 보안, 활용 등)을 준비해야 함')
 
 if __name__ == '__main__':
-    main()
+    with profiling.session("analyze_duplicates"):
+        main()
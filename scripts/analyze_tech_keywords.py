@@ -3,11 +3,15 @@
 129~137회 기술 키워드 중복 분석 (일반 용어 제외)
 """
 
-import json
-import os
 from collections import defaultdict
+from functools import lru_cache
 import re
 
+import corpus
+import profiling
+from keyword_classifier import classify_keywords, get_classifier, group_by_label
+from term_dictionary import extract_terms
+
 # 제외할 일반 용어
 EXCLUDE_TERMS = {
     '설명하시오', '대하여', '다음을', '관련하여', '설명하고', '개념과', '필요성',
@@ -16,6 +20,20 @@ EXCLUDE_TERMS = {
     '정의와', '구성요소', '최근', '활용', '분석', '개념을', '원리를', '절차를'
 }
 
+# 기술 용어 사전에는 있지만 혼자서는 학습 키워드가 되기 어려운 분야 이름 (사전 보완 시에만 제외)
+BROAD_TERMS = {
+    '데이터', '소프트웨어', '인공지능', '정보시스템', '테스트', '클라우드', '네트워크',
+    '프로젝트', '정보통신', '메모리', '프로토콜', '알고리즘', '프레임워크', '요구사항', '신뢰성'
+}
+
+# 요약에 출력할 주제 (keyword_classifier.THEME_TERMS의 분류 -> 표시 이름)
+THEME_TITLES = {
+    'AI/ML': 'AI/ML 관련',
+    '정보보안': '정보보안 관련',
+    '데이터': '데이터 관련',
+    '소프트웨어': '소프트웨어 관련',
+}
+
 def is_tech_keyword(keyword):
     """기술 키워드인지 판단 (일반 용어 제외)"""
     if keyword in EXCLUDE_TERMS:
@@ -27,95 +45,143 @@ def is_tech_keyword(keyword):
         return False
     return True
 
+# 제목을 한 번 훑으며 괄호 안 영문 약어, AI 복합어, 한글 어절을 찾는 패턴
+TITLE_TOKEN_PATTERN = re.compile(r'''
+      \( (?=(?P<acronym>[A-Z][A-Za-z0-9\s,/&\-:\.]+)\) )   # 영문 약어 (괄호 안, 대문자 시작)
+    | (?=(?P<ai_term>AI[가-힣]+)) AI                        # AI + 한글
+    | (?P<word>[가-힣]+)                                     # 한글 어절
+      (?=(?P<ai_suffix>AI))?                                 # 한글 + AI
+      (?=\s+(?P<next_word>[가-힣]+))?                        # 띄어쓰기 복합 용어의 다음 어절
+''', re.VERBOSE)
+
+# 한 어절 안에서만 나오는 한글 기술 용어 (어절 처음에서 한 번에 확인)
+WORD_TERM_PATTERN = re.compile(r'''
+    (?=(?P<system>[가-힣]+(?:프로토콜|알고리즘|시스템|모델|기법|방법론|아키텍처|플랫폼|프레임워크|엔진|도구)))?
+    (?=(?P<security>[가-힣]+(?:암호|보안|인증|검증)))?
+    (?=(?P<infra>[가-힣]+(?:데이터베이스|스토리지|메모리|네트워크|서버)))?
+    (?=(?P<testing>[가-힣]+(?:테스트|감리|평가)))?
+    (?=(?P<zero>제로[가-힣]+|[가-힣]+제로))?
+    (?=(?P<process>[가-힣]{4,}(?:분석|최적화|관리)))?
+''', re.VERBOSE)
+LEARNING_PATTERN = re.compile(r'(?:딥|머신)러닝')
+
+# 복합 기술 용어 (띄어쓰기 포함): "정보 보호", "클라우드 컴퓨팅" 등
+COMPOUND_PREFIXES = ('정보', '데이터', '소프트웨어', '인공지능', '머신러닝')
+COMPOUND_SUFFIXES = ('컴퓨팅', '네트워킹', '마이닝', '엔지니어링')
+
+@lru_cache(maxsize=None)
+def word_tech_keywords(word):
+    """한글 어절 안의 기술 용어 (일반 용어 제외, 어절별로 캐시)"""
+    keywords = {kw for kw in WORD_TERM_PATTERN.match(word).groups() if kw}
+    keywords.update(LEARNING_PATTERN.findall(word))
+    return frozenset(kw for kw in keywords if is_tech_keyword(kw))
+
 def extract_tech_keywords(title):
     """제목에서 기술 키워드만 추출"""
-    keywords = set()
-
-    # 1. 영문 약어 (괄호 안, 대문자 시작)
-    acronyms = re.findall(r'\(([A-Z][A-Za-z0-9\s,/&\-:\.]+)\)', title)
-    for acronym in acronyms:
-        # 쉼표로 구분된 경우 분리
-        parts = [p.strip() for p in acronym.split(',')]
-        keywords.update(parts)
-
-    # 2. 한글 기술 용어 (특정 패턴)
-    # 프로토콜, 알고리즘, 시스템, 모델, 기법 등
-    tech_patterns = [
-        r'[가-힣]+(?:프로토콜|알고리즘|시스템|모델|기법|방법론|아키텍처|플랫폼|프레임워크|엔진|도구)',
-        r'(?:딥|머신)러닝',
-        r'[가-힣]+(?:암호|보안|인증|검증)',
-        r'[가-힣]+(?:데이터베이스|스토리지|메모리|네트워크|서버)',
-        r'[가-힣]+AI|AI[가-힣]+',
-        r'[가-힣]+(?:테스트|감리|평가)',
-        r'제로[가-힣]+|[가-힣]+제로',
-        r'[가-힣]{4,}(?:분석|최적화|관리)',
-    ]
-
-    for pattern in tech_patterns:
-        matches = re.findall(pattern, title)
-        keywords.update(matches)
-
-    # 3. 복합 기술 용어 (띄어쓰기 포함)
-    compound_patterns = [
-        r'(?:정보|데이터|소프트웨어|인공지능|머신러닝)\s+[가-힣]+',
-        r'[가-힣]+\s+(?:컴퓨팅|네트워킹|마이닝|엔지니어링)',
-    ]
-
-    for pattern in compound_patterns:
-        matches = re.findall(pattern, title)
-        keywords.update(matches)
+    keywords = set()     # 어절 안 용어 (이미 필터링됨)
+    candidates = set()   # 나머지 용어 (마지막에 필터링)
+    # 패턴별로 제목을 따로 훑을 때처럼 이미 찾은 용어와 겹치는 위치는 건너뜀
+    ai_end = prefix_end = suffix_end = 0
 
-    # 필터링
-    filtered = {kw for kw in keywords if is_tech_keyword(kw)}
-
-    return filtered
-
-def main():
-    # 모든 회차의 문제 수집
-    keyword_frequency = defaultdict(lambda: defaultdict(list))
-    exam_sessions = range(129, 138)
+    for match in TITLE_TOKEN_PATTERN.finditer(title):
+        acronym, ai_term, word, ai_suffix, next_word = match.groups()
 
-    for session in exam_sessions:
-        file_path = f'/Users/jyk/projects/sub-note/data/exam_results/{session}회_분석결과.json'
-        if not os.path.exists(file_path):
+        # 1. 영문 약어 (쉼표로 구분된 경우 분리)
+        if acronym is not None:
+            candidates.update(part.strip() for part in acronym.split(','))
             continue
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        questions_data = data.get('questions', {})
-        for session_name, questions in questions_data.items():
-            for q in questions:
-                title = q.get('제목', '').strip()
-                number = q.get('번호', '')
-
-                if not title:
-                    continue
-
-                full_id = f"{session}회 {session_name} {number}"
+        if ai_term is not None:
+            if match.start() >= ai_end:
+                ai_end = match.end('ai_term')
+                candidates.add(ai_term)
+            continue
 
-                # 기술 키워드 추출
-                keywords = extract_tech_keywords(title)
+        # 2. 한글 기술 용어 (프로토콜, 알고리즘, 시스템, 모델, 기법 등)
+        keywords |= word_tech_keywords(word)
+        start, end = match.span()  # 뒤쪽 확인은 폭이 없으므로 어절 범위와 같음
+        if ai_suffix and start >= ai_end:
+            ai_end = end + len(ai_suffix)
+            candidates.add(word + ai_suffix)
 
-                for kw in keywords:
-                    keyword_frequency[kw][session].append({
-                        'full_id': full_id,
-                        'title': title
-                    })
+        # 3. 복합 기술 용어 (띄어쓰기 포함)
+        if next_word is None:
+            continue
+        if word.endswith(COMPOUND_PREFIXES):
+            prefix = next(p for p in COMPOUND_PREFIXES if word.endswith(p))
+            if end - len(prefix) >= prefix_end:
+                prefix_end = match.end('next_word')
+                candidates.add(title[end - len(prefix):prefix_end])
+        # 앞 용어가 이 어절 중간에서 끝났으면 그 뒤부터
+        if next_word.startswith(COMPOUND_SUFFIXES) and max(start, suffix_end) < end:
+            suffix = next(s for s in COMPOUND_SUFFIXES if next_word.startswith(s))
+            compound_start = max(start, suffix_end)
+            suffix_end = match.start('next_word') + len(suffix)
+            candidates.add(title[compound_start:suffix_end])
 
+    # 필터링
+    keywords.update(kw for kw in candidates if is_tech_keyword(kw))
+    return keywords
+
+def extract_tech_keywords_batch(titles):
+    """제목 목록 -> 제목별 기술 키워드 집합 목록 (같은 제목은 한 번만 추출)"""
+    extracted = {}
+    results = []
+    for title in titles:
+        keywords = extracted.get(title)
+        if keywords is None:
+            keywords = extracted[title] = extract_tech_keywords(title)
+        results.append(set(keywords))
+    return results
+
+def main(exam_sessions=None):
+    # 모든 회차의 문제 수집
+    keyword_frequency = defaultdict(lambda: defaultdict(list))
+    if exam_sessions is None:
+        exam_sessions = range(129, 138)
+
+    with profiling.stage("load"):
+        questions = corpus.load_questions(exam_sessions)
+
+    questions = [(question, question.title.strip()) for question in questions]
+    questions = [(question, title) for question, title in questions if title]
+
+    # 기술 키워드 추출 (정규식이 놓치는 복합어는 기술 용어 사전으로 보완)
+    with profiling.stage("extract keywords"):
+        keywords_list = extract_tech_keywords_batch([title for _, title in questions])
+        for (_, title), keywords in zip(questions, keywords_list):
+            keywords.update(term for term in extract_terms(title)
+                            if term not in BROAD_TERMS and is_tech_keyword(term))
+
+    for (question, title), keywords in zip(questions, keywords_list):
+        session = int(question.exam_number)
+        full_id = question.full_id
+
+        for kw in keywords:
+            keyword_frequency[kw][session].append({
+                'full_id': full_id,
+                'title': title
+            })
+
+    with profiling.stage("aggregate"):
+        # 2회 이상 출제된 기술 키워드만 필터링
+        frequent_keywords = {kw: sessions for kw, sessions in keyword_frequency.items()
+                            if len(sessions) >= 2}
+
+        # 출제 횟수 많은 순으로 정렬
+        sorted_keywords = sorted(frequent_keywords.items(),
+                                key=lambda x: sum(len(qs) for qs in x[1].values()),
+                                reverse=True)
+
+    with profiling.stage("render"):
+        print_report(sorted_keywords)
+
+def print_report(sorted_keywords):
+    """기술 키워드 분석 결과 출력"""
     print('=' * 100)
     print(f'📊 129~137회 기술 키워드 중복 분석')
     print('=' * 100)
 
-    # 2회 이상 출제된 기술 키워드만 필터링
-    frequent_keywords = {kw: sessions for kw, sessions in keyword_frequency.items()
-                        if len(sessions) >= 2}
-
-    # 출제 횟수 많은 순으로 정렬
-    sorted_keywords = sorted(frequent_keywords.items(),
-                            key=lambda x: sum(len(qs) for qs in x[1].values()),
-                            reverse=True)
-
     print(f'\n총 {len(sorted_keywords)}개의 기술 키워드가 2회 이상 출제됨\n')
     print('=' * 100)
 
@@ -155,24 +221,18 @@ def main():
     print('📈 학습 우선순위 제언')
     print('=' * 100)
 
-    # 카테고리별 분류
-    ai_keywords = [kw for kw, _ in sorted_keywords if any(term in kw.lower() for term in ['ai', 'llm', 'model', 'learning', '머신', '딥', '인공지능', 'transformer', 'neural'])]
-    security_keywords = [kw for kw, _ in sorted_keywords if any(term in kw.lower() for term in ['보안', '암호', '인증', 'security', 'zero', 'trust', '공격'])]
-    data_keywords = [kw for kw, _ in sorted_keywords if any(term in kw.lower() for term in ['데이터', 'data', '데이터베이스', 'database'])]
-    sw_keywords = [kw for kw, _ in sorted_keywords if any(term in kw.lower() for term in ['소프트웨어', 'software', 'dev', '테스트', '감리', '개발'])]
+    # 카테고리별 분류 (키워드마다 한 번 훑어 해당 분류를 모두 구함)
+    groups = group_by_label(classify_keywords(kw for kw, _ in sorted_keywords))
 
     print(f'\n🎯 카테고리별 반복 출제 키워드:')
-    print(f'\n• AI/ML 관련: {len(ai_keywords)}개')
-    print(f'  예시: {", ".join(ai_keywords[:5])}...')
-
-    print(f'\n• 정보보안 관련: {len(security_keywords)}개')
-    print(f'  예시: {", ".join(security_keywords[:5])}...')
-
-    print(f'\n• 데이터 관련: {len(data_keywords)}개')
-    print(f'  예시: {", ".join(data_keywords[:5])}...')
+    for label, title in THEME_TITLES.items():
+        print(f'\n• {title}: {len(groups[label])}개')
+        print(f'  예시: {", ".join(groups[label][:5])}...')
 
-    print(f'\n• 소프트웨어 관련: {len(sw_keywords)}개')
-    print(f'  예시: {", ".join(sw_keywords[:5])}...')
+    print(f'\n🎯 출제기준 영역별 반복 출제 키워드:')
+    for category in get_classifier().categories:
+        print(f'\n• {category}: {len(groups[category])}개')
+        print(f'  예시: {", ".join(groups[category][:5])}...')
 
     print('\n\n💡 결론:')
     print('-' * 100)
@@ -182,4 +242,5 @@ def main():
     print(f'✅ {len(sorted_keywords)}개 키워드가 2회 이상 출제 → 이 키워드들을 중심으로 학습 계획 수립')
 
 if __name__ == '__main__':
-    main()
+    with profiling.session("analyze_tech_keywords"):
+        main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+categorize_question 마이크로 벤치마크
+
+129~137회 문제목록을 대상으로 문제 1개당 분류 시간을 비교합니다.
+- before: 호출마다 소문자 변환/정규식 생성을 반복하던 기존 중첩 루프 방식
+- after: 프로세스당 한 번 생성되는 SyllabusIndex 기반 방식
+
+사용법:
+    python bench_categorize.py              # 기본 5회 반복
+    python bench_categorize.py --repeat 20  # 반복 횟수 지정
+"""
+
+import json
+import re
+import sys
+import time
+
+from analyze import DATA_DIR, categorize_question
+from syllabus_compiler import SyllabusIndex, get_syllabus_structure
+
+EXAM_NUMBERS = range(129, 138)
+
+
+def legacy_is_keyword_match(keyword, text):
+    """기존 is_keyword_match (호출마다 패턴 생성)"""
+    keyword_lower = keyword.lower()
+    text_lower = text.lower()
+
+    if len(keyword) <= 3 and keyword.isascii():
+        pattern = r'\b' + re.escape(keyword_lower) + r'\b'
+        return bool(re.search(pattern, text_lower))
+
+    return keyword_lower in text_lower
+
+
+def legacy_categorize_question(question_dict):
+    """기존 categorize_question (카테고리 × 용어 × 키워드 중첩 루프)"""
+    question_keywords = question_dict["키워드"]
+    question_title = question_dict["제목"]
+
+    category_scores = {}
+
+    for category, details in get_syllabus_structure().items():
+        score = 0
+        matched_keywords = []
+
+        for item in details["세부항목"]:
+            for q_keyword in question_keywords:
+                if legacy_is_keyword_match(item, q_keyword) or legacy_is_keyword_match(q_keyword, item):
+                    score += 3
+                    matched_keywords.append(item)
+            if legacy_is_keyword_match(item, question_title):
+                score += 3
+                matched_keywords.append(item)
+
+        for cat_keyword in details["키워드"]:
+            for q_keyword in question_keywords:
+                if legacy_is_keyword_match(cat_keyword, q_keyword) or legacy_is_keyword_match(q_keyword, cat_keyword):
+                    score += 3
+                    matched_keywords.append(cat_keyword)
+            if legacy_is_keyword_match(cat_keyword, question_title):
+                score += 3
+
+        if score > 0:
+            category_scores[category] = {
+                "score": score,
+                "matched_keywords": list(set(matched_keywords))
+            }
+
+    if category_scores:
+        sorted_categories = sorted(category_scores.items(), key=lambda x: x[1]["score"], reverse=True)
+        best_match = sorted_categories[0]
+
+        if best_match[1]["score"] >= 2:
+            return [best_match[0]], best_match[1]["matched_keywords"]
+
+    return ["미분류"], []
+
+
+def load_questions():
+    """129~137회 문제목록을 회차별로 로드"""
+    rounds = {}
+    for exam_num in EXAM_NUMBERS:
+        path = DATA_DIR / f"{exam_num}회_문제목록.json"
+        if not path.exists():
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        rounds[exam_num] = [q for qs in data["questions"].values() for q in qs]
+    return rounds
+
+
+def time_per_question(func, questions, repeat):
+    """문제 1개당 평균 소요 시간 (마이크로초, 반복 중 최솟값)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for question in questions:
+            func(question)
+        best = min(best, time.perf_counter() - start)
+    return best / len(questions) * 1e6
+
+
+def main():
+    """메인 함수"""
+    repeat = 5
+    if "--repeat" in sys.argv:
+        repeat = int(sys.argv[sys.argv.index("--repeat") + 1])
+
+    rounds = load_questions()
+    if not rounds:
+        print(f"⚠️  문제목록을 찾을 수 없습니다: {DATA_DIR}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    index = SyllabusIndex(get_syllabus_structure())
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # 결과 동일성 확인
+    for questions in rounds.values():
+        for question in questions:
+            before = legacy_categorize_question(question)
+            after = categorize_question(question, index)
+            assert before[0] == after[0] and set(before[1]) == set(after[1]), question["제목"]
+
+    print(f"SyllabusIndex 생성: {build_ms:.1f}ms (용어 {len(index.terms)}개)")
+    print()
+    print(f"{'회차':<8} {'문제수':>6} {'before(μs)':>12} {'after(μs)':>12} {'배속':>8}")
+    print("-" * 50)
+
+    all_questions = []
+    for exam_num, questions in rounds.items():
+        all_questions.extend(questions)
+        before = time_per_question(legacy_categorize_question, questions, repeat)
+        after = time_per_question(lambda q: categorize_question(q, index), questions, repeat)
+        print(f"{exam_num}회{'':<4} {len(questions):>6} {before:>12.1f} {after:>12.1f} {before / after:>7.1f}x")
+
+    before = time_per_question(legacy_categorize_question, all_questions, repeat)
+    after = time_per_question(lambda q: categorize_question(q, index), all_questions, repeat)
+    print("-" * 50)
+    print(f"{'전체':<6} {len(all_questions):>6} {before:>12.1f} {after:>12.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+유사 표현 재출제(MinHash/LSH) 탐지 recall/속도 벤치마크
+
+analyze_duplicates.find_near_duplicates(LSH 후보 쌍만 비교)를 모든 쌍을 비교하는
+brute_force_pairs와 비교합니다 (작은 입력에서도 LSH 경로를 측정하도록 직접 비교 전환은 끔). 기준값(brute force)이 찾은 쌍 중 LSH가 찾은 비율이 recall이며,
+LSH 결과는 후보 쌍을 실제 자카드 유사도로 다시 확인하므로 precision은 항상 1입니다.
+
+데이터:
+- 실제 129~137회 279문제
+- 합성 확장: 실제 문제 제목을 무작위로 골라 끝 표현 교체/용어 삽입/글자 삭제로 바꿔 쓴 문제
+
+사용법:
+    python bench_near_duplicates.py                        # 실제 + 합성 1천/5천/2만 문제
+    python bench_near_duplicates.py --sizes 1000,100000    # 합성 규모 지정
+    python bench_near_duplicates.py --brute-limit 10000    # brute force를 수행할 최대 문제 수 (기본 5000)
+    python bench_near_duplicates.py --threshold 0.6        # 자카드 기준 (기본 0.5)
+"""
+
+import random
+import sys
+import time
+
+import exam_store
+from analyze_duplicates import (NEAR_DUPLICATE_THRESHOLD, brute_force_pairs, find_near_duplicates,
+                                shingle_text, shingles)
+from bench_pipeline import KOREAN_TERMS
+
+EXAM_NUMBERS = range(129, 138)
+DEFAULT_SIZES = [1_000, 5_000, 20_000]
+BRUTE_LIMIT = 5_000
+
+ENDINGS = ["을 설명하시오.", "에 대하여 설명하시오.", "에 대하여 다음을 설명하시오.",
+           "의 개념과 구성요소를 설명하시오.", "를 비교하시오.", ""]
+
+
+def load_titles():
+    """129~137회 문제 제목"""
+    rows = exam_store.iter_questions(exam_store.get_store(), EXAM_NUMBERS)
+    return [title.strip() for _, _, _, title, _, _, _ in rows if title.strip()]
+
+
+def reword(rnd, title):
+    """제목을 조금 바꿔 쓴 문제 (끝 표현 교체, 용어 삽입, 글자 삭제 중 1~2개)"""
+    text = shingle_text(title)
+    for _ in range(rnd.randint(1, 2)):
+        edit = rnd.randrange(3)
+        if edit == 0:
+            text = text + rnd.choice(ENDINGS)
+        elif edit == 1:
+            pos = rnd.randint(0, len(text))
+            text = text[:pos] + rnd.choice(KOREAN_TERMS) + text[pos:]
+        elif len(text) > 6:
+            pos = rnd.randrange(len(text) - 3)
+            text = text[:pos] + text[pos + rnd.randint(1, 3):]
+    return text
+
+
+def synthetic_titles(titles, size, seed=0):
+    """실제 제목을 바꿔 쓴 합성 문제 size개"""
+    rnd = random.Random(seed)
+    return [reword(rnd, rnd.choice(titles)) for _ in range(size)]
+
+
+def run(name, titles, threshold, brute_limit):
+    """한 데이터에 대해 brute force / LSH 비교 후 결과 한 줄 출력"""
+    start = time.perf_counter()
+    shingle_sets = [shingles(shingle_text(title)) for title in titles]
+    shingle_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairs, candidates = find_near_duplicates(shingle_sets, threshold, brute_force_max_pairs=0)
+    lsh_seconds = time.perf_counter() - start + shingle_seconds
+
+    brute = "-"
+    recall = "-"
+    speedup = "-"
+    if len(titles) <= brute_limit:
+        start = time.perf_counter()
+        expected = brute_force_pairs(shingle_sets, threshold)
+        brute_seconds = time.perf_counter() - start + shingle_seconds
+
+        found = {(i, j) for i, j, _ in pairs}
+        hits = sum(1 for i, j, _ in expected if (i, j) in found)
+        brute = f"{brute_seconds:.3f}s"
+        recall = f"{hits / len(expected) * 100:.1f}%" if expected else "100.0%"
+        speedup = f"{brute_seconds / lsh_seconds:.1f}x"
+
+    total_pairs = len(titles) * (len(titles) - 1) // 2
+    print(f"{name:<12} {len(titles):>8,} {brute:>10} {lsh_seconds:>9.3f}s {speedup:>8} "
+          f"{candidates / total_pairs * 100 if total_pairs else 0:>9.3f}% {len(pairs):>8,} {recall:>8}")
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    sizes = DEFAULT_SIZES
+    if "--sizes" in args:
+        sizes = [int(s) for s in args[args.index("--sizes") + 1].split(",")]
+    brute_limit = int(args[args.index("--brute-limit") + 1]) if "--brute-limit" in args else BRUTE_LIMIT
+    threshold = float(args[args.index("--threshold") + 1]) if "--threshold" in args else NEAR_DUPLICATE_THRESHOLD
+
+    titles = load_titles()
+    if not titles:
+        print("⚠️  문제를 찾을 수 없습니다 (parse_exam_txt.py / analyze.py를 먼저 실행하세요)")
+        sys.exit(1)
+
+    print(f"자카드 기준 {threshold}, brute force는 {brute_limit:,}문제 이하만 수행")
+    print()
+    print(f"{'데이터':<10} {'문제수':>8} {'brute':>10} {'LSH':>10} {'배속':>8} {'후보 비율':>9} "
+          f"{'유사 쌍':>7} {'recall':>8}")
+    print("-" * 84)
+
+    run("실제", titles, threshold, brute_limit)
+    for size in sizes:
+        run("합성", synthetic_titles(titles, size), threshold, brute_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+분석 파이프라인 합성 코퍼스 벤치마크
+
+실제 data/exam.txt(9개 회차, 279문제)와 같은 형식의 합성 exam.txt를
+1천~100만 문제 규모로 생성하고, 단계별 처리 시간/처리량/최대 메모리를 측정합니다.
+결과는 JSON으로 저장되어 커밋 간 비교에 사용할 수 있습니다.
+
+측정 단계:
+    parse        parse_exam_txt.parse_exam_txt
+    categorize   analyze.categorize_question (전체 문제)
+    duplicates   analyze_duplicates.main
+    tech         analyze_tech_keywords.main
+    report       report_generator.ReportGenerator.generate (전체 회차 비교 리포트)
+
+사용법:
+    python bench_pipeline.py                                  # 1천/1만/10만/100만 문제
+    python bench_pipeline.py --sizes 1000,10000               # 규모 지정
+    python bench_pipeline.py --output results.json            # 결과 저장
+    python bench_pipeline.py --compare old.json --output new.json  # 이전 결과와 비교
+    python bench_pipeline.py --skip-memory                    # 메모리 측정 생략 (빠름)
+"""
+
+import contextlib
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import analyze
+import analyze_duplicates
+import analyze_tech_keywords
+import exam_store
+import parse_exam_txt
+import report_generator
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+STAGES = ["parse", "categorize", "duplicates", "tech", "report"]
+
+# 실제 회차 구성: 1교시 13문제, 2~4교시 6문제
+PERIOD_SIZES = [13, 6, 6, 6]
+
+KOREAN_TERMS = [
+    "제로트러스트", "데이터", "보안", "클라우드", "네트워크", "소프트웨어", "인공지능", "메모리",
+    "프로토콜", "아키텍처", "거버넌스", "암호", "인증", "테스트", "감리", "프로젝트", "트랜잭션",
+    "정규화", "가상화", "컨테이너", "스케줄링", "캐시", "블록체인", "개인정보", "포렌식", "모델",
+    "알고리즘", "플랫폼", "프레임워크", "시스템", "분석", "최적화", "관리", "서비스", "공급망",
+]
+KOREAN_SUFFIXES = ["", "의", " 기반", " 관리", " 보안", " 아키텍처", " 모델", " 시스템"]
+ENGLISH_WORDS = [
+    "Zero", "Trust", "Graph", "Neural", "Network", "Model", "Context", "Protocol", "Large",
+    "Language", "Service", "Level", "Agreement", "Access", "Control", "Data", "Mesh", "Vector",
+    "Database", "Retrieval", "Augmented", "Generation", "Software", "Bill", "Material", "Cloud",
+    "Native", "Security", "Event", "Driven", "Architecture", "Mixture", "Experts", "Memory",
+]
+QUESTION_TEMPLATES = [
+    "{n}.{ko}({en})를 설명하시오.",
+    "{n}.{ko}에서 {acr}({en})를 설명하시오.",
+    "{n}.{acr}({en})와 {acr2}({en2})를 비교하시오.",
+    "{n}.{ko}{suffix}의 개념과 구성요소를 설명하시오.",
+    "{n}.{acr} ({en}) 도입 시 {ko} 관점의 고려사항을 설명하시오.",
+]
+SUB_ITEMS = ["가. {ko}의 개념", "나. {acr}({en})의 구성요소", "다. {ko}{suffix} 적용 사례"]
+
+
+def _english_term(rnd):
+    """영문 용어와 약어 (예: Graph Neural Network, GNN)"""
+    words = rnd.sample(ENGLISH_WORDS, rnd.randint(2, 4))
+    return " ".join(words), "".join(w[0] for w in words).upper()
+
+
+def _question_text(rnd, number, period_num):
+    """합성 문제 텍스트 (2교시 이후 일부는 여러 줄 세부 문항 포함)"""
+    en, acr = _english_term(rnd)
+    en2, acr2 = _english_term(rnd)
+    fields = {
+        "n": number, "en": en, "acr": acr, "en2": en2, "acr2": acr2,
+        "ko": "".join(rnd.sample(KOREAN_TERMS, rnd.randint(1, 2))),
+        "suffix": rnd.choice(KOREAN_SUFFIXES),
+    }
+    text = rnd.choice(QUESTION_TEMPLATES).format(**fields)
+    if period_num > 1 and rnd.random() < 0.5:
+        items = [item.format(**fields) for item in SUB_ITEMS[:rnd.randint(2, 3)]]
+        text = '"' + text.replace("를 설명하시오.", "에 대하여 다음을 설명하시오.") + "\n" + "\n".join(items) + '"'
+    return text
+
+
+def generate_exam_txt(path, num_questions, seed=0):
+    """exam.txt 형식(회차\\t종목\\t교시\\t문제)의 합성 코퍼스 생성, 생성된 회차 목록 반환"""
+    rnd = random.Random(seed)
+    written = 0
+    exam_num = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < num_questions:
+            exam_num += 1
+            for period_num, period_size in enumerate(PERIOD_SIZES, 1):
+                for number in range(1, period_size + 1):
+                    if written >= num_questions:
+                        break
+                    f.write(f"{exam_num}\t관리\t{period_num}\t{_question_text(rnd, number, period_num)}\n")
+                    written += 1
+    return list(range(1, exam_num + 1))
+
+
+def measure(func, memory=True):
+    """(소요 시간 초, 최대 할당 메모리 바이트) - 메모리는 tracemalloc으로 별도 1회 더 실행해 측정"""
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return seconds, peak
+
+
+def run_size(num_questions, workdir, memory=True):
+    """한 규모에 대해 전체 단계를 측정"""
+    exam_txt = workdir / "exam.txt"
+    exam_numbers = generate_exam_txt(exam_txt, num_questions)
+
+    # 저장소/리포트 경로를 임시 디렉터리로 전환
+    exam_store.STORE_PATH = workdir / "exam_store.sqlite3"
+    exam_store._STORE = None
+    report_generator.REPORTS_DIR = workdir / "reports"
+
+    state = {}
+    results = []
+
+    def stage_parse():
+        state["exam_data"] = parse_exam_txt.parse_exam_txt(exam_txt)
+
+    def stage_categorize():
+        state["categorized"] = {
+            exam_num: {
+                period: [analyze.categorize_question(q) for q in questions]
+                for period, questions in exam.items()
+            }
+            for exam_num, exam in state["exam_data"].items()
+        }
+
+    def stage_duplicates():
+        analyze_duplicates.main(exam_numbers)
+
+    def stage_tech():
+        analyze_tech_keywords.main(exam_numbers)
+
+    def stage_report():
+        report_generator.ReportGenerator(exam_numbers).generate()
+
+    stages = {
+        "parse": stage_parse,
+        "categorize": stage_categorize,
+        "duplicates": stage_duplicates,
+        "tech": stage_tech,
+        "report": stage_report,
+    }
+
+    for stage in STAGES:
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds, peak = measure(stages[stage], memory=memory)
+        results.append({
+            "size": num_questions,
+            "stage": stage,
+            "seconds": round(seconds, 6),
+            "questions_per_sec": round(num_questions / seconds, 1) if seconds > 0 else None,
+            "peak_bytes": peak,
+        })
+        print(f"{num_questions:>10,} {stage:<12} {seconds:>10.3f}s "
+              f"{results[-1]['questions_per_sec'] or 0:>14,.0f}/s "
+              f"{(peak or 0) / 1024 / 1024:>10.1f}MB")
+
+        if stage == "categorize":
+            # 이후 단계(중복/키워드/리포트)가 읽을 저장소 구성 (측정 제외)
+            store = exam_store.get_store()
+            for exam_num, exam in state["exam_data"].items():
+                category_count = {cat: 0 for cat in analyze.get_syllabus_index().categories}
+                category_count["미분류"] = 0
+                for results_per_period in state["categorized"][exam_num].values():
+                    for categories, _ in results_per_period:
+                        category_count[categories[0]] += 1
+                exam_store.save_analysis(store, exam_num, exam, state["categorized"][exam_num], category_count)
+
+    exam_store.get_store().close()
+    exam_store._STORE = None
+    return results
+
+
+def git_commit():
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous, results):
+    """이전 결과 대비 단계별 소요 시간 비율 출력"""
+    before = {(r["size"], r["stage"]): r for r in previous["results"]}
+    print(f"\n이전 결과({previous['meta'].get('commit')}) 대비 소요 시간")
+    print(f"{'규모':>10} {'단계':<12} {'이전':>10} {'현재':>10} {'비율':>8}")
+    print("-" * 56)
+    for r in results:
+        old = before.get((r["size"], r["stage"]))
+        if old is None:
+            continue
+        ratio = r["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+        print(f"{r['size']:>10,} {r['stage']:<12} {old['seconds']:>9.3f}s {r['seconds']:>9.3f}s {ratio:>7.2f}x")
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    sizes = DEFAULT_SIZES
+    if "--sizes" in args:
+        sizes = [int(s) for s in args[args.index("--sizes") + 1].split(",")]
+    output = Path(args[args.index("--output") + 1]) if "--output" in args else None
+    previous_path = Path(args[args.index("--compare") + 1]) if "--compare" in args else None
+    memory = "--skip-memory" not in args
+
+    print(f"{'규모':>10} {'단계':<12} {'소요 시간':>11} {'처리량(문제)':>15} {'최대 메모리':>11}")
+    print("-" * 66)
+
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            results.extend(run_size(size, Path(tmp), memory=memory))
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "memory_measured": memory,
+        },
+        "results": results,
+    }
+
+    if output:
+        output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n✓ 벤치마크 결과 저장: {output}")
+
+    if previous_path:
+        with open(previous_path, "r", encoding="utf-8") as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+extract_tech_keywords 처리량 벤치마크
+
+기존 방식(제목마다 패턴 11개를 re.findall로 따로 실행)과
+analyze_tech_keywords.extract_tech_keywords_batch(미리 컴파일한 패턴으로 제목을 한 번 훑고
+어절별 결과를 캐시)의 초당 처리 제목 수를 비교하고, 모든 제목에서 결과가 같은지 확인합니다.
+
+데이터:
+- 실제 129~137회 279문제
+- 합성: bench_pipeline.py와 같은 생성기로 만든 문제 (여러 종목 아카이브 규모)
+
+사용법:
+    python bench_tech_keywords.py                      # 실제 + 합성 1만/10만 문제
+    python bench_tech_keywords.py --sizes 1000,1000000 # 합성 규모 지정
+    python bench_tech_keywords.py --repeat 5           # 반복 횟수 (최솟값 사용, 기본 3)
+"""
+
+import random
+import re
+import sys
+import time
+
+import analyze_tech_keywords
+import corpus
+from analyze_tech_keywords import extract_tech_keywords_batch, is_tech_keyword
+from bench_pipeline import _question_text
+
+DEFAULT_SIZES = [10_000, 100_000]
+REPEAT = 3
+
+
+def legacy_extract_tech_keywords(title):
+    """기존 extract_tech_keywords (패턴별 re.findall)"""
+    keywords = set()
+
+    acronyms = re.findall(r'\(([A-Z][A-Za-z0-9\s,/&\-:\.]+)\)', title)
+    for acronym in acronyms:
+        parts = [p.strip() for p in acronym.split(',')]
+        keywords.update(parts)
+
+    tech_patterns = [
+        r'[가-힣]+(?:프로토콜|알고리즘|시스템|모델|기법|방법론|아키텍처|플랫폼|프레임워크|엔진|도구)',
+        r'(?:딥|머신)러닝',
+        r'[가-힣]+(?:암호|보안|인증|검증)',
+        r'[가-힣]+(?:데이터베이스|스토리지|메모리|네트워크|서버)',
+        r'[가-힣]+AI|AI[가-힣]+',
+        r'[가-힣]+(?:테스트|감리|평가)',
+        r'제로[가-힣]+|[가-힣]+제로',
+        r'[가-힣]{4,}(?:분석|최적화|관리)',
+    ]
+    for pattern in tech_patterns:
+        keywords.update(re.findall(pattern, title))
+
+    compound_patterns = [
+        r'(?:정보|데이터|소프트웨어|인공지능|머신러닝)\s+[가-힣]+',
+        r'[가-힣]+\s+(?:컴퓨팅|네트워킹|마이닝|엔지니어링)',
+    ]
+    for pattern in compound_patterns:
+        keywords.update(re.findall(pattern, title))
+
+    return {kw for kw in keywords if is_tech_keyword(kw)}
+
+
+def synthetic_titles(size, seed=0):
+    """합성 문제 제목 size개 (교시별 세부 문항 포함 형식)"""
+    rnd = random.Random(seed)
+    return [_question_text(rnd, i % 13 + 1, i % 4 + 1) for i in range(size)]
+
+
+def best_time(func, repeat):
+    """repeat회 실행 중 가장 짧은 소요 시간과 마지막 결과"""
+    best = None
+    for _ in range(repeat):
+        # 어절 캐시가 데운 상태로 측정되지 않도록 매번 비움
+        analyze_tech_keywords.word_tech_keywords.cache_clear()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(name, titles, repeat):
+    """한 데이터에 대해 기존/새 방식 비교 후 결과 한 줄 출력, 결과가 같은지 반환"""
+    legacy_seconds, expected = best_time(lambda: [legacy_extract_tech_keywords(t) for t in titles], repeat)
+    batch_seconds, actual = best_time(lambda: extract_tech_keywords_batch(titles), repeat)
+
+    same = actual == expected
+    print(f"{name:<6} {len(titles):>10,} {len(titles) / legacy_seconds:>14,.0f} "
+          f"{len(titles) / batch_seconds:>14,.0f} {legacy_seconds / batch_seconds:>7.1f}x "
+          f"{'일치' if same else '불일치':>6}")
+    return same
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    sizes = DEFAULT_SIZES
+    if "--sizes" in args:
+        sizes = [int(s) for s in args[args.index("--sizes") + 1].split(",")]
+    repeat = int(args[args.index("--repeat") + 1]) if "--repeat" in args else REPEAT
+
+    titles = [q.title.strip() for q in corpus.load_questions(range(129, 138)) if q.title.strip()]
+    if not titles:
+        print("⚠️  문제를 찾을 수 없습니다 (parse_exam_txt.py / analyze.py를 먼저 실행하세요)")
+        sys.exit(1)
+
+    print(f"단위: 초당 제목 수 ({repeat}회 중 최고)")
+    print()
+    print(f"{'데이터':<4} {'제목수':>9} {'기존':>12} {'일괄 추출':>10} {'배속':>8} {'결과':>5}")
+    print("-" * 64)
+
+    all_same = run("실제", titles, repeat)
+    for size in sizes:
+        all_same &= run("합성", synthetic_titles(size), repeat)
+
+    if not all_same:
+        print()
+        print("⚠️  기존 방식과 추출 결과가 다릅니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+기출문제 분석 빌드 (입력이 바뀐 결과만 다시 생성)
+
+make처럼 파일 의존 그래프를 따라 필요한 단계만 실행합니다.
+
+    exam.txt -> {회차}회_문제목록.json -> {회차}회_분석결과.json (+ 출제기준_매칭결과_상세)
+             -> reports/{회차}회_분석_리포트.md
+             -> reports/{첫 회차}-{마지막 회차}회_비교_분석.md (모든 회차의 분석결과에 의존)
+             -> itpe-assistant/public/data/exam/manifest.json (웹 앱용 샤드, 모든 회차에 의존)
+
+노드마다 입력/출력 파일의 SHA-256을 data/exam_results/.build_state.json에 기록하고,
+입력 해시가 같고 출력 파일이 기록된 내용 그대로인 노드는 건너뜁니다. 회차별 분석과
+회차별 리포트처럼 서로 의존하지 않는 노드는 --jobs로 여러 프로세스에서 동시에 실행합니다.
+exam.txt에 회차 하나를 추가하면 그 회차의 문제목록/분석결과/리포트와 비교 리포트만 다시 만듭니다.
+(exam.txt 파싱은 parse_exam_txt.py의 증분 파싱을 사용)
+
+사용법:
+    python build.py             # 바뀐 부분만 다시 생성
+    python build.py --jobs 4    # 독립 노드를 프로세스 4개로 병렬 실행
+    python build.py --dry-run   # 다시 생성할 노드와 이유만 출력 (파일은 쓰지 않음)
+    python build.py --force     # 전체 다시 생성
+"""
+
+import io
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
+from typing import NamedTuple
+
+import analyze
+import exam_store
+import export_web
+import parse_exam_txt
+import profiling
+import report_generator
+from analyze import DATA_DIR, PROJECT_ROOT, file_sha256
+from syllabus_compiler import get_syllabus_index
+
+BUILD_STATE_PATH = DATA_DIR / ".build_state.json"
+
+# 노드 구성이나 기록 형식을 바꾸면 올려서 다음 빌드를 전체 빌드로
+BUILD_VERSION = 1
+
+
+class BuildNode(NamedTuple):
+    """빌드 그래프 노드
+
+    action: ("parse", 전체 파싱 여부) | ("analyze", 회차) | ("report", [회차, ...]) | ("export", None)
+    fingerprint: 파일이 아닌 입력 (출제기준 구조와 점수 규칙 지문 등)
+    """
+    name: str
+    label: str
+    deps: tuple
+    inputs: tuple
+    outputs: tuple
+    action: tuple
+    fingerprint: str = ""
+
+
+def relative(path):
+    """기록용 경로 (프로젝트 기준 상대 경로)"""
+    return path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def file_hashes(paths):
+    """{상대 경로: SHA-256} (없는 파일은 None)"""
+    return {relative(path): file_sha256(path) if path.exists() else None for path in paths}
+
+
+def input_hashes(node):
+    """노드 입력의 현재 해시"""
+    hashes = file_hashes(node.inputs)
+    if node.fingerprint:
+        hashes["fingerprint"] = node.fingerprint
+    return hashes
+
+
+def stale_reason(node, inputs, record):
+    """노드를 다시 실행해야 하는 이유 (최신이면 None)"""
+    if record is None:
+        return "빌드 기록 없음"
+    changed = [name for name in sorted(set(inputs) | set(record["inputs"]))
+               if inputs.get(name) != record["inputs"].get(name)]
+    if changed:
+        return f"입력 변경: {', '.join(changed)}"
+    for path in node.outputs:
+        recorded = record["outputs"].get(relative(path))
+        if not path.exists():
+            return f"출력 없음: {relative(path)}"
+        if recorded is None or file_sha256(path) != recorded:
+            return f"출력이 기록과 다름: {relative(path)}"
+    return None
+
+
+def load_state(path=BUILD_STATE_PATH):
+    """빌드 기록 {노드 이름: {"inputs": {...}, "outputs": {...}}}"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if state.get("version") != BUILD_VERSION:
+        return {}
+    return state["nodes"]
+
+
+def save_state(nodes, path=BUILD_STATE_PATH):
+    """빌드 기록 저장 (노드가 끝날 때마다 저장해 중단되어도 끝난 노드는 유지)"""
+    parse_exam_txt.save_json({"version": BUILD_VERSION, "nodes": nodes}, path)
+
+
+def parsed_question_files():
+    """매니페스트에 기록된 관리 종목 문제목록 파일 (exam.txt 파싱 결과)"""
+    try:
+        with open(parse_exam_txt.MANIFEST_PATH, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return []
+    rounds = manifest.get("subjects", {}).get(parse_exam_txt.DEFAULT_SUBJECT, {}).get("rounds", {})
+    return [DATA_DIR / info["file"] for info in rounds.values()]
+
+
+def predict_outputs(node, force=False):
+    """dry_run에서 노드를 다시 만들면 바뀔 출력 {상대 경로: 예상 해시}
+
+    파싱 노드는 다시 저장할 문제목록 중 내용이 달라지는 파일만, 다른 노드는 모든 출력
+    (내용을 알 수 없으므로 기록된 어떤 해시와도 다른 값)
+    """
+    if node.action[0] != "parse":
+        return {relative(path): "다시 생성 예정" for path in node.outputs}
+    previews = parse_exam_txt.preview_update(node.inputs[0], full=force)
+    current = file_hashes(previews)
+    return {relative(path): digest for path, digest in previews.items() if current[relative(path)] != digest}
+
+
+def execute(action, inline=False):
+    """노드 작업 실행 (작업 프로세스에서도 호출) -> (성공 여부, 콘솔 출력)
+
+    inline=False(작업 프로세스)이면 여러 프로세스가 집계 큐브를 동시에 고치지 않도록
+    분석 시 큐브를 갱신하지 않습니다 (다음 로드 때 다시 생성).
+    """
+    kind, arg = action
+    buffer = io.StringIO()
+    ok = True
+    with redirect_stdout(buffer):
+        try:
+            if kind == "parse":
+                parse_exam_txt.update(parse_exam_txt.EXAM_TXT_PATH, full=arg)
+            elif kind == "analyze":
+                ok = analyze.analyze_exam(arg, verbose=False, force=True, update_cube=inline) is not None
+            elif kind == "report":
+                report_generator.ReportGenerator(arg).generate()
+            else:
+                export_web.write_export(*export_web.build_shards())
+        except Exception as e:
+            print(f"✗ 오류: {e}")
+            ok = False
+    return ok, buffer.getvalue()
+
+
+def build_graph(rounds, deps=()):
+    """회차별 분석/리포트, 비교 리포트, 웹 데이터 내보내기 노드 {이름: BuildNode} (분석 노드는 deps에 의존)"""
+    fingerprint = analyze.syllabus_fingerprint()
+    reports_dir = report_generator.REPORTS_DIR
+    nodes = {}
+
+    for exam_num in rounds:
+        questions_path = DATA_DIR / f"{exam_num}회_문제목록.json"
+        detailed_path, analysis_path = analyze.output_paths(exam_num)
+        nodes[f"analyze:{exam_num}"] = BuildNode(
+            f"analyze:{exam_num}", f"{exam_num}회 분석", deps,
+            (questions_path,), (analysis_path, detailed_path), ("analyze", exam_num), fingerprint)
+        nodes[f"report:{exam_num}"] = BuildNode(
+            f"report:{exam_num}", f"{exam_num}회 리포트", (f"analyze:{exam_num}",),
+            (analysis_path,), (reports_dir / f"{exam_num}회_분석_리포트.md",), ("report", [exam_num]))
+
+    if len(rounds) > 1:
+        first, last = rounds[0], rounds[-1]
+        nodes["comparison"] = BuildNode(
+            "comparison", f"{first}-{last}회 비교 리포트", tuple(f"analyze:{n}" for n in rounds),
+            tuple(analyze.output_paths(n)[1] for n in rounds),
+            (reports_dir / f"{first}-{last}회_비교_분석.md",), ("report", list(rounds)))
+
+    # 키워드 샤드는 문제 본문에서 뽑으므로 문제목록도 입력
+    nodes["export"] = BuildNode(
+        "export", "웹 데이터 내보내기", tuple(f"analyze:{n}" for n in rounds),
+        tuple(path for n in rounds for path in (DATA_DIR / f"{n}회_문제목록.json", analyze.output_paths(n)[1])),
+        (export_web.EXPORT_DIR / "manifest.json",), ("export", None), f"export v{export_web.EXPORT_VERSION}")
+    return nodes
+
+
+def run_graph(nodes, state, status, jobs=1, force=False, dry_run=False, predicted=None):
+    """의존 순서대로 오래된 노드만 실행하고 status에 결과 기록 ("built"|"fresh"|"failed"|"skipped")
+
+    status에 이미 있는 노드(앞서 실행한 단계)는 의존 대상으로만 사용합니다.
+    노드의 입력 해시는 의존 노드가 모두 끝난 뒤에 계산하므로, 앞 단계를 다시 만들었어도
+    출력 내용이 그대로면 뒤 단계는 다시 실행하지 않습니다.
+
+    dry_run에서는 실행하지 않는 대신 다시 만들 노드의 출력을 predicted({상대 경로: 예상 해시})에
+    기록하고, 뒤 단계의 입력 해시를 그 값으로 바꿔 판단합니다. 파싱 노드는 실제로 바뀔
+    문제목록 파일만 기록하고, 다른 노드는 출력이 모두 바뀐다고 가정하므로 결과는 상한입니다.
+    """
+    predicted = {} if predicted is None else predicted
+    pending = dict(nodes)
+    running = {}
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and not dry_run else None
+
+    def finish(node, inputs, ok, output, seconds):
+        # parse 노드의 출력은 실행 후에야 알 수 있음 (매니페스트의 회차 파일)
+        outputs = parsed_question_files() if node.action[0] == "parse" else node.outputs
+        if ok and all(path.exists() for path in outputs):
+            status[node.name] = "built"
+            state[node.name] = {"inputs": inputs, "outputs": file_hashes(outputs)}
+            save_state(state)
+            print(f"✓ {node.label} ({seconds:.1f}s)")
+        else:
+            status[node.name] = "failed"
+            print(f"✗ {node.label} 실패")
+            for line in output.splitlines():
+                print(f"    {line}")
+
+    try:
+        while pending or running:
+            ready = [node for node in pending.values() if all(dep in status for dep in node.deps)]
+            if not ready and not running:
+                raise ValueError(f"실행할 수 없는 노드 (의존 대상 없음/순환): {', '.join(pending)}")
+
+            for node in ready:
+                name = node.name
+                del pending[name]
+
+                if any(status[dep] in ("failed", "skipped") for dep in node.deps):
+                    status[name] = "skipped"
+                    print(f"- {node.label} 건너뜀 (앞 단계 실패)")
+                    continue
+
+                inputs = input_hashes(node)
+                inputs.update((path, predicted[path]) for path in inputs if path in predicted)
+                reason = "--force 지정" if force else stale_reason(node, inputs, state.get(name))
+                if reason is None:
+                    status[name] = "fresh"
+                    continue
+
+                if dry_run:
+                    status[name] = "built"
+                    predicted.update(predict_outputs(node, force))
+                    print(f"• {node.label}: {reason}")
+                elif executor is None:
+                    print(f"▶ {node.label}: {reason}")
+                    start = time.perf_counter()
+                    with profiling.stage(node.action[0]):
+                        ok, output = execute(node.action, inline=True)
+                    finish(node, inputs, ok, output, time.perf_counter() - start)
+                else:
+                    print(f"▶ {node.label}: {reason}")
+                    future = executor.submit(execute, node.action)
+                    running[future] = (node, inputs, time.perf_counter())
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node, inputs, start = running.pop(future)
+                ok, output = future.result()
+                finish(node, inputs, ok, output, time.perf_counter() - start)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    jobs = int(args[args.index("--jobs") + 1]) if "--jobs" in args else 1
+    force = "--force" in args
+    dry_run = "--dry-run" in args
+
+    # 작업 프로세스를 띄우기 전에 저장소/출제기준 인덱스를 미리 생성
+    exam_store.open_store().close()
+    get_syllabus_index()
+
+    state = load_state()
+    status = {}
+    predicted = {}
+
+    # 1단계: exam.txt 파싱 (만들어질 회차 파일을 알아야 뒤 단계를 구성할 수 있으므로 먼저 실행)
+    deps = ()
+    exam_txt = parse_exam_txt.EXAM_TXT_PATH
+    if exam_txt.exists():
+        recorded = state.get("parse", {}).get("outputs", {})
+        parse_node = BuildNode(
+            "parse", "exam.txt 파싱", (), (exam_txt,),
+            tuple(PROJECT_ROOT / path for path in recorded), ("parse", force))
+        run_graph({"parse": parse_node}, state, status, 1, force, dry_run, predicted)
+        deps = ("parse",)
+
+    # 2단계: 회차별 분석/리포트와 비교 리포트
+    rounds = analyze.find_exam_numbers()
+    if dry_run:
+        # 파싱이 새로 만들 회차 파일도 포함
+        new_rounds = {path.rsplit("/", 1)[-1].split("회_")[0] for path in predicted
+                      if path.endswith("회_문제목록.json")}
+        rounds = sorted(set(rounds) | {n for n in new_rounds if n.isdigit()}, key=int)
+    if not rounds:
+        print(f"⚠️  문제목록을 찾을 수 없습니다: {DATA_DIR}")
+        sys.exit(1)
+    run_graph(build_graph(rounds, deps), state, status, jobs, force, dry_run, predicted)
+
+    counts = {key: sum(1 for value in status.values() if value == key)
+              for key in ("built", "fresh", "failed", "skipped")}
+    print()
+    if dry_run:
+        print(f"다시 생성할 노드 최대 {counts['built']}개, 최신 {counts['fresh']}개")
+        return
+    print(f"✓ 빌드 완료: 다시 생성 {counts['built']}개, 최신 {counts['fresh']}개"
+          + (f", 실패 {counts['failed']}개, 건너뜀 {counts['skipped']}개" if counts["failed"] else ""))
+    if counts["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    with profiling.session("build"):
+        main()
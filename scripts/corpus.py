@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+기출문제 코퍼스 공통 로더
+
+analyze_duplicates.py, analyze_tech_keywords.py, report_generator.py가 각자 저장소를
+읽고 중첩 dict를 따로 순회하던 것을 하나로 모았습니다. 문제는 Question 레코드
+(회차, 교시, 번호, 제목, 키워드, 세부문항, 카테고리, 매칭키워드)로 반환합니다.
+
+캐시:
+- 프로세스 안에서는 한 번 읽은 코퍼스를 재사용 (저장소가 바뀌면 다시 읽음)
+- 디스크에는 data/exam_results/.corpus_snapshot.pickle 스냅샷을 두고,
+  저장소(exam_store.sqlite3)와 회차별 JSON 파일의 수정 시각/크기가 그대로면 저장소를
+  열지 않고 스냅샷만 읽음 (JSON 파일이 새로 생기거나 바뀌었으면 저장소로 가져온 뒤 다시 읽음)
+
+사용법:
+    import corpus
+
+    for question in corpus.load_questions(range(129, 138)):
+        print(question.exam_number, question.period, question.number, question.title)
+
+    corpus.load_analysis(137)  # exam_store.load_analysis와 같은 형태
+
+    python corpus.py           # 스냅샷 갱신 후 회차별 문제 수 출력
+    python corpus.py --rebuild # 스냅샷 강제 재생성
+"""
+
+import json
+import os
+import pickle
+import sys
+from typing import NamedTuple, Optional
+
+import exam_store
+import profiling
+
+# 스냅샷 형식을 바꾸면 올려서 기존 스냅샷을 무효화
+SNAPSHOT_VERSION = 1
+
+
+class Question(NamedTuple):
+    """문제 레코드 (분석 전 회차는 category/matched_keywords가 None)"""
+    exam_number: str
+    period: str
+    number: str
+    title: str
+    keywords: tuple
+    details: tuple
+    category: Optional[str]
+    matched_keywords: Optional[tuple]
+
+    @property
+    def full_id(self):
+        """"137회 1교시 3" 형태의 문제 식별자"""
+        return f"{self.exam_number}회 {self.period} {self.number}"
+
+
+def snapshot_path():
+    """현재 저장소 옆의 스냅샷 경로 (벤치마크 등에서 저장소 경로를 바꿔도 따라감)"""
+    return exam_store.STORE_PATH.with_name(".corpus_snapshot.pickle")
+
+
+def store_state():
+    """저장소 파일의 (수정 시각, 크기) - 없으면 None"""
+    try:
+        stat = os.stat(exam_store.STORE_PATH)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def source_state():
+    """저장소와 회차별 JSON 파일의 상태 (코퍼스에서 만든 파생 캐시의 유효성 확인용)"""
+    return [store_state(), exam_store.legacy_state(exam_store.STORE_PATH.parent)]
+
+
+def corpus_state(corpus):
+    """get_corpus() 결과를 읽은 시점의 source_state() (파생 캐시를 만든 뒤 기록할 때 사용)"""
+    return [corpus["key"][1], corpus["legacy"]]
+
+
+def read_store(conn):
+    """저장소 전체를 스냅샷 형태(클래스 참조 없는 기본 자료형)로 읽기"""
+    rows = conn.execute(
+        "SELECT exam_number, period, number, title, keywords, details, category, matched_keywords"
+        " FROM questions ORDER BY exam_number, period_order, position").fetchall()
+    rows.sort(key=lambda row: exam_store.exam_sort_key(row[0]))
+
+    questions = []
+    for exam_num, period, number, title, keywords, details, category, matched in rows:
+        questions.append((
+            exam_num, period, number, title,
+            tuple(json.loads(keywords)), tuple(json.loads(details)),
+            category, tuple(json.loads(matched)) if matched is not None else None,
+        ))
+
+    category_counts = {}
+    for exam_num, category, count in conn.execute(
+            "SELECT exam_number, category, count FROM category_counts ORDER BY exam_number, category_order"):
+        category_counts.setdefault(exam_num, []).append((category, count))
+
+    return {
+        "questions": questions,
+        "exams": exam_store.exam_numbers(conn),
+        "analyzed": exam_store.exam_numbers(conn, analyzed_only=True),
+        "category_counts": category_counts,
+    }
+
+
+def write_snapshot(snapshot, path):
+    """스냅샷 저장 (다른 프로세스가 읽는 중에도 안전하도록 임시 파일 후 교체)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path, state, legacy):
+    """저장소 상태와 JSON 파일 상태가 같은 스냅샷 (없거나 오래되었으면 None)"""
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("store") != state \
+            or snapshot.get("legacy") != legacy:
+        return None
+    return snapshot
+
+
+_CORPUS = None
+
+
+def get_corpus(rebuild=False):
+    """코퍼스 데이터 (프로세스 메모 -> 디스크 스냅샷 -> 저장소 순으로 확인)"""
+    global _CORPUS
+
+    if not exam_store.STORE_PATH.exists():
+        # 저장소가 없으면 기존 JSON 파일에서 생성
+        exam_store.get_store()
+    data_dir = exam_store.STORE_PATH.parent
+    legacy = exam_store.legacy_state(data_dir)
+    state = store_state()
+    key = (str(exam_store.STORE_PATH), state)
+    if _CORPUS is not None and _CORPUS["key"] == key and _CORPUS["legacy"] == legacy and not rebuild:
+        return _CORPUS
+
+    path = snapshot_path()
+    with profiling.stage("load corpus"):
+        snapshot = None if rebuild else load_snapshot(path, state, legacy)
+        if snapshot is None:
+            conn = exam_store.get_store()
+            if exam_store.sync_legacy_json(conn, data_dir):
+                state = store_state()
+                key = (str(exam_store.STORE_PATH), state)
+            snapshot = read_store(conn)
+            snapshot.update(version=SNAPSHOT_VERSION, store=state, legacy=legacy)
+            write_snapshot(snapshot, path)
+
+        questions = [Question._make(row) for row in snapshot["questions"]]
+        by_exam = {}
+        for question in questions:
+            by_exam.setdefault(question.exam_number, []).append(question)
+
+    _CORPUS = {
+        "key": key,
+        "legacy": legacy,
+        "questions": questions,
+        "by_exam": by_exam,
+        "exams": snapshot["exams"],
+        "analyzed": set(snapshot["analyzed"]),
+        "category_counts": snapshot["category_counts"],
+    }
+    return _CORPUS
+
+
+def load_questions(exam_nums=None):
+    """Question 목록 (회차 오름차순, 회차 안에서는 교시/문제 순서)"""
+    corpus = get_corpus()
+    if exam_nums is None:
+        return list(corpus["questions"])
+    wanted = sorted({str(n) for n in exam_nums}, key=exam_store.exam_sort_key)
+    return [question for exam_num in wanted for question in corpus["by_exam"].get(exam_num, [])]
+
+
+def exam_numbers(analyzed_only=False):
+    """저장된 회차 목록 (오름차순)"""
+    corpus = get_corpus()
+    if analyzed_only:
+        return [exam_num for exam_num in corpus["exams"] if exam_num in corpus["analyzed"]]
+    return list(corpus["exams"])
+
+
+def questions_by_period(questions):
+    """Question 목록 -> 문제목록 JSON과 같은 형태의 교시 -> 문제 목록"""
+    by_period = {}
+    for question in questions:
+        entry = {"번호": question.number, "제목": question.title, "키워드": list(question.keywords)}
+        if question.details:
+            entry["세부문항"] = list(question.details)
+        by_period.setdefault(question.period, []).append(entry)
+    return by_period
+
+
+def load_analysis(exam_num):
+    """exam_store.load_analysis와 같은 형태의 리포트용 데이터 (분석 전이면 None)"""
+    corpus = get_corpus()
+    exam_num = str(exam_num)
+    if exam_num not in corpus["analyzed"]:
+        return None
+
+    questions = corpus["by_exam"].get(exam_num, [])
+    category_count = dict(corpus["category_counts"].get(exam_num, []))
+    category_questions = {category: [] for category in category_count}
+    for question in questions:
+        category = question.category if question.category in category_questions else exam_store.UNCATEGORIZED
+        category_questions.setdefault(category, []).append(
+            f"{question.period} {question.number}. {question.title}")
+
+    return {
+        "exam_number": exam_num,
+        "questions": questions_by_period(questions) or None,
+        "statistics": {
+            "total_questions": sum(category_count.values()),
+            "category_count": category_count,
+            "category_questions": category_questions,
+        },
+    }
+
+
+def main():
+    """메인 함수"""
+    corpus = get_corpus(rebuild="--rebuild" in sys.argv)
+    print(f"✓ 코퍼스 스냅샷: {snapshot_path()}")
+    print(f"  - 총 {len(corpus['questions'])}문제, {len(corpus['exams'])}개 회차 "
+          f"(분석 완료 {len(corpus['analyzed'])}개)")
+    for exam_num in corpus["exams"]:
+        print(f"  - {exam_num}회: {len(corpus['by_exam'].get(exam_num, []))}문제")
+
+
+if __name__ == "__main__":
+    with profiling.session("corpus"):
+        main()
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+기출문제 통합 저장소 (SQLite)
+
+회차마다 문제목록 / 분석결과 / 출제기준_매칭결과_상세 JSON 3개에 중복 저장되던
+문제, 카테고리 분류, 통계를 인덱싱된 로컬 DB 하나에 한 번씩만 저장합니다.
+기존 JSON 파일은 호환성을 위해 export 명령으로 언제든 다시 생성할 수 있습니다.
+
+저장소 파일이 없으면 data/exam_results의 기존 JSON 파일에서 자동으로 만들어지고,
+이후에도 회차별 JSON 파일의 (수정 시각, 크기)를 기록해 두었다가 새로 생기거나 바뀐
+회차만 다시 가져옵니다 (저장소는 커밋하지 않으므로 JSON 파일이 원본).
+
+사용법:
+    python exam_store.py import          # 기존 JSON 파일을 저장소로 (다시) 가져오기
+    python exam_store.py export 137      # 137회 JSON 파일 3종 재생성
+    python exam_store.py export --all    # 전체 회차 JSON 파일 재생성
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "data" / "exam_results"
+STORE_PATH = DATA_DIR / "exam_store.sqlite3"
+
+UNCATEGORIZED = "미분류"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS exams (
+    exam_number TEXT PRIMARY KEY,
+    analyzed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS questions (
+    exam_number TEXT NOT NULL,
+    period_order INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    period TEXT NOT NULL,
+    number TEXT NOT NULL,
+    title TEXT NOT NULL,
+    keywords TEXT NOT NULL,        -- JSON 배열
+    details TEXT NOT NULL DEFAULT '[]',  -- JSON 배열 (세부문항)
+    category TEXT,                 -- 분석 전이면 NULL
+    matched_keywords TEXT,         -- JSON 배열, 분석 전이면 NULL
+    PRIMARY KEY (exam_number, period_order, position)
+);
+
+CREATE INDEX IF NOT EXISTS idx_questions_category ON questions (exam_number, category);
+
+CREATE TABLE IF NOT EXISTS category_counts (
+    exam_number TEXT NOT NULL,
+    category_order INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (exam_number, category_order)
+);
+
+-- 회차별 기존 JSON 파일의 마지막 가져오기/내보내기 시점 상태 (legacy_state 참고)
+CREATE TABLE IF NOT EXISTS legacy_files (
+    exam_number TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+
+def open_store(path=None):
+    """저장소 연결 (새로 생기거나 바뀐 기존 JSON 파일은 가져옴)"""
+    path = Path(path or STORE_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(path, timeout=30)
+    conn.executescript(SCHEMA)
+
+    # 세부문항 열이 없던 이전 저장소
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(questions)")}
+    if "details" not in columns:
+        conn.execute("ALTER TABLE questions ADD COLUMN details TEXT NOT NULL DEFAULT '[]'")
+
+    sync_legacy_json(conn, path.parent)
+    return conn
+
+
+_STORE = None
+
+
+def get_store():
+    """프로세스당 하나의 저장소 연결"""
+    global _STORE
+    if _STORE is None:
+        _STORE = open_store()
+    return _STORE
+
+
+def exam_sort_key(exam_num):
+    """회차 번호 정렬 키"""
+    return int(exam_num) if str(exam_num).isdigit() else str(exam_num)
+
+
+# ---------------------------------------------------------------------------
+# 쓰기
+# ---------------------------------------------------------------------------
+
+def _replace_questions(conn, exam_num, questions):
+    """회차 문제와 분석 결과를 지우고 문제목록만 다시 넣기 (트랜잭션은 호출하는 쪽에서)"""
+    conn.execute("DELETE FROM questions WHERE exam_number = ?", (exam_num,))
+    conn.execute("DELETE FROM category_counts WHERE exam_number = ?", (exam_num,))
+    conn.execute(
+        "INSERT OR REPLACE INTO exams (exam_number, analyzed) VALUES (?, 0)", (exam_num,))
+    conn.executemany(
+        "INSERT INTO questions"
+        " (exam_number, period_order, position, period, number, title, keywords, details)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (exam_num, period_order, position, period, question["번호"], question["제목"],
+             json.dumps(question["키워드"], ensure_ascii=False),
+             json.dumps(question.get("세부문항", []), ensure_ascii=False))
+            for period_order, (period, period_questions) in enumerate(questions.items())
+            for position, question in enumerate(period_questions)
+        ],
+    )
+
+
+def save_questions(conn, exam_num, questions):
+    """회차 문제목록 저장 (기존 문제/분석 결과는 교체)"""
+    with conn:
+        _replace_questions(conn, str(exam_num), questions)
+
+
+def save_analysis(conn, exam_num, questions, categorized, category_count):
+    """회차 문제목록과 분류 결과, 카테고리별 문제 수 저장
+
+    categorized: 교시 -> 문제 순서대로의 (categories, matched_keywords) 목록
+    category_count: 카테고리 -> 문제 수 (출력 순서 유지)
+    """
+    exam_num = str(exam_num)
+    # 한 트랜잭션으로 (다른 프로세스가 같은 회차를 동시에 가져와도 섞이지 않도록)
+    with conn:
+        _replace_questions(conn, exam_num, questions)
+        conn.executemany(
+            "UPDATE questions SET category = ?, matched_keywords = ?"
+            " WHERE exam_number = ? AND period_order = ? AND position = ?",
+            [
+                (categories[0], json.dumps(matched_keywords, ensure_ascii=False),
+                 exam_num, period_order, position)
+                for period_order, period in enumerate(questions)
+                for position, (categories, matched_keywords) in enumerate(categorized[period])
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO category_counts (exam_number, category_order, category, count) VALUES (?, ?, ?, ?)",
+            [(exam_num, order, category, count) for order, (category, count) in enumerate(category_count.items())],
+        )
+        conn.execute("UPDATE exams SET analyzed = 1 WHERE exam_number = ?", (exam_num,))
+
+
+# ---------------------------------------------------------------------------
+# 읽기
+# ---------------------------------------------------------------------------
+
+def exam_numbers(conn, analyzed_only=False):
+    """저장된 회차 목록 (오름차순)"""
+    query = "SELECT exam_number FROM exams"
+    if analyzed_only:
+        query += " WHERE analyzed = 1"
+    return sorted((row[0] for row in conn.execute(query)), key=exam_sort_key)
+
+
+def is_analyzed(conn, exam_num):
+    """회차 분석 결과가 저장되어 있는지 확인"""
+    row = conn.execute("SELECT analyzed FROM exams WHERE exam_number = ?", (str(exam_num),)).fetchone()
+    return bool(row and row[0])
+
+
+def iter_questions(conn, exam_nums=None):
+    """문제를 (회차, 교시, 번호, 제목, 키워드, 카테고리, 매칭키워드) 순으로 반환"""
+    query = ("SELECT exam_number, period, number, title, keywords, category, matched_keywords"
+             " FROM questions")
+    params = ()
+    if exam_nums is not None:
+        # 회차 수와 관계없이 바인딩 변수 1개로 전달 (SQLite 변수 개수 제한 회피)
+        query += " WHERE exam_number IN (SELECT value FROM json_each(?))"
+        params = (json.dumps([str(n) for n in exam_nums]),)
+
+    rows = conn.execute(query + " ORDER BY exam_number, period_order, position", params).fetchall()
+    rows.sort(key=lambda row: exam_sort_key(row[0]))
+    for exam_num, period, number, title, keywords, category, matched in rows:
+        yield (exam_num, period, number, title, json.loads(keywords),
+               category, json.loads(matched) if matched is not None else None)
+
+
+def load_questions(conn, exam_num):
+    """문제목록 JSON과 같은 형태의 교시 -> 문제 목록 (없으면 None)"""
+    rows = conn.execute(
+        "SELECT period, number, title, keywords, details FROM questions"
+        " WHERE exam_number = ? ORDER BY period_order, position", (str(exam_num),))
+    questions = {}
+    for period, number, title, keywords, details in rows:
+        question = {"번호": number, "제목": title, "키워드": json.loads(keywords)}
+        if details != "[]":
+            question["세부문항"] = json.loads(details)
+        questions.setdefault(period, []).append(question)
+    return questions or None
+
+
+def load_statistics(conn, exam_num):
+    """분석결과 JSON의 statistics와 같은 형태의 통계 (분석 전이면 None)"""
+    exam_num = str(exam_num)
+    if not is_analyzed(conn, exam_num):
+        return None
+
+    category_count = dict(conn.execute(
+        "SELECT category, count FROM category_counts WHERE exam_number = ? ORDER BY category_order",
+        (exam_num,)))
+    category_questions = {category: [] for category in category_count}
+    for _, period, number, title, _, category, _ in iter_questions(conn, [exam_num]):
+        if category not in category_questions:
+            category = UNCATEGORIZED
+        category_questions.setdefault(category, []).append(f"{period} {number}. {title}")
+
+    return {
+        "total_questions": sum(category_count.values()),
+        "category_count": category_count,
+        "category_questions": category_questions,
+    }
+
+
+def load_analysis(conn, exam_num):
+    """분석결과 JSON과 같은 형태의 리포트용 데이터 (분석 전이면 None)"""
+    statistics = load_statistics(conn, exam_num)
+    if statistics is None:
+        return None
+    return {
+        "exam_number": str(exam_num),
+        "questions": load_questions(conn, exam_num),
+        "statistics": statistics,
+    }
+
+
+def load_detailed_analysis(conn, exam_num):
+    """출제기준_매칭결과_상세 JSON과 같은 형태의 상세 결과 (분석 전이면 None)"""
+    statistics = load_statistics(conn, exam_num)
+    if statistics is None:
+        return None
+
+    results = {}
+    for _, period, number, title, _, category, matched in iter_questions(conn, [exam_num]):
+        results.setdefault(period, []).append({
+            "번호": number,
+            "제목": title,
+            "categories": [category],
+            "matched_keywords": matched,
+        })
+
+    return {
+        "시험회차": f"{exam_num}회",
+        "분석결과": results,
+        "통계": {
+            "카테고리별_문제수": statistics["category_count"],
+            "카테고리별_문제목록": statistics["category_questions"],
+            "총_문제수": statistics["total_questions"],
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# 기존 JSON 파일 가져오기 / 내보내기
+# ---------------------------------------------------------------------------
+
+def write_json(path, data):
+    """JSON 저장 후 저장된 내용의 SHA-256 반환 (다른 프로세스가 읽는 중에도 안전하도록 임시 파일 후 교체)"""
+    path = Path(path)
+    content = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return hashlib.sha256(content).hexdigest()
+
+
+def legacy_paths(exam_num, data_dir=DATA_DIR):
+    """회차별 기존 JSON 파일 경로 (문제목록, 상세, 리포트용)"""
+    data_dir = Path(data_dir)
+    return (
+        data_dir / f"{exam_num}회_문제목록.json",
+        data_dir / f"{exam_num}회_출제기준_매칭결과_상세.json",
+        data_dir / f"{exam_num}회_분석결과.json",
+    )
+
+
+def file_state(path):
+    """파일의 [수정 시각, 크기] (없으면 None)"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def legacy_state(data_dir=DATA_DIR):
+    """{회차: 문제목록/매칭결과 JSON의 상태} (문제목록 파일이 있는 회차만, 파일을 열지 않음)"""
+    state = {}
+    for questions_path in Path(data_dir).glob("*회_문제목록.json"):
+        exam_num = questions_path.name.split("회_")[0]
+        state[exam_num] = json.dumps([file_state(questions_path),
+                                      file_state(legacy_paths(exam_num, data_dir)[1])])
+    return state
+
+
+def record_legacy_state(conn, exam_num, data_dir=DATA_DIR):
+    """회차 JSON 파일의 현재 상태를 가져온/내보낸 상태로 기록"""
+    state = legacy_state(data_dir).get(str(exam_num))
+    if state is not None:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO legacy_files (exam_number, state) VALUES (?, ?)",
+                         (str(exam_num), state))
+
+
+def import_legacy_round(conn, exam_num, data_dir=DATA_DIR):
+    """회차 문제목록(+ 매칭결과) JSON을 저장소로 가져오기
+
+    매칭결과의 문제 제목이 문제목록과 다르면 (분석 후 문제목록만 바뀐 경우) 문제만 가져와
+    분석 전 회차로 둡니다.
+    """
+    questions_path, detailed_path, _ = legacy_paths(exam_num, data_dir)
+    with open(questions_path, "r", encoding="utf-8") as f:
+        questions = json.load(f)["questions"]
+
+    detailed = None
+    if detailed_path.exists():
+        with open(detailed_path, "r", encoding="utf-8") as f:
+            detailed = json.load(f)
+        titles = {period: [q["제목"] for q in qs] for period, qs in questions.items()}
+        if {period: [r["제목"] for r in results] for period, results in detailed["분석결과"].items()} != titles:
+            detailed = None
+
+    if detailed is None:
+        save_questions(conn, exam_num, questions)
+    else:
+        categorized = {
+            period: [(result["categories"], result["matched_keywords"]) for result in results]
+            for period, results in detailed["분석결과"].items()
+        }
+        save_analysis(conn, exam_num, questions, categorized, detailed["통계"]["카테고리별_문제수"])
+    record_legacy_state(conn, exam_num, data_dir)
+
+
+def import_legacy_json(conn, data_dir=DATA_DIR):
+    """data/exam_results의 문제목록/매칭결과 JSON을 모두 저장소로 (다시) 가져오기"""
+    imported = sorted(legacy_state(data_dir), key=exam_sort_key)
+    for exam_num in imported:
+        import_legacy_round(conn, exam_num, data_dir)
+    return imported
+
+
+def sync_legacy_json(conn, data_dir=DATA_DIR):
+    """기록된 상태와 다른(새로 생기거나 바뀐) 회차 JSON만 가져오기 -> 가져온 회차 목록"""
+    recorded = dict(conn.execute("SELECT exam_number, state FROM legacy_files"))
+    changed = sorted((exam_num for exam_num, state in legacy_state(data_dir).items()
+                      if recorded.get(exam_num) != state), key=exam_sort_key)
+    for exam_num in changed:
+        import_legacy_round(conn, exam_num, data_dir)
+    return changed
+
+
+def export_questions_json(conn, exam_num, data_dir=DATA_DIR):
+    """문제목록 JSON 재생성 후 내용 해시 반환"""
+    questions = load_questions(conn, exam_num)
+    output = {
+        "exam_number": str(exam_num),
+        "questions": questions,
+        "metadata": {
+            "total_questions": sum(len(qs) for qs in questions.values()),
+            "periods": list(questions.keys())
+        }
+    }
+    digest = write_json(legacy_paths(exam_num, data_dir)[0], output)
+    record_legacy_state(conn, exam_num, data_dir)
+    return digest
+
+
+def export_analysis_json(conn, exam_num, data_dir=DATA_DIR):
+    """출제기준_매칭결과_상세 / 분석결과 JSON 재생성 후 {파일명: 내용 해시} 반환"""
+    _, detailed_path, report_path = legacy_paths(exam_num, data_dir)
+    hashes = {
+        detailed_path.name: write_json(detailed_path, load_detailed_analysis(conn, exam_num)),
+        report_path.name: write_json(report_path, load_analysis(conn, exam_num)),
+    }
+    record_legacy_state(conn, exam_num, data_dir)
+    return hashes
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    if not args or args[0] not in ("import", "export"):
+        print("사용법: python exam_store.py import")
+        print("       python exam_store.py export <회차번호> [회차번호...] | --all")
+        sys.exit(1)
+
+    conn = open_store()
+
+    if args[0] == "import":
+        imported = import_legacy_json(conn)
+        print(f"✓ {len(imported)}개 회차 가져오기 완료: {STORE_PATH}")
+        return
+
+    targets = exam_numbers(conn) if "--all" in args else args[1:]
+    for exam_num in targets:
+        if load_questions(conn, exam_num) is None:
+            print(f"⚠️  저장소에 {exam_num}회 데이터가 없습니다.")
+            continue
+        export_questions_json(conn, exam_num)
+        if is_analyzed(conn, exam_num):
+            export_analysis_json(conn, exam_num)
+        print(f"✓ {exam_num}회 JSON 파일 재생성")
+
+
+if __name__ == "__main__":
+    main()
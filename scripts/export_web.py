@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+itpe-assistant 웹 앱용 정적 JSON 내보내기
+
+data/exam_results의 원본 파일은 크고 회차마다 같은 내용이 겹치므로, 웹 화면이 그리는
+단위로 미리 나눈 작은 JSON(샤드)을 itpe-assistant/public/data/exam/에 씁니다.
+Next.js가 /data/exam/... 경로로 그대로 서빙하며, 화면은 필요한 샤드만 받습니다.
+
+    manifest.json                       회차/카테고리 요약과 샤드 파일 이름 (매번 새로 받음)
+    rounds/{회차}.{해시}.json            회차의 문제 목록과 카테고리별 문제 수
+    categories/{카테고리}.{해시}.json    카테고리의 회차별 문제 수/비율/이동평균과 문제 목록
+    keywords/{버킷}.{해시}.json          정규화 키워드 -> 표기, 분류, 출제 위치
+
+샤드는 공백 없이 직렬화하고 파일 이름에 내용 해시를 넣으므로 내용이 같으면 이름도 같아
+오래 캐시할 수 있습니다 (Cache-Control: immutable). 키워드는 키워드마다 파일을 만들지
+않고 정규화 키워드의 FNV-1a 해시로 KEYWORD_SHARDS개 버킷에 나눕니다 (웹 앱도 같은 해시로
+버킷을 찾음). 새 매니페스트와 직전 매니페스트가 가리키지 않는 샤드는 지웁니다.
+
+사용법:
+    python export_web.py                # itpe-assistant/public/data/exam/에 내보내기
+    python export_web.py --out DIR      # 다른 디렉토리에 내보내기
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import aggregate_cube
+import corpus
+import exam_store
+import keyword_index
+import profiling
+from keyword_classifier import get_classifier
+from report_generator import MOVING_AVERAGE_WINDOW, PROJECT_ROOT
+
+EXPORT_DIR = PROJECT_ROOT / "itpe-assistant" / "public" / "data" / "exam"
+
+# 샤드 구성이나 필드를 바꾸면 올려서 웹 앱이 형식 변경을 알 수 있게
+EXPORT_VERSION = 2
+
+# 키워드 버킷 수 (웹 앱은 매니페스트의 값을 사용)
+KEYWORD_SHARDS = 16
+
+# 파일 이름에 넣는 내용 해시 길이 (16진수 글자 수)
+HASH_LENGTH = 12
+
+SHARD_DIRS = ("rounds", "categories", "keywords")
+
+
+def minify(data):
+    """공백 없는 UTF-8 JSON 바이트열 (키 순서 고정)"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def fnv1a(text):
+    """FNV-1a 32비트 해시 (UTF-8 바이트 기준, 웹 앱의 keywordBucket과 같은 값)"""
+    value = 0x811C9DC5
+    for byte in text.encode("utf-8"):
+        value = ((value ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return value
+
+
+def keyword_bucket(term, shards=KEYWORD_SHARDS):
+    """정규화 키워드의 버킷 번호"""
+    return fnv1a(term) % shards
+
+
+def category_id(category):
+    """파일 이름용 카테고리 식별자
+
+    "5. 정보보안" -> "5", 미분류 -> "etc", 그 밖의 번호 없는 분류는 이름의 FNV-1a 해시 ("c1a2b3c4d")
+    """
+    prefix = category.split(".", 1)[0]
+    if prefix.isdigit():
+        return prefix
+    if category == exam_store.UNCATEGORIZED:
+        return "etc"
+    return f"c{fnv1a(category):08x}"
+
+
+def check_category_ids(categories):
+    """카테고리 식별자가 겹치면 ValueError (같은 샤드 파일을 두 카테고리가 덮어쓰지 않도록)"""
+    seen = {}
+    for category in categories:
+        other = seen.setdefault(category_id(category), category)
+        if other != category:
+            raise ValueError(f"카테고리 식별자 {category_id(category)!r}가 겹칩니다: {other}, {category}")
+
+
+def question_ref(question):
+    """다른 샤드에서 문제를 가리키는 [회차, 교시, 번호, 제목]"""
+    return [question.exam_number, question.period, question.number, question.title]
+
+
+def round_shard(exam_num, questions, cube):
+    """회차 샤드"""
+    return {
+        "round": exam_num,
+        "total": cube.total(exam_num),
+        "categories": {category_id(c): n for c, n in cube.category_counts(exam_num).items()},
+        "questions": [
+            {
+                "period": q.period,
+                "number": q.number,
+                "title": q.title,
+                "keywords": list(q.keywords),
+                "details": list(q.details),
+                "category": category_id(q.category or exam_store.UNCATEGORIZED),
+                "matched": list(q.matched_keywords or ()),
+            }
+            for q in questions
+        ],
+    }
+
+
+def category_shard(category, rounds, questions, cube):
+    """카테고리 샤드 (회차 오름차순 추이와 출제 문제)"""
+    averages = dict(cube.moving_average(category, MOVING_AVERAGE_WINDOW, rounds))
+    return {
+        "id": category_id(category),
+        "name": category,
+        "window": MOVING_AVERAGE_WINDOW,
+        "trend": [
+            {
+                "round": exam_num,
+                "count": cube.category_counts(exam_num)[category],
+                "share": round(share, 2),
+                "average": round(averages[exam_num], 2),
+                # 앞쪽 회차는 window보다 적은 회차만 평균함
+                "window": min(i + 1, MOVING_AVERAGE_WINDOW),
+            }
+            for i, (exam_num, share) in enumerate(cube.share_trend(category, rounds))
+        ],
+        "questions": [question_ref(q) for q in questions],
+    }
+
+
+def keyword_shards(index, rounds, shards=KEYWORD_SHARDS):
+    """버킷별 {정규화 키워드: {"label", "labels", "postings"}} (분석된 회차의 출제 위치만)"""
+    classifier = get_classifier()
+    wanted = set(rounds)
+    buckets = [{} for _ in range(shards)]
+    for term, postings in index["postings"].items():
+        postings = [p for p in postings if p[0] in wanted]
+        if not postings:
+            continue
+        label = index["labels"][term]
+        buckets[keyword_bucket(term, shards)][term] = {
+            "label": label,
+            "labels": classifier.classify(label),
+            "postings": [list(p) + [index["titles"][p]] for p in postings],
+        }
+    return buckets
+
+
+def build_shards():
+    """({"rounds/137" 같은 샤드 이름: 샤드 데이터}, 매니페스트 본문) (파일 이름은 write_export에서 결정)"""
+    data = corpus.get_corpus()
+    cube = aggregate_cube.load_cube()
+    rounds = corpus.exam_numbers(analyzed_only=True)
+    index, _ = keyword_index.load_index()
+    check_category_ids(cube.categories)
+
+    shards = {}
+    for exam_num in rounds:
+        shards[f"rounds/{exam_num}"] = round_shard(exam_num, data["by_exam"].get(exam_num, []), cube)
+
+    by_category = {category: [] for category in cube.categories}
+    for exam_num in rounds:
+        for question in data["by_exam"].get(exam_num, []):
+            category = question.category if question.category in by_category else exam_store.UNCATEGORIZED
+            by_category[category].append(question)
+    for category in cube.categories:
+        shards[f"categories/{category_id(category)}"] = category_shard(
+            category, rounds, by_category[category], cube)
+
+    buckets = keyword_shards(index, rounds)
+    for bucket, terms in enumerate(buckets):
+        shards[f"keywords/{bucket:02x}"] = terms
+
+    manifest = {
+        "version": EXPORT_VERSION,
+        "rounds": [{"round": exam_num, "total": cube.total(exam_num)} for exam_num in rounds],
+        "categories": [
+            {"id": category_id(category), "name": category,
+             "total": sum(cube.category_counts(n)[category] for n in rounds)}
+            for category in cube.categories
+        ],
+        # 회차별 카테고리 문제 수 (categories 순서), 개요 차트는 샤드 없이 그림
+        "counts": {exam_num: list(cube.category_counts(exam_num).values()) for exam_num in rounds},
+        "keywords": {"shards": KEYWORD_SHARDS, "hash": "fnv1a32", "count": sum(len(terms) for terms in buckets)},
+    }
+    return shards, manifest
+
+
+def write_bytes(path, payload):
+    """원자적 쓰기 (웹 서버가 읽는 중에도 반쯤 쓴 파일이 보이지 않도록)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def manifest_files(manifest):
+    """매니페스트가 가리키는 샤드 파일 (상대 경로)"""
+    files = [entry["file"] for key in ("rounds", "categories") for entry in manifest.get(key, [])]
+    return files + list(manifest.get("keywords", {}).get("files", []))
+
+
+def write_export(shards, manifest, out_dir=EXPORT_DIR):
+    """샤드를 내용 해시 이름으로 쓰고 매니페스트를 마지막에 교체 -> (새로 쓴 수, 그대로인 수, 지운 수, 바이트)"""
+    manifest_path = out_dir / "manifest.json"
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+
+    for name in SHARD_DIRS:
+        (out_dir / name).mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    written = unchanged = size = 0
+    for prefix, data in shards.items():
+        payload = minify(data)
+        digest = hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+        files[prefix] = f"{prefix}.{digest}.json"
+        size += len(payload)
+        path = out_dir / files[prefix]
+        if path.exists():
+            unchanged += 1
+            continue
+        write_bytes(path, payload)
+        written += 1
+
+    for entry in manifest["rounds"]:
+        entry["file"] = files[f"rounds/{entry['round']}"]
+    for entry in manifest["categories"]:
+        entry["file"] = files[f"categories/{entry['id']}"]
+    manifest["keywords"]["files"] = [files[f"keywords/{bucket:02x}"] for bucket in range(KEYWORD_SHARDS)]
+    payload = minify(manifest)
+    write_bytes(manifest_path, payload)
+    size += len(payload)
+
+    # 직전 매니페스트를 받아 둔 화면이 깨지지 않도록 한 세대 전 샤드까지는 남김
+    keep = set(manifest_files(manifest)) | set(manifest_files(previous))
+    removed = 0
+    for name in SHARD_DIRS:
+        for path in (out_dir / name).glob("*.json"):
+            if f"{name}/{path.name}" not in keep:
+                path.unlink()
+                removed += 1
+    return written, unchanged, removed, size
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    out_dir = EXPORT_DIR
+    if "--out" in args:
+        out_index = args.index("--out") + 1
+        if out_index >= len(args) or args[out_index].startswith("--"):
+            print("사용법: python export_web.py [--out DIR]")
+            sys.exit(1)
+        out_dir = Path(args[out_index])
+
+    with profiling.stage("build shards"):
+        shards, manifest = build_shards()
+    if not manifest["rounds"]:
+        print("⚠️  분석된 회차가 없습니다. 먼저 analyze.py를 실행하세요.")
+        sys.exit(1)
+
+    with profiling.stage("write shards"):
+        written, unchanged, removed, size = write_export(shards, manifest, out_dir)
+
+    print(f"✓ 웹 데이터 내보내기 완료: {out_dir}")
+    print(f"  - 회차 {len(manifest['rounds'])}개, 카테고리 {len(manifest['categories'])}개, "
+          f"키워드 {manifest['keywords']['count']}개 ({KEYWORD_SHARDS}개 버킷)")
+    print(f"  - 샤드 새로 씀 {written}개, 그대로 {unchanged}개, 지움 {removed}개")
+    print(f"  - 전체 {size / 1024:.1f}KB")
+
+
+if __name__ == "__main__":
+    with profiling.session("export_web"):
+        main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+키워드 다중 레이블 분류기
+
+키워드마다 해당하는 분류를 모두 붙입니다.
+- 주제: AI/ML, 정보보안, 데이터, 소프트웨어 (THEME_TERMS의 용어가 키워드에 포함되면 해당)
+- 출제기준 영역: 6개 카테고리 (SyllabusIndex.matching_terms와 같은 양방향 매칭)
+
+주제 용어 전체를 Aho-Corasick 오토마톤 하나로 컴파일해 두고, 키워드를 소문자로 한 번
+바꾼 뒤 한 번 훑어 모든 주제를 찾습니다. 출제기준 영역은 컴파일된 출제기준 인덱스로
+찾으므로, 키워드 수가 늘어나도 키워드 하나당 비용은 키워드 길이에만 비례합니다.
+같은 키워드는 다시 계산하지 않습니다.
+
+사용법:
+    from keyword_classifier import classify_keywords, group_by_label
+
+    labels = classify_keywords(["LLM", "데이터 레이크"])
+    # {"LLM": ["AI/ML", "6. 최신기술, 법규 및 정책"], "데이터 레이크": ["데이터", "3. 자료처리"]}
+    group_by_label(labels)  # {"AI/ML": ["LLM"], "정보보안": [], "데이터": ["데이터 레이크"], ...}
+
+    python keyword_classifier.py 키워드1 키워드2 ...   # 분류 결과 출력
+"""
+
+import sys
+
+import profiling
+from syllabus_compiler import AhoCorasick, get_syllabus_index
+
+# 주제별 용어 (소문자로 비교, 키워드에 부분 문자열로 포함되면 해당 주제)
+THEME_TERMS = {
+    "AI/ML": ['ai', 'llm', 'model', 'learning', '머신', '딥', '인공지능', 'transformer', 'neural'],
+    "정보보안": ['보안', '암호', '인증', 'security', 'zero', 'trust', '공격'],
+    "데이터": ['데이터', 'data', '데이터베이스', 'database'],
+    "소프트웨어": ['소프트웨어', 'software', 'dev', '테스트', '감리', '개발'],
+}
+
+
+class KeywordClassifier:
+    """주제 용어와 출제기준 인덱스를 한 번 컴파일해 두고 키워드를 분류"""
+
+    def __init__(self, themes=None, syllabus_index=None, syllabus=True):
+        """syllabus=False면 주제 용어로만 분류 (출제기준 영역 매칭 생략)"""
+        themes = THEME_TERMS if themes is None else themes
+        self._index = None
+        if syllabus:
+            self._index = syllabus_index if syllabus_index is not None else get_syllabus_index()
+        self.themes = list(themes)
+        self.categories = list(self._index.categories) if self._index is not None else []
+        self.labels = self.themes + self.categories
+
+        # 주제 용어 -> 주제 집합 (여러 주제에 같은 용어가 있어도 패턴은 하나)
+        pattern_ids = {}
+        self._pattern_labels = []
+        for label, terms in themes.items():
+            for term in terms:
+                lowered = term.lower()
+                if lowered not in pattern_ids:
+                    pattern_ids[lowered] = len(self._pattern_labels)
+                    self._pattern_labels.append(set())
+                self._pattern_labels[pattern_ids[lowered]].add(label)
+        self._automaton = AhoCorasick(list(pattern_ids))
+
+        self._cache = {}
+
+    def classify(self, keyword):
+        """키워드의 분류 목록 (self.labels 순서)"""
+        labels = self._cache.get(keyword)
+        if labels is not None:
+            return labels
+
+        found = set()
+        for _, pattern_id in self._automaton.iter_matches(keyword.lower()):
+            found |= self._pattern_labels[pattern_id]
+        index = self._index
+        if index is not None:
+            for term_id in index.matching_terms(keyword):
+                found.update(index.term_categories[index.terms[term_id][0]])
+
+        labels = self._cache[keyword] = [label for label in self.labels if label in found]
+        return labels
+
+    def classify_all(self, keywords):
+        """키워드 목록 -> {키워드: 분류 목록}"""
+        return {keyword: self.classify(keyword) for keyword in keywords}
+
+
+_CLASSIFIER = None
+
+
+def get_classifier():
+    """기본 분류기 (프로세스당 1회 생성)"""
+    global _CLASSIFIER
+    if _CLASSIFIER is None:
+        with profiling.stage("compile keyword classifier"):
+            _CLASSIFIER = KeywordClassifier()
+    return _CLASSIFIER
+
+
+def classify_keywords(keywords):
+    """키워드 목록 -> {키워드: 분류 목록} (기본 분류기 사용)"""
+    return get_classifier().classify_all(keywords)
+
+
+def group_by_label(keyword_labels, labels=None):
+    """{키워드: 분류 목록} -> {분류: [키워드, ...]} (키워드는 입력 순서, 빈 분류 포함)"""
+    labels = get_classifier().labels if labels is None else labels
+    groups = {label: [] for label in labels}
+    for keyword, assigned in keyword_labels.items():
+        for label in assigned:
+            groups.setdefault(label, []).append(keyword)
+    return groups
+
+
+def main():
+    """메인 함수"""
+    keywords = sys.argv[1:]
+    if not keywords:
+        print("사용법: python keyword_classifier.py 키워드1 키워드2 ...")
+        sys.exit(1)
+
+    for keyword, labels in classify_keywords(keywords).items():
+        print(f"{keyword:30s} {', '.join(labels) if labels else '-'}")
+
+
+if __name__ == "__main__":
+    with profiling.session("keyword_classifier"):
+        main()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+키워드 역색인 (keyword -> (회차, 교시, 번호) 목록)과 조회 CLI
+
+analyze_duplicates.py / analyze_tech_keywords.py의 키워드 추출기와 문제목록의 키워드로
+문제마다 키워드를 뽑아, 정규화한 키워드(소문자, 공백 하나) -> 출제 위치 목록을
+data/exam_results/.keyword_index.pickle에 저장합니다. 저장소가 바뀌면 회차별 내용
+지문을 비교해 추가/변경/삭제된 회차의 색인만 다시 만듭니다. 회차 지문에는 용어 사전과
+출제기준 인덱스의 지문도 들어가므로 기술용어사전.txt나 출제기준 파일을 고치면 전체를 다시 색인합니다.
+
+질의 문법:
+    HNSW, keyword:HNSW          키워드 일치 (대소문자 무시)
+    keyword:"Zero Trust"        공백이 있는 키워드는 따옴표로
+    제로*, prefix:zero          접두어 일치
+    A AND B, A B                둘 다 포함 (AND 생략 가능)
+    A OR B                      하나 이상 포함 (AND보다 우선순위 낮음)
+    (LLM OR RAG) AND 보안*      괄호로 묶기
+
+사용법:
+    python keyword_index.py 'keyword:HNSW'
+    python keyword_index.py '(LLM OR RAG) AND 보안*'
+    python keyword_index.py --top 20    # 출제 위치가 많은 키워드 상위 20개
+    python keyword_index.py --rebuild   # 색인 강제 재생성
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+
+import corpus
+import exam_store
+import profiling
+from analyze_duplicates import extract_keywords_from_title
+from analyze_tech_keywords import EXCLUDE_TERMS, extract_tech_keywords
+from syllabus_compiler import syllabus_index_fingerprint
+from term_dictionary import dictionary_fingerprint
+
+# 색인 형식이나 키워드 추출 규칙을 바꾸면 올려서 기존 색인을 무효화
+INDEX_VERSION = 3
+
+OPERATORS = ("AND", "OR")
+
+# 문제 문장에서 나오는 서술어 (키워드로 색인하지 않음)
+PREDICATE_ENDINGS = ("하시오", "하여", "하고")
+
+
+def index_path():
+    """현재 저장소 옆의 색인 경로"""
+    return exam_store.STORE_PATH.with_name(".keyword_index.pickle")
+
+
+def normalize_keyword(keyword):
+    """키워드 정규화 (소문자, 연속 공백을 하나로)"""
+    return " ".join(keyword.lower().split())
+
+
+def question_keywords(question):
+    """문제의 정규화 키워드 -> 표시용 원래 표기 (제목과 세부문항을 줄 단위로 추출)"""
+    found = set(question.keywords)
+    for line in (question.title,) + question.details:
+        found |= extract_keywords_from_title(line)
+        found |= extract_tech_keywords(line)
+
+    keywords = {}
+    for keyword in sorted(found):
+        normalized = normalize_keyword(keyword)
+        if normalized and keyword not in EXCLUDE_TERMS and not keyword.endswith(PREDICATE_ENDINGS):
+            keywords.setdefault(normalized, keyword.strip())
+    return keywords
+
+
+def extractor_fingerprint():
+    """키워드 추출 규칙의 원본(용어 사전, 출제기준 인덱스) 지문"""
+    return f"{dictionary_fingerprint()}/{syllabus_index_fingerprint()}"
+
+
+def round_fingerprint(questions, extractors):
+    """회차 문제 내용 + 추출 규칙의 지문 (바뀐 회차만 다시 색인)"""
+    payload = json.dumps(
+        [extractors, [(q.period, q.number, q.title, q.keywords, q.details) for q in questions]],
+        ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def posting_sort_key(posting):
+    """출제 위치 정렬 키 (회차, 교시, 번호 순)"""
+    exam_num, period, number = posting
+    return exam_store.exam_sort_key(exam_num), period, int(number) if number.isdigit() else 0
+
+
+def empty_index():
+    """빈 색인 (클래스 참조 없는 기본 자료형만 사용)"""
+    return {
+        "version": INDEX_VERSION,
+        "store": None,
+        "extractors": None,  # extractor_fingerprint()
+        "rounds": {},        # 회차 -> 내용 지문
+        "round_terms": {},   # 회차 -> 그 회차에서 나온 정규화 키워드 목록
+        "postings": {},      # 정규화 키워드 -> [(회차, 교시, 번호), ...]
+        "labels": {},        # 정규화 키워드 -> 표시용 표기
+        "titles": {},        # (회차, 교시, 번호) -> 제목
+    }
+
+
+def remove_round(index, exam_num):
+    """회차의 색인 항목 제거"""
+    for term in index["round_terms"].pop(exam_num, []):
+        postings = [p for p in index["postings"][term] if p[0] != exam_num]
+        if postings:
+            index["postings"][term] = postings
+        else:
+            del index["postings"][term]
+            del index["labels"][term]
+    index["titles"] = {p: title for p, title in index["titles"].items() if p[0] != exam_num}
+    index["rounds"].pop(exam_num, None)
+
+
+def add_round(index, exam_num, questions, fingerprint):
+    """회차의 문제를 색인에 추가"""
+    touched = set()
+    for question in questions:
+        posting = (question.exam_number, question.period, question.number)
+        index["titles"][posting] = question.title
+        for term, label in question_keywords(question).items():
+            index["postings"].setdefault(term, []).append(posting)
+            index["labels"].setdefault(term, label)
+            touched.add(term)
+    for term in touched:
+        index["postings"][term].sort(key=posting_sort_key)
+    index["round_terms"][exam_num] = sorted(touched)
+    index["rounds"][exam_num] = fingerprint
+
+
+def update_index(index, questions_by_exam, extractors):
+    """저장소 내용이나 추출 규칙이 달라진 회차만 다시 색인 -> 변경된 회차 목록"""
+    changed = []
+    for exam_num in list(index["rounds"]):
+        if exam_num not in questions_by_exam:
+            remove_round(index, exam_num)
+            changed.append(exam_num)
+
+    for exam_num, questions in questions_by_exam.items():
+        fingerprint = round_fingerprint(questions, extractors)
+        if index["rounds"].get(exam_num) == fingerprint:
+            continue
+        remove_round(index, exam_num)
+        add_round(index, exam_num, questions, fingerprint)
+        changed.append(exam_num)
+    return sorted(changed, key=exam_store.exam_sort_key)
+
+
+def write_index(index, path):
+    """색인 저장 (다른 프로세스가 읽는 중에도 안전하도록 임시 파일 후 교체)"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_index(rebuild=False):
+    """저장된 색인을 읽고 저장소나 추출 규칙이 바뀌었으면 바뀐 회차만 갱신 -> (색인, 갱신된 회차 목록)"""
+    path = index_path()
+    index = None
+    if not rebuild and path.exists():
+        try:
+            with open(path, "rb") as f:
+                index = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            index = None
+    if index is None or index.get("version") != INDEX_VERSION:
+        index = empty_index()
+
+    data = corpus.get_corpus()
+    extractors = extractor_fingerprint()
+    if index["store"] == data["key"][1] and index["extractors"] == extractors:
+        return index, []
+
+    with profiling.stage("index keywords"):
+        changed = update_index(index, data["by_exam"], extractors)
+    index["store"] = data["key"][1]
+    index["extractors"] = extractors
+    write_index(index, path)
+    return index, changed
+
+
+# ---------------------------------------------------------------------------
+# 질의
+# ---------------------------------------------------------------------------
+
+def tokenize(query):
+    """질의 -> 토큰 목록 ("(", ")", "AND", "OR", ("term"|"prefix", 값))"""
+    tokens = []
+    i = 0
+    while i < len(query):
+        char = query[i]
+        if char.isspace():
+            i += 1
+        elif char in "()":
+            tokens.append(char)
+            i += 1
+        else:
+            start = i
+            while i < len(query) and not query[i].isspace() and query[i] not in "()":
+                if query[i] == '"':
+                    end = query.find('"', i + 1)
+                    if end == -1:
+                        raise ValueError(f"닫히지 않은 따옴표: {query[i:]}")
+                    i = end
+                i += 1
+            word = query[start:i]
+            if word.upper() in OPERATORS:
+                tokens.append(word.upper())
+                continue
+
+            kind = "term"
+            for field in ("keyword:", "kw:", "prefix:"):
+                if word.lower().startswith(field):
+                    kind = "prefix" if field == "prefix:" else kind
+                    word = word[len(field):]
+                    break
+            if word.endswith("*"):
+                kind, word = "prefix", word[:-1]
+            value = normalize_keyword(word.replace('"', ""))
+            if not value:
+                raise ValueError(f"빈 검색어: {query[start:i]}")
+            tokens.append((kind, value))
+    return tokens
+
+
+class QueryParser:
+    """키워드 질의 해석 (OR < AND < 괄호/검색어 우선순위)"""
+
+    def __init__(self, index):
+        self.postings = index["postings"]
+        self.terms = sorted(self.postings)
+
+    def expand(self, kind, value):
+        """검색어에 해당하는 정규화 키워드 목록"""
+        if kind == "term":
+            return [value] if value in self.postings else []
+        start = bisect.bisect_left(self.terms, value)
+        end = start
+        while end < len(self.terms) and self.terms[end].startswith(value):
+            end += 1
+        return self.terms[start:end]
+
+    def parse(self, query):
+        """질의 -> (출제 위치 집합, 사용된 정규화 키워드 목록)"""
+        self.tokens = tokenize(query)
+        self.position = 0
+        self.matched_terms = []
+        if not self.tokens:
+            raise ValueError("검색어가 없습니다")
+        result = self.parse_or()
+        if self.position < len(self.tokens):
+            raise ValueError(f"해석할 수 없는 토큰: {self.tokens[self.position]}")
+        return result, self.matched_terms
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def parse_or(self):
+        result = self.parse_and()
+        while self.peek() == "OR":
+            self.position += 1
+            result = result | self.parse_and()
+        return result
+
+    def parse_and(self):
+        result = self.parse_atom()
+        while self.peek() not in (None, "OR", ")"):
+            if self.peek() == "AND":
+                self.position += 1
+            result = result & self.parse_atom()
+        return result
+
+    def parse_atom(self):
+        token = self.peek()
+        if token is None or token in OPERATORS or token == ")":
+            raise ValueError(f"검색어가 필요한 위치: {token or '질의 끝'}")
+        self.position += 1
+        if token == "(":
+            result = self.parse_or()
+            if self.peek() != ")":
+                raise ValueError("닫히지 않은 괄호")
+            self.position += 1
+            return result
+
+        result = set()
+        for term in self.expand(*token):
+            self.matched_terms.append(term)
+            result.update(self.postings[term])
+        return result
+
+
+def search(index, query):
+    """질의 -> (출제 위치 목록(회차 순), 사용된 정규화 키워드 목록)"""
+    postings, terms = QueryParser(index).parse(query)
+    return sorted(postings, key=posting_sort_key), terms
+
+
+def print_results(index, query, postings, terms, seconds):
+    """조회 결과 출력"""
+    print(f'🔎 "{query}": {len(postings)}문제 ({seconds * 1000:.2f}ms)')
+    if terms:
+        labels = [index["labels"][term] for term in terms[:10]]
+        more = f" 외 {len(terms) - 10}개" if len(terms) > 10 else ""
+        print(f"   키워드: {', '.join(labels)}{more}")
+    print("-" * 100)
+    for posting in postings:
+        exam_num, period, number = posting
+        title = index["titles"][posting]
+        title_short = title[:70] + "..." if len(title) > 70 else title
+        print(f"  {exam_num}회 {period} {number}: {title_short}")
+
+
+def print_top(index, count):
+    """출제 위치가 많은 키워드 상위 count개 출력"""
+    print(f"📊 출제 위치가 많은 키워드 TOP {count} (전체 {len(index['postings'])}개)")
+    print("-" * 100)
+    ranked = sorted(index["postings"].items(), key=lambda item: (-len(item[1]), item[0]))
+    for i, (term, postings) in enumerate(ranked[:count], 1):
+        exams = sorted({p[0] for p in postings}, key=exam_store.exam_sort_key)
+        print(f"{i:3d}. {index['labels'][term]:30s} {len(postings):3d}문제  (회차: {', '.join(exams)})")
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    rebuild = "--rebuild" in args
+    top = int(args[args.index("--top") + 1]) if "--top" in args else None
+    query = " ".join(arg for i, arg in enumerate(args)
+                     if arg != "--rebuild" and arg != "--top" and (i == 0 or args[i - 1] != "--top"))
+
+    index, changed = load_index(rebuild=rebuild)
+    if changed:
+        print(f"✓ 키워드 색인 갱신: {', '.join(f'{n}회' for n in changed)} ({index_path()})")
+        print()
+
+    if top:
+        print_top(index, top)
+    elif query:
+        start = time.perf_counter()
+        try:
+            postings, terms = search(index, query)
+        except ValueError as e:
+            print(f"⚠️  질의 오류: {e}")
+            sys.exit(1)
+        print_results(index, query, postings, terms, time.perf_counter() - start)
+    elif not changed:
+        print(f"✓ 키워드 색인 최신 상태: 키워드 {len(index['postings'])}개, "
+              f"회차 {len(index['rounds'])}개 ({index_path()})")
+
+
+if __name__ == "__main__":
+    with profiling.session("keyword_index"):
+        main()
@@ -1,64 +1,288 @@
 #!/usr/bin/env python3
 """
 exam.txt 파일을 파싱하여 회차별 문제 데이터를 추출하는 스크립트
-정보관리기술사 (관리) 종목만 추출
+기본은 정보관리기술사 (관리) 종목만 추출하고, --all-subjects는 한 번의 파싱으로 모든 종목 추출
+
+exam.txt는 회차\t종목\t교시\t문제 형식의 TSV이며, 세부 문항이 있는 문제는
+따옴표로 감싼 여러 줄 필드로 들어 있습니다. 회차/종목 열이 없는 줄
+(가. …, 1) …, (단, …) 등)은 바로 앞 문제의 세부문항으로 붙입니다.
+파일 전체를 읽지 않고 문제 단위로 스트리밍하며, 회차가 끝날 때마다 종목/회차 파티션을
+저장 스레드 풀(대기 작업 수 제한)로 바로 저장합니다.
+
+저장 위치:
+- 관리 종목: data/exam_results/{회차}회_문제목록.json (기존 위치)
+- 다른 종목: data/exam_results/{종목}/{회차}회_문제목록.json
+- 매니페스트: data/exam_results/문제목록_manifest.json (종목 -> 회차 -> 교시별 문제 수)
+
+증분 파싱: 파싱이 끝나면 마지막 회차 구간의 시작 바이트 위치와 그 앞부분의 SHA-256을
+data/exam_results/.parse_checkpoint.json에 기록합니다. 다음 실행에서 앞부분 해시가 같으면
+그 위치부터만 파싱해 새로 추가되거나 이어 쓴 회차 파일만 다시 저장하고, 앞부분이
+수정되었거나 이미 저장한 회차가 다시 나오면 전체를 다시 파싱합니다.
+
+사용법:
+    python parse_exam_txt.py                 # 순차 파싱
+    python parse_exam_txt.py --jobs 8        # 파일을 mmap 구간으로 나눠 프로세스 8개로 파싱 (결과 동일)
+    python parse_exam_txt.py --all-subjects  # 모든 종목을 한 번에 파싱해 종목별로 저장
+    python parse_exam_txt.py --writers 8     # 저장 스레드 수 (기본 4)
+    python parse_exam_txt.py --full          # 체크포인트를 무시하고 전체 다시 파싱
 """
+import hashlib
+import io
 import json
-from collections import defaultdict
+import mmap
+import os
 import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
-def parse_exam_txt(file_path):
-    """exam.txt 파일을 파싱하여 회차별 데이터를 추출 (관리 종목만)"""
-    exam_data = defaultdict(lambda: defaultdict(list))
+import profiling
+
+PROJECT_ROOT = Path(__file__).parent.parent
+EXAM_TXT_PATH = PROJECT_ROOT / "data" / "exam.txt"
+DATA_DIR = PROJECT_ROOT / "data" / "exam_results"
+MANIFEST_PATH = DATA_DIR / "문제목록_manifest.json"
+CHECKPOINT_PATH = DATA_DIR / ".parse_checkpoint.json"
+
+# 체크포인트 형식이나 파싱 규칙을 바꾸면 올려서 다음 실행을 전체 파싱으로
+CHECKPOINT_VERSION = 1
+
+# 기본 종목 (정보관리기술사) - 이 종목만 기존 위치(data/exam_results/)에 저장
+DEFAULT_SUBJECT = "관리"
+
+# 파티션 저장 스레드 수 (--writers로 변경)
+WRITER_THREADS = 4
+
+# 병렬 파싱 시 구간 최소 크기 (작은 파일은 프로세스를 띄우지 않고 순차 파싱)
+CHUNK_MIN_BYTES = 1 << 20
+
+QUESTION_NUMBER = re.compile(r'^(\d+)\.?\s*(.+)$', re.DOTALL)
+
+
+def iter_raw_records(lines):
+    """(회차, 종목, 교시, 문제 줄 목록)을 한 문제씩 반환
+
+    열이 4개 미만인 줄과 따옴표로 감싼 필드 안의 줄은 앞 문제에 이어 붙입니다.
+    """
+    record = None
+    in_quotes = False
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+
+        if record is not None and (in_quotes or line.count('\t') < 3):
+            record[3].append(line)
+            if in_quotes and line.rstrip().endswith('"'):
+                in_quotes = False
+            continue
+
+        if record is not None:
+            yield record
+
+        parts = line.split('\t', 3)
+        if len(parts) < 4:
+            # 첫 문제 앞의 열 없는 줄
+            record = None
+            continue
+
+        question = parts[3].strip()
+        in_quotes = question.startswith('"') and (len(question) == 1 or not question.endswith('"'))
+        record = (parts[0].strip(), parts[1].strip(), parts[2].strip(), [question])
+
+    if record is not None:
+        yield record
+
+
+def split_question(question_lines):
+    """문제 줄 목록 -> (문제 본문, 세부문항 목록) - 감싼 따옴표와 이스케이프("") 제거"""
+    text = "\n".join(question_lines).strip()
+    if text.startswith('"'):
+        text = text[1:]
+        if text.endswith('"'):
+            text = text[:-1]
+        text = text.replace('""', '"')
+
+    stem, *details = text.split("\n")
+    return stem.strip(), [detail.strip() for detail in details if detail.strip()]
+
+
+def iter_records(raw_records, subject=DEFAULT_SUBJECT):
+    """원본 레코드 -> 문제 레코드 (번호가 없는 문제는 "번호"가 None)
+
+    레코드: {"회차", "종목", "교시", "번호", "제목", "세부문항", "키워드"}
+    subject=None이면 모든 종목을 반환합니다.
+    """
+    for exam_num, record_subject, period_num, question_lines in raw_records:
+        # 숫자로만 구성된 회차만 처리
+        if not exam_num.isdigit():
+            continue
+
+        # 관리 종목만 처리 (정보관리기술사)
+        if subject is not None and record_subject != subject:
+            continue
+
+        stem, details = split_question(question_lines)
+
+        # 문제 번호와 내용 분리
+        match = QUESTION_NUMBER.match(stem)
+        if match:
+            q_num = match.group(1)
+            q_content = match.group(2).strip()
+        else:
+            # 문제 번호가 없는 경우 (number_records에서 부여)
+            q_num = None
+            q_content = stem
+
+        # 키워드 추출 (세부문항/조건 포함)
+        with profiling.stage("extract keywords"):
+            keywords = extract_keywords("\n".join([q_content] + details))
+
+        yield {
+            "회차": exam_num,
+            "종목": record_subject,
+            "교시": f"{period_num}교시",
+            "번호": q_num,
+            "제목": q_content,
+            "세부문항": details,
+            "키워드": keywords,
+        }
+
+
+def number_records(records):
+    """번호가 없는 문제에 현재 회차의 종목/교시 안에서의 순번을 번호로 부여"""
+    counts = {}
+    current_exam = None
+    for record in records:
+        if record["회차"] != current_exam:
+            current_exam = record["회차"]
+            counts = {}
+        key = (record["종목"], record["교시"])
+        counts[key] = counts.get(key, 0) + 1
+        if record["번호"] is None:
+            record["번호"] = str(counts[key])
+        yield record
+
 
+def iter_exam_records(file_path, subject=DEFAULT_SUBJECT):
+    """exam.txt에서 문제 레코드를 하나씩 반환 (메모리 사용량은 파일 크기와 무관)"""
     with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            # TSV 형식: 회차 \t 종목 \t 교시 \t 문제
-            parts = line.split('\t')
-            if len(parts) < 4:
-                continue
-
-            exam_num_str = parts[0].strip()
-            subject = parts[1].strip()
-            period_num = parts[2].strip()
-            question = parts[3].strip()
-
-            # 숫자로만 구성된 회차만 처리
-            if not exam_num_str.isdigit():
-                continue
-
-            # 관리 종목만 처리 (정보관리기술사)
-            if subject != "관리":
-                continue
-
-            exam_num = exam_num_str
-            period = f"{period_num}교시"
-
-            # 문제 번호와 내용 분리
-            match = re.match(r'^(\d+)\.?\s*(.+)$', question, re.DOTALL)
-            if match:
-                q_num = match.group(1)
-                q_content = match.group(2).strip()
-            else:
-                # 문제 번호가 없는 경우
-                q_num = str(len(exam_data[exam_num][period]) + 1)
-                q_content = question
-
-            # 키워드 추출
-            keywords = extract_keywords(q_content)
-
-            exam_data[exam_num][period].append({
-                "번호": q_num,
-                "제목": q_content,
-                "키워드": keywords
-            })
-
-    return dict(exam_data)
+        yield from number_records(iter_records(iter_raw_records(f), subject))
+
+
+def ends_in_open_quote(question_lines):
+    """따옴표로 시작한 문제 필드가 닫히지 않은 채 끝났는지 (iter_raw_records와 같은 기준)"""
+    first = question_lines[0]
+    if not first.startswith('"') or (len(first) > 1 and first.endswith('"')):
+        return False
+    return not any(line.rstrip().endswith('"') for line in question_lines[1:])
+
+
+def chunk_bounds(mm, jobs):
+    """파일을 문제 시작 줄(열 4개 이상) 경계에서 최대 jobs개 구간으로 분할"""
+    size = len(mm)
+    chunk_count = max(1, min(jobs, size // CHUNK_MIN_BYTES))
+    bounds = [0]
+    for i in range(1, chunk_count):
+        pos = max(size * i // chunk_count, bounds[-1])
+        while pos < size:
+            newline = mm.find(b"\n", pos)
+            if newline == -1:
+                pos = size
+                break
+            pos = newline + 1
+            line_end = mm.find(b"\n", pos)
+            if mm[pos:size if line_end == -1 else line_end].count(b"\t") >= 3:
+                break
+        if bounds[-1] < pos < size:
+            bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def parse_chunk(file_path, start, end, subject=DEFAULT_SUBJECT):
+    """[start, end) 바이트 구간 파싱 (작업 프로세스)
+
+    (문제 레코드 목록, 마지막 문제의 따옴표 필드가 구간 끝에서 열려 있는지) 반환
+    """
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8')
+
+    last_lines = None
+
+    def tracked(raw_records):
+        nonlocal last_lines
+        for raw in raw_records:
+            last_lines = raw[3]
+            yield raw
+
+    # 텍스트 모드 open()과 같은 줄바꿈 처리
+    lines = io.StringIO(text, newline=None)
+    records = list(iter_records(tracked(iter_raw_records(lines)), subject))
+    return records, last_lines is not None and ends_in_open_quote(last_lines)
+
+
+def iter_exam_records_parallel(file_path, jobs, subject=DEFAULT_SUBJECT):
+    """파일을 mmap으로 나눠 프로세스 jobs개로 파싱 (결과는 iter_exam_records와 동일)
+
+    구간은 파일 순서대로 이어 붙이므로 순차 파싱과 같은 순서/번호가 됩니다.
+    따옴표로 감싼 여러 줄 문제가 구간 경계에 걸치면 순차 파싱으로 다시 처리합니다.
+    """
+    if os.path.getsize(file_path) == 0:
+        return
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        bounds = chunk_bounds(mm, jobs)
+
+    if len(bounds) == 1:
+        yield from iter_exam_records(file_path, subject)
+        return
+
+    starts, ends = zip(*bounds)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(bounds))) as executor:
+        results = list(executor.map(parse_chunk, repeat(file_path), starts, ends, repeat(subject)))
+
+    if any(open_quote for _, open_quote in results[:-1]):
+        print("⚠️  여러 줄 문제가 구간 경계에 걸쳐 있어 순차 파싱으로 다시 처리합니다")
+        yield from iter_exam_records(file_path, subject)
+        return
+
+    yield from number_records(record for records, _ in results for record in records)
+
+
+def question_entry(record):
+    """문제목록 JSON의 문제 항목 (세부문항은 있을 때만 포함)"""
+    entry = {"번호": record["번호"], "제목": record["제목"], "키워드": record["키워드"]}
+    if record["세부문항"]:
+        entry["세부문항"] = record["세부문항"]
+    return entry
+
+
+def iter_partitions(records):
+    """연속된 같은 회차의 레코드를 종목별로 모아 ((종목, 회차), 교시 -> 문제 목록)으로 반환
+
+    회차가 바뀔 때마다 앞 회차의 종목별 파티션을 처음 나온 순서대로 내보내므로
+    메모리에는 한 회차 분량만 유지됩니다.
+    """
+    exam_num, partitions = None, {}
+    for record in records:
+        if record["회차"] != exam_num:
+            yield from partitions.items()
+            exam_num, partitions = record["회차"], {}
+        exam_dict = partitions.setdefault((record["종목"], exam_num), {})
+        exam_dict.setdefault(record["교시"], []).append(question_entry(record))
+    yield from partitions.items()
+
+
+def parse_exam_txt(file_path, jobs=1):
+    """exam.txt 파일을 파싱하여 회차별 데이터를 추출 (관리 종목만)"""
+    records = iter_exam_records_parallel(file_path, jobs) if jobs > 1 else iter_exam_records(file_path)
+    exam_data = {}
+    for (_, exam_num), exam_dict in iter_partitions(records):
+        merged = exam_data.setdefault(exam_num, {})
+        for period, questions in exam_dict.items():
+            merged.setdefault(period, []).extend(questions)
+    return exam_data
 
 
 def extract_keywords(question_text):
@@ -89,13 +313,16 @@ def extract_keywords(question_text):
     return unique_keywords
 
 
-def save_exam_data(exam_num, exam_dict):
-    """특정 회차의 데이터를 JSON 파일로 저장"""
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "data" / "exam_results"
-    data_dir.mkdir(parents=True, exist_ok=True)
+def subject_dir(subject, data_dir=DATA_DIR):
+    """종목별 문제목록 저장 위치 (관리 종목은 기존 위치, 다른 종목은 종목 이름 하위 폴더)"""
+    if subject == DEFAULT_SUBJECT:
+        return data_dir
+    return data_dir / re.sub(r'[\\/:*?"<>|\s]+', '_', subject)
+
 
-    output = {
+def exam_output(exam_num, exam_dict):
+    """회차 문제목록 JSON 내용"""
+    return {
         "exam_number": exam_num,
         "questions": exam_dict,
         "metadata": {
@@ -104,38 +331,395 @@ def save_exam_data(exam_num, exam_dict):
         }
     }
 
-    output_path = data_dir / f"{exam_num}회_문제목록.json"
+
+def serialize_exam_output(output):
+    """문제목록 JSON 파일에 쓰는 문자열"""
+    return json.dumps(output, ensure_ascii=False, indent=2)
+
+
+def write_exam_data(exam_num, exam_dict, output_dir=DATA_DIR):
+    """특정 회차의 데이터를 JSON 파일로 저장하고 (저장 경로, 저장 내용) 반환 (출력 없음)"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output = exam_output(exam_num, exam_dict)
+    output_path = output_dir / f"{exam_num}회_문제목록.json"
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+        f.write(serialize_exam_output(output))
+    return output_path, output
 
-    print(f"✓ {exam_num}회 데이터 저장: {output_path}")
+
+def print_saved(exam_num, output_path, output, subject=DEFAULT_SUBJECT):
+    """저장 결과 출력"""
+    label = f"{exam_num}회" if subject == DEFAULT_SUBJECT else f"[{subject}] {exam_num}회"
+    print(f"✓ {label} 데이터 저장: {output_path}")
     print(f"  - 총 {output['metadata']['total_questions']}문제")
-    for period, questions in sorted(exam_dict.items()):
+    for period, questions in sorted(output["questions"].items()):
         print(f"  - {period}: {len(questions)}문제")
 
 
+def save_exam_data(exam_num, exam_dict):
+    """특정 회차의 데이터를 JSON 파일로 저장"""
+    output_path, output = write_exam_data(exam_num, exam_dict)
+    print_saved(exam_num, output_path, output)
+
+
+def load_saved_questions(exam_num, output_dir=DATA_DIR):
+    """이미 저장한 회차의 교시 -> 문제 목록"""
+    output_path = output_dir / f"{exam_num}회_문제목록.json"
+    with open(output_path, 'r', encoding='utf-8') as f:
+        return json.load(f)["questions"]
+
+
+class PartitionWriter:
+    """종목/회차 파티션을 스레드 풀로 저장하고 매니페스트용 문제 수를 집계
+
+    저장 대기 중인 파티션은 최대 threads * 2개까지만 유지하므로 파싱이 저장보다
+    빨라도 메모리 사용량이 늘어나지 않습니다. 저장 결과는 제출한 순서대로 출력합니다.
+    """
+
+    def __init__(self, threads=WRITER_THREADS):
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+        self.max_pending = threads * 2
+        self.pending = deque()
+        self.written = set()
+        self.counts = {}
+
+    def submit(self, subject, exam_num, exam_dict):
+        """파티션 저장 요청 (파일 안에서 떨어져 있는 같은 파티션은 앞서 저장한 문제 뒤에 이어 붙임)"""
+        output_dir = subject_dir(subject)
+        if (subject, exam_num) in self.written:
+            if any(key == (subject, exam_num) for key, _ in self.pending):
+                self.drain()
+            merged = load_saved_questions(exam_num, output_dir)
+            for period, questions in exam_dict.items():
+                merged.setdefault(period, []).extend(questions)
+            exam_dict = merged
+        self.written.add((subject, exam_num))
+
+        while len(self.pending) >= self.max_pending:
+            self.finish_oldest()
+        future = self.executor.submit(write_exam_data, exam_num, exam_dict, output_dir)
+        self.pending.append(((subject, exam_num), future))
+
+    def finish_oldest(self):
+        """가장 먼저 제출한 저장 작업이 끝나길 기다려 결과 출력/집계"""
+        (subject, exam_num), future = self.pending.popleft()
+        output_path, output = future.result()
+        print_saved(exam_num, output_path, output, subject)
+        print()
+        self.counts.setdefault(subject, {})[exam_num] = {
+            "file": output_path.relative_to(DATA_DIR).as_posix(),
+            "questions": output["metadata"]["total_questions"],
+            "periods": {period: len(qs) for period, qs in sorted(output["questions"].items())},
+        }
+
+    def drain(self):
+        """대기 중인 저장 작업을 모두 완료"""
+        while self.pending:
+            self.finish_oldest()
+
+    def close(self):
+        """남은 저장 작업 완료 후 스레드 풀 종료"""
+        try:
+            self.drain()
+        finally:
+            self.executor.shutdown()
+
+
+def exam_sort_key(exam_num):
+    """회차 정렬 키 (숫자 순)"""
+    return int(exam_num) if exam_num.isdigit() else float("inf")
+
+
+def build_manifest(source_path, counts):
+    """종목 -> 회차별 문제 수 매니페스트"""
+    subjects = {}
+    for subject, rounds in counts.items():
+        ordered = {exam_num: rounds[exam_num] for exam_num in sorted(rounds, key=exam_sort_key)}
+        subjects[subject] = {
+            "directory": subject_dir(subject).relative_to(DATA_DIR).as_posix(),
+            "total_questions": sum(r["questions"] for r in ordered.values()),
+            "rounds": ordered,
+        }
+    return {
+        "source": source_path.name,
+        "total_questions": sum(s["total_questions"] for s in subjects.values()),
+        "subjects": subjects,
+    }
+
+
+def save_json(data, path):
+    """JSON 저장 (다른 스크립트가 읽는 중에도 안전하도록 임시 파일 후 교체)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_manifest_counts(path=MANIFEST_PATH):
+    """저장된 매니페스트의 종목 -> 회차 -> 문제 수 (없거나 저장 파일이 빠졌으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    counts = {subject: dict(info["rounds"]) for subject, info in manifest["subjects"].items()}
+    for rounds in counts.values():
+        if not all((DATA_DIR / entry["file"]).exists() for entry in rounds.values()):
+            return None
+    return counts
+
+
+class OffsetTracker:
+    """exam.txt를 바이트 오프셋을 세며 줄 단위로 읽고, 마지막 회차 구간의 시작 위치를 추적
+
+    iter_raw_records는 다음 문제의 첫 줄을 읽은 뒤에 앞 문제를 반환하므로
+    문제를 받은 시점의 line_start가 곧 다음 문제의 시작 위치입니다.
+    """
+
+    def __init__(self, f, start=0, prefix_rounds=()):
+        self.f = f
+        self.start = start
+        self.offset = start
+        self.line_start = start
+        self.block_exam = None
+        self.block_start = start
+        self.prefix_rounds = set(prefix_rounds)
+
+    def lines(self):
+        """파일의 현재 위치부터 한 줄씩 반환"""
+        for raw in self.f:
+            self.line_start = self.offset
+            self.offset += len(raw)
+            yield raw.decode('utf-8')
+
+    def track(self, raw_records):
+        """원본 레코드를 그대로 넘기면서 회차 구간 경계 기록"""
+        record_start = self.start
+        for raw in raw_records:
+            next_start = self.line_start
+            if raw[0] != self.block_exam:
+                if self.block_exam is not None:
+                    self.prefix_rounds.add(self.block_exam)
+                self.block_exam, self.block_start = raw[0], record_start
+            yield raw
+            record_start = next_start
+
+
+def iter_tracked_records(tracker, subject=DEFAULT_SUBJECT):
+    """OffsetTracker로 읽으며 문제 레코드 반환 (iter_exam_records와 같은 결과)"""
+    return number_records(iter_records(tracker.track(iter_raw_records(tracker.lines())), subject))
+
+
+def range_sha256(file_path, start, end):
+    """파일 [start, end) 바이트 구간의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(remaining, 1 << 20))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def make_checkpoint(file_path, subject, tracker):
+    """다음 실행에서 이어서 파싱할 위치 (마지막 회차 구간 시작)와 그 앞부분의 해시"""
+    size = os.path.getsize(file_path)
+    return {
+        "version": CHECKPOINT_VERSION,
+        "subject": subject,
+        "size": size,
+        "offset": tracker.block_start,
+        "prefix_sha256": range_sha256(file_path, 0, tracker.block_start),
+        "tail_sha256": range_sha256(file_path, tracker.block_start, size),
+        "prefix_rounds": sorted(tracker.prefix_rounds, key=exam_sort_key),
+    }
+
+
+def load_checkpoint(file_path, subject, path=CHECKPOINT_PATH):
+    """이어서 파싱할 수 있으면 (체크포인트, None), 아니면 (None, 전체 파싱 사유)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None, "체크포인트 없음"
+
+    if checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("subject") != subject:
+        return None, "체크포인트 형식/종목 설정이 다름"
+    if os.path.getsize(file_path) < checkpoint["offset"]:
+        return None, "exam.txt가 체크포인트보다 짧아짐"
+    with profiling.stage("checkpoint"):
+        prefix_sha256 = range_sha256(file_path, 0, checkpoint["offset"])
+    if prefix_sha256 != checkpoint["prefix_sha256"]:
+        return None, "이전에 파싱한 앞부분이 수정됨"
+    return checkpoint, None
+
+
+def ingest(file_path, subject, jobs=1, writers=WRITER_THREADS, checkpoint=None):
+    """exam.txt를 파싱해 종목/회차 파티션 저장 -> (종목 -> 회차 -> 문제 수, 새 체크포인트)
+
+    checkpoint가 있으면 마지막 회차 구간부터만 파싱하며, 새로 읽은 부분에
+    그 앞에서 이미 저장한 회차가 다시 나오면 None을 반환합니다 (전체 파싱 필요).
+    """
+    start = checkpoint["offset"] if checkpoint else 0
+    prefix_rounds = set(checkpoint["prefix_rounds"]) if checkpoint else set()
+    parallel = jobs > 1 and checkpoint is None
+
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        tracker = OffsetTracker(f, start, prefix_rounds)
+        if parallel:
+            records = iter_exam_records_parallel(file_path, jobs, subject)
+        else:
+            records = iter_tracked_records(tracker, subject)
+
+        # 회차 단위로 파싱하면서 종목별 파티션을 바로 저장
+        partitions = iter_partitions(records)
+        writer = PartitionWriter(writers)
+        try:
+            while True:
+                with profiling.stage("parse"):
+                    partition = next(partitions, None)
+                if partition is None:
+                    break
+                (record_subject, exam_num), exam_dict = partition
+                if exam_num in prefix_rounds:
+                    return None
+                with profiling.stage("write"):
+                    writer.submit(record_subject, exam_num, exam_dict)
+        finally:
+            with profiling.stage("write"):
+                writer.close()
+
+        if parallel:
+            # 병렬 파싱은 오프셋을 세지 않으므로 문제 경계만 한 번 더 훑음
+            with profiling.stage("checkpoint"):
+                for _ in tracker.track(iter_raw_records(tracker.lines())):
+                    pass
+
+    with profiling.stage("checkpoint"):
+        new_checkpoint = make_checkpoint(file_path, subject, tracker)
+    return writer.counts, new_checkpoint
+
+
+def update(exam_txt_path=EXAM_TXT_PATH, subject=DEFAULT_SUBJECT, jobs=1, writers=WRITER_THREADS, full=False):
+    """exam.txt를 (체크포인트가 있으면 추가된 부분만) 파싱해 문제목록과 매니페스트 저장 -> 매니페스트
+
+    지난 파싱 이후 바뀐 내용이 없으면 None을 반환합니다.
+    """
+    checkpoint, reason = None, "--full 지정"
+    counts = None
+    if not full:
+        checkpoint, reason = load_checkpoint(exam_txt_path, subject)
+    if checkpoint is not None:
+        counts = load_manifest_counts()
+        if counts is None:
+            checkpoint, reason = None, "매니페스트 또는 저장된 문제목록 없음"
+
+    result = None
+    if checkpoint is not None:
+        size = os.path.getsize(exam_txt_path)
+        if size == checkpoint["size"] and \
+                range_sha256(exam_txt_path, checkpoint["offset"], size) == checkpoint["tail_sha256"]:
+            print("✓ 지난 파싱 이후 변경 없음")
+            return None
+        print(f"추가된 부분만 파싱: {checkpoint['offset']:,}/{size:,}바이트 이후")
+        print()
+        result = ingest(exam_txt_path, subject, jobs, writers, checkpoint)
+        if result is None:
+            print("⚠️  이미 저장한 회차가 추가된 부분에 다시 나와 전체를 다시 파싱합니다")
+            print()
+    elif os.path.exists(CHECKPOINT_PATH):
+        print(f"전체 파싱: {reason}")
+        print()
+
+    if result is None:
+        counts = {}
+        result = ingest(exam_txt_path, subject, jobs, writers)
+
+    touched, new_checkpoint = result
+    for record_subject, rounds in touched.items():
+        counts.setdefault(record_subject, {}).update(rounds)
+
+    manifest = build_manifest(exam_txt_path, counts)
+    save_json(manifest, MANIFEST_PATH)
+    save_json(new_checkpoint, CHECKPOINT_PATH)
+
+    if subject == DEFAULT_SUBJECT:
+        print(f"발견된 회차: {sorted(counts.get(subject, {}))}")
+    else:
+        for record_subject, info in manifest["subjects"].items():
+            print(f"[{record_subject}] 발견된 회차: {list(info['rounds'])} (총 {info['total_questions']}문제)")
+    if checkpoint is not None:
+        updated = sorted({exam_num for rounds in touched.values() for exam_num in rounds}, key=exam_sort_key)
+        print(f"다시 저장한 회차: {updated}")
+    print(f"✓ 매니페스트 저장: {MANIFEST_PATH}")
+    return manifest
+
+
+def preview_update(exam_txt_path=EXAM_TXT_PATH, full=False):
+    """update()가 관리 종목에서 다시 저장할 문제목록 -> {경로: 저장할 내용의 SHA-256} (파일은 쓰지 않음)
+
+    update()와 같은 기준으로 체크포인트를 확인해 다시 파싱할 구간만 읽습니다.
+    내용이 그대로인 회차도 포함하므로 실제로 바뀌는지는 기존 파일과 비교해야 합니다.
+    """
+    checkpoint = None
+    if not full:
+        checkpoint, _ = load_checkpoint(exam_txt_path, DEFAULT_SUBJECT)
+    if checkpoint is not None and load_manifest_counts() is None:
+        checkpoint = None
+    if checkpoint is not None:
+        size = os.path.getsize(exam_txt_path)
+        if size == checkpoint["size"] and \
+                range_sha256(exam_txt_path, checkpoint["offset"], size) == checkpoint["tail_sha256"]:
+            return {}
+
+    start = checkpoint["offset"] if checkpoint else 0
+    prefix_rounds = set(checkpoint["prefix_rounds"]) if checkpoint else set()
+    exam_data = {}
+    with open(exam_txt_path, 'rb') as f:
+        f.seek(start)
+        tracker = OffsetTracker(f, start, prefix_rounds)
+        for (_, exam_num), exam_dict in iter_partitions(iter_tracked_records(tracker)):
+            if exam_num in prefix_rounds:
+                # update()도 이 경우 전체를 다시 파싱함
+                return preview_update(exam_txt_path, full=True)
+            merged = exam_data.setdefault(exam_num, {})
+            for period, questions in exam_dict.items():
+                merged.setdefault(period, []).extend(questions)
+
+    return {
+        DATA_DIR / f"{exam_num}회_문제목록.json":
+            hashlib.sha256(serialize_exam_output(exam_output(exam_num, exam_dict)).encode('utf-8')).hexdigest()
+        for exam_num, exam_dict in exam_data.items()
+    }
+
+
 def main():
     """메인 함수"""
-    project_root = Path(__file__).parent.parent
-    exam_txt_path = project_root / "data" / "exam.txt"
-
-    if not exam_txt_path.exists():
-        print(f"⚠️  exam.txt 파일을 찾을 수 없습니다: {exam_txt_path}")
+    if not EXAM_TXT_PATH.exists():
+        print(f"⚠️  exam.txt 파일을 찾을 수 없습니다: {EXAM_TXT_PATH}")
         return
 
-    print(f"exam.txt 파싱 중: {exam_txt_path}")
+    print(f"exam.txt 파싱 중: {EXAM_TXT_PATH}")
     print()
 
-    # 파싱
-    exam_data = parse_exam_txt(exam_txt_path)
+    jobs = 1
+    if "--jobs" in sys.argv:
+        jobs = int(sys.argv[sys.argv.index("--jobs") + 1])
+    writers = WRITER_THREADS
+    if "--writers" in sys.argv:
+        writers = int(sys.argv[sys.argv.index("--writers") + 1])
+    subject = None if "--all-subjects" in sys.argv else DEFAULT_SUBJECT
 
-    print(f"발견된 회차: {sorted(exam_data.keys())}\n")
-
-    # 각 회차별 저장
-    for exam_num in sorted(exam_data.keys()):
-        save_exam_data(exam_num, exam_data[exam_num])
-        print()
+    update(EXAM_TXT_PATH, subject, jobs, writers, full="--full" in sys.argv)
 
 
 if __name__ == "__main__":
-    main()
+    with profiling.session("parse_exam_txt"):
+        main()
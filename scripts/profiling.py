@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+스크립트 공통 프로파일링/계측 도구
+
+각 스크립트를 --profile과 함께 실행하면 단계별(load, parse, extract keywords,
+categorize, aggregate, render, write) 소요 시간, 호출 횟수, 최대 RSS와
+출제기준 카테고리별 매칭 횟수를 기록하고 요약 표를 출력합니다.
+
+결과 파일 (PROJECT_ROOT/profiles/):
+- {스크립트}_{시각}.trace.jsonl  단계 실행 기록 (한 줄에 한 건, 단계별 최대 1000건)
+- {스크립트}_{시각}.folded       flamegraph.pl / speedscope용 collapsed stack (단위: μs)
+- {스크립트}_{시각}.prof         --cprofile 사용 시 cProfile 통계 (snakeviz 등으로 확인)
+
+사용법 (각 스크립트 공통):
+    python analyze.py 137 --profile
+    python analyze.py 137 --profile --cprofile
+
+계측 코드 작성:
+    import profiling
+
+    with profiling.stage("load"):
+        ...
+
+    if __name__ == "__main__":
+        with profiling.session("analyze"):
+            main()
+
+--profile이 없으면 stage()는 아무것도 하지 않는 컨텍스트를 반환합니다.
+--jobs 병렬 실행 시 작업 프로세스 내부의 단계는 집계되지 않습니다.
+"""
+
+import cProfile
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PROFILE_DIR = PROJECT_ROOT / "profiles"
+
+MAX_TRACE_EVENTS_PER_STAGE = 1000
+
+
+def peak_rss_kb():
+    """현재 프로세스의 최대 RSS (KB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class Profiler:
+    """단계별 소요 시간/호출 횟수/최대 RSS 수집기"""
+
+    def __init__(self, script):
+        self.script = script
+        self.started = time.perf_counter()
+        self.stack = []
+        self.stats = {}
+        self.match_counts = {}
+        self.events = []
+
+    @contextmanager
+    def stage(self, name):
+        """단계 실행 구간 측정 (중첩 가능)"""
+        self.stack.append(name)
+        path = tuple(self.stack)
+        # 처음 진입한 순서대로 기록 (상위 단계가 하위 단계보다 먼저)
+        stat = self.stats.setdefault(path, {"seconds": 0.0, "calls": 0, "peak_rss_kb": 0})
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.stack.pop()
+            rss = peak_rss_kb()
+
+            stat["seconds"] += seconds
+            stat["calls"] += 1
+            stat["peak_rss_kb"] = max(stat["peak_rss_kb"], rss)
+
+            if stat["calls"] <= MAX_TRACE_EVENTS_PER_STAGE:
+                self.events.append({
+                    "stage": "/".join(path),
+                    "start": round(start - self.started, 6),
+                    "seconds": round(seconds, 6),
+                    "peak_rss_kb": rss,
+                })
+
+    def count_matches(self, category, hits):
+        """출제기준 카테고리별 매칭 횟수 누적"""
+        self.match_counts[category] = self.match_counts.get(category, 0) + hits
+
+    def self_seconds(self, path):
+        """하위 단계를 제외한 단계 자체 소요 시간"""
+        children = sum(
+            stat["seconds"] for child, stat in self.stats.items()
+            if len(child) == len(path) + 1 and child[:len(path)] == path
+        )
+        return max(self.stats[path]["seconds"] - children, 0.0)
+
+    def write(self, total_seconds, output_dir):
+        """trace.jsonl / folded 파일 저장 후 경로 반환"""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        prefix = output_dir / f"{self.script}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        trace_path = prefix.with_suffix(".trace.jsonl")
+        with open(trace_path, "w", encoding="utf-8") as f:
+            for event in self.events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            for path, stat in self.stats.items():
+                f.write(json.dumps({
+                    "summary": "/".join(path),
+                    "calls": stat["calls"],
+                    "seconds": round(stat["seconds"], 6),
+                    "peak_rss_kb": stat["peak_rss_kb"],
+                }, ensure_ascii=False) + "\n")
+            f.write(json.dumps({
+                "total_seconds": round(total_seconds, 6),
+                "peak_rss_kb": peak_rss_kb(),
+                "match_counts": self.match_counts,
+            }, ensure_ascii=False) + "\n")
+
+        folded_path = prefix.with_suffix(".folded")
+        top_level = sum(stat["seconds"] for path, stat in self.stats.items() if len(path) == 1)
+        with open(folded_path, "w", encoding="utf-8") as f:
+            untracked = max(total_seconds - top_level, 0.0)
+            f.write(f"{self.script} {int(untracked * 1e6)}\n")
+            for path in self.stats:
+                f.write(f"{';'.join((self.script,) + path)} {int(self.self_seconds(path) * 1e6)}\n")
+
+        return trace_path, folded_path
+
+    def print_summary(self, total_seconds):
+        """단계별 요약 표 출력"""
+        print("\n" + "=" * 80)
+        print(f"⏱  프로파일 요약 ({self.script}, 총 {total_seconds:.3f}s, 최대 RSS {peak_rss_kb() / 1024:.1f}MB)")
+        print("=" * 80)
+        print(f"{'단계':<36} {'호출':>10} {'시간(s)':>12} {'비율':>8} {'최대 RSS(MB)':>12}")
+        print("-" * 80)
+        for path, stat in self.stats.items():
+            name = "  " * (len(path) - 1) + path[-1]
+            share = stat["seconds"] / total_seconds * 100 if total_seconds > 0 else 0
+            print(f"{name:<36} {stat['calls']:>10} {stat['seconds']:>12.4f} {share:>7.1f}% "
+                  f"{stat['peak_rss_kb'] / 1024:>12.1f}")
+
+        if self.match_counts:
+            print("\n카테고리별 매칭 횟수:")
+            for category, hits in sorted(self.match_counts.items()):
+                print(f"  {category:<36} {hits:>10}")
+
+
+_PROFILER = None
+_NULL_STAGE = nullcontext()
+
+
+def enabled():
+    """--profile로 계측 중인지 여부"""
+    return _PROFILER is not None
+
+
+def stage(name):
+    """단계 측정 컨텍스트 (계측 중이 아니면 아무 일도 하지 않음)"""
+    if _PROFILER is None:
+        return _NULL_STAGE
+    return _PROFILER.stage(name)
+
+
+def count_matches(category, hits=1):
+    """출제기준 카테고리별 매칭 횟수 기록"""
+    if _PROFILER is not None:
+        _PROFILER.count_matches(category, hits)
+
+
+@contextmanager
+def session(script, output_dir=None):
+    """sys.argv에서 --profile/--cprofile을 제거하고, 지정된 경우 실행 전체를 계측"""
+    global _PROFILER
+
+    use_profile = "--profile" in sys.argv
+    use_cprofile = "--cprofile" in sys.argv
+    sys.argv = [arg for arg in sys.argv if arg not in ("--profile", "--cprofile")]
+
+    if not (use_profile or use_cprofile):
+        yield
+        return
+
+    output_dir = Path(output_dir or PROFILE_DIR)
+    _PROFILER = Profiler(script)
+    cprofiler = cProfile.Profile() if use_cprofile else None
+    if cprofiler:
+        cprofiler.enable()
+
+    try:
+        yield
+    finally:
+        if cprofiler:
+            cprofiler.disable()
+        total_seconds = time.perf_counter() - _PROFILER.started
+
+        _PROFILER.print_summary(total_seconds)
+        trace_path, folded_path = _PROFILER.write(total_seconds, output_dir)
+        print(f"\n✓ 프로파일 저장: {trace_path}")
+        print(f"  - flamegraph: {folded_path}")
+        if cprofiler:
+            prof_path = trace_path.with_name(trace_path.name.replace(".trace.jsonl", ".prof"))
+            cprofiler.dump_stats(prof_path)
+            print(f"  - cProfile: {prof_path}")
+        _PROFILER = None
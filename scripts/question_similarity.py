@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+문제 제목 TF-IDF 유사도와 문제별 관련 기출문제 top-k (NumPy/SciPy 필요)
+
+제목을 한글 문자 2~3-gram(어절 안에서만)과 영문/숫자 토큰으로 벡터화해 희소 TF-IDF
+행렬을 만들고, 행 블록 단위의 희소 행렬 곱으로 문제마다 가장 비슷한 기출문제 k개를 구합니다.
+기출문제는 그 문제보다 앞선 회차의 문제만 뜻합니다 (같은 회차와 이후 회차는 제외).
+N×N 전체 유사도 행렬은 만들지 않으며, 한 번에 최대 BLOCK_CELLS개 유사도만 메모리에 둡니다.
+
+결과: data/exam_results/question_similarity.sqlite3 (학습 계획 도구 등에서 조회)
+    questions(id, exam_number, period, number, title)
+    related(question_id, rank, related_id, score)   -- (question_id, rank) 인덱스
+
+사용법:
+    python question_similarity.py build            # 유사도 계산 후 저장 (기본 top-10)
+    python question_similarity.py build --top-k 20
+    python question_similarity.py related 137 1 5  # 137회 1교시 5번과 비슷한 이전 회차 문제
+"""
+
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+
+import corpus
+import exam_store
+import profiling
+from analyze_duplicates import QUESTION_ENDING, clean_question_title
+
+TOP_K = 10
+# 계산 방식을 바꾸면 올려서 예전 파일을 다시 계산하게
+SIMILARITY_VERSION = 2
+NGRAM_SIZES = (2, 3)
+
+# 블록 하나에서 계산하는 유사도 개수 상한 (블록 행 수 = BLOCK_CELLS // 전체 문제 수)
+BLOCK_CELLS = 1 << 22
+
+HANGUL_RUN = re.compile(r'[가-힣]+')
+ENGLISH_TOKEN = re.compile(r'[A-Za-z0-9][A-Za-z0-9+#\-]*')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    exam_number TEXT NOT NULL,
+    period TEXT NOT NULL,
+    number TEXT NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_questions_position ON questions (exam_number, period, number);
+CREATE TABLE IF NOT EXISTS related (
+    question_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    related_id INTEGER NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (question_id, rank)
+);
+"""
+
+
+def similarity_path():
+    """현재 저장소 옆의 유사도 파일 경로"""
+    return exam_store.STORE_PATH.with_name("question_similarity.sqlite3")
+
+
+def title_features(title):
+    """제목 -> 특징 목록 (한글 어절 안의 문자 n-gram, 소문자 영문/숫자 토큰)"""
+    text = QUESTION_ENDING.sub('', clean_question_title(title.replace('"', '')))
+    features = []
+    for run in HANGUL_RUN.findall(text):
+        for size in NGRAM_SIZES:
+            if len(run) >= size:
+                features.extend(run[i:i + size] for i in range(len(run) - size + 1))
+        if len(run) < NGRAM_SIZES[0]:
+            features.append(run)
+    features.extend("w:" + token.lower() for token in ENGLISH_TOKEN.findall(text) if not token.isdigit())
+    return features
+
+
+def tfidf_matrix(titles):
+    """제목 목록 -> 행 단위 L2 정규화된 희소 TF-IDF 행렬 (CSR, 문제 × 특징)
+
+    tf는 1 + log(빈도), idf는 log((1 + N) / (1 + df)) + 1
+    """
+    import numpy as np
+    from scipy import sparse
+
+    vocabulary = {}
+    indptr = [0]
+    indices = []
+    counts = []
+    for title in titles:
+        for feature, count in Counter(title_features(title)).items():
+            indices.append(vocabulary.setdefault(feature, len(vocabulary)))
+            counts.append(count)
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (1 + np.log(np.array(counts, dtype=np.float64)), np.array(indices, dtype=np.int64), indptr),
+        shape=(len(titles), len(vocabulary)))
+    df = np.bincount(matrix.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(titles)) / (1 + df)) + 1
+    matrix = matrix @ sparse.diags(idf)
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms) @ matrix
+
+
+def iter_top_k(matrix, k=TOP_K, block_cells=BLOCK_CELLS, order=None):
+    """문제마다 자기 자신을 뺀 코사인 유사도 상위 k개 -> (행, [(열, 점수), ...]) (점수 내림차순)
+
+    행 블록과 전체 행렬의 전치를 곱한 블록(블록 행 수 × N)만 계산합니다.
+    order(행마다 회차 순번)를 주면 순번이 그 행보다 작은 행만 후보로 삼습니다.
+    """
+    import numpy as np
+
+    n = matrix.shape[0]
+    if n < 2:
+        return
+    k = min(k, n - 1)
+    block_rows = max(1, block_cells // n)
+    transposed = matrix.T.tocsc()
+
+    for start in range(0, n, block_rows):
+        end = min(start + block_rows, n)
+        scores = (matrix[start:end] @ transposed).toarray()
+        if order is None:
+            scores[np.arange(end - start), np.arange(start, end)] = -1  # 자기 자신 제외
+        else:
+            scores[order[np.newaxis, :] >= order[start:end, np.newaxis]] = -1  # 같은/이후 회차 제외
+
+        top = np.argpartition(scores, -k, axis=1)[:, -k:]
+        for offset, columns in enumerate(top):
+            row_scores = scores[offset, columns]
+            # 점수 내림차순, 같은 점수는 앞선 문제 먼저
+            order = np.lexsort((columns, -row_scores))
+            yield start + offset, [(int(columns[i]), float(row_scores[i]))
+                                   for i in order if row_scores[i] > 0]
+
+
+def build(k=TOP_K, path=None):
+    """코퍼스 전체의 관련 기출문제 top-k를 계산해 저장 -> (문제 수, 저장 경로)"""
+    import numpy as np
+
+    path = path or similarity_path()
+    data = corpus.get_corpus()
+    questions = data["questions"]
+    rounds = sorted({q.exam_number for q in questions}, key=exam_store.exam_sort_key)
+    position = {exam_num: i for i, exam_num in enumerate(rounds)}
+    order = np.array([position[q.exam_number] for q in questions], dtype=np.int64)
+
+    with profiling.stage("vectorize"):
+        matrix = tfidf_matrix([q.title for q in questions])
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        with conn:
+            conn.executemany(
+                "INSERT INTO questions (id, exam_number, period, number, title) VALUES (?, ?, ?, ?, ?)",
+                [(i, q.exam_number, q.period, q.number, q.title) for i, q in enumerate(questions)])
+            with profiling.stage("top-k"):
+                for row, related in iter_top_k(matrix, k, order=order):
+                    conn.executemany(
+                        "INSERT INTO related (question_id, rank, related_id, score) VALUES (?, ?, ?, ?)",
+                        [(row, rank, column, round(score, 6)) for rank, (column, score) in enumerate(related, 1)])
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("store", repr(data["key"][1])), ("version", str(SIMILARITY_VERSION)),
+                 ("top_k", str(k)), ("features", str(matrix.shape[1]))])
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    return len(questions), path
+
+
+def read_meta(path=None):
+    """유사도 파일의 meta 테이블 -> {키: 값} (파일이 없으면 빈 dict)"""
+    path = path or similarity_path()
+    if not path.exists():
+        return {}
+    with sqlite3.connect(path) as conn:
+        return dict(conn.execute("SELECT key, value FROM meta"))
+
+
+def is_fresh(path=None):
+    """유사도 파일이 현재 저장소 내용과 계산 방식으로 만든 것인지"""
+    meta = read_meta(path)
+    return (meta.get("version") == str(SIMILARITY_VERSION)
+            and meta.get("store") == repr(corpus.get_corpus()["key"][1]))
+
+
+def find_related(exam_num, period, number, path=None):
+    """문제의 관련 기출문제 목록 -> (제목, [(회차, 교시, 번호, 제목, 점수), ...]) (없는 문제면 None)"""
+    path = path or similarity_path()
+    period = period if str(period).endswith("교시") else f"{period}교시"
+    with sqlite3.connect(path) as conn:
+        row = conn.execute(
+            "SELECT id, title FROM questions WHERE exam_number = ? AND period = ? AND number = ?",
+            (str(exam_num), period, str(number))).fetchone()
+        if row is None:
+            return None
+        related = conn.execute(
+            "SELECT q.exam_number, q.period, q.number, q.title, r.score FROM related r"
+            " JOIN questions q ON q.id = r.related_id WHERE r.question_id = ? ORDER BY r.rank",
+            (row[0],)).fetchall()
+    return row[1], related
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    if not args or args[0] not in ("build", "related"):
+        print("사용법: python question_similarity.py build [--top-k N]")
+        print("       python question_similarity.py related <회차> <교시> <번호>")
+        sys.exit(1)
+
+    if args[0] == "build":
+        k = int(args[args.index("--top-k") + 1]) if "--top-k" in args else TOP_K
+        count, path = build(k)
+        print(f"✓ 관련 기출문제 top-{k} 저장: {path} ({count}문제)")
+        return
+
+    if len(args) < 4:
+        print("사용법: python question_similarity.py related <회차> <교시> <번호>")
+        sys.exit(1)
+    if not is_fresh():
+        # 사용자가 build --top-k로 정한 k를 유지
+        k = int(read_meta().get("top_k", TOP_K))
+        count, path = build(k)
+        print(f"✓ 관련 기출문제 top-{k} 다시 계산: {path} ({count}문제)")
+        print()
+
+    found = find_related(*args[1:4])
+    if found is None:
+        print(f"⚠️  {args[1]}회 {args[2].removesuffix('교시')}교시 {args[3]}번 문제를 찾을 수 없습니다.")
+        sys.exit(1)
+
+    title, related = found
+    print(f"📌 {args[1]}회 {args[2].removesuffix('교시')}교시 {args[3]}: {title}")
+    print("-" * 100)
+    if not related:
+        print("  이전 회차에 비슷한 문제가 없습니다.")
+    for exam_num, period, number, related_title, score in related:
+        title_short = related_title[:70] + "..." if len(related_title) > 70 else related_title
+        print(f"  {score:.3f}  {exam_num}회 {period} {number}: {title_short}")
+
+
+if __name__ == "__main__":
+    with profiling.session("question_similarity"):
+        main()
@@ -8,15 +8,30 @@
     python report_generator.py 136 137  # 136회, 137회 통합 리포트
 """
 
+import os
 import sys
-import json
 from pathlib import Path
 from datetime import datetime
 
+import aggregate_cube
+import corpus
+import exam_store
+import profiling
+from keyword_classifier import KeywordClassifier
+from syllabus_compiler import get_syllabus_structure
+
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "exam_results"
 REPORTS_DIR = PROJECT_ROOT / "reports"
 
+# 비율 추이 이동평균 회차 수
+MOVING_AVERAGE_WINDOW = 3
+
+# 문제 제목 분류 (제목에 용어가 포함되면 해당, 회차별 문제 수 집계)
+TITLE_CLASSES = {
+    "AI": ["ai", "인공지능", "gnn", "transformer"],
+}
+
 
 class ReportGenerator:
     """리포트 생성 클래스"""
@@ -24,39 +39,113 @@ class ReportGenerator:
     def __init__(self, exam_numbers):
         self.exam_numbers = sorted([int(n) for n in exam_numbers], reverse=True)
         self.analysis_data = {}
-        self.syllabus_categories = [
-            "1. 정보 전략 및 관리",
-            "2. 소프트웨어 공학",
-            "3. 자료처리",
-            "4. 컴퓨터 시스템 및 정보통신",
-            "5. 정보보안",
-            "6. 최신기술, 법규 및 정책"
-        ]
+        self.syllabus_categories = list(get_syllabus_structure())
+        self.cube = None
+        self._summary = None
 
     def load_analysis_data(self):
-        """분석 데이터 로드"""
+        """분석 데이터 로드 (공통 코퍼스 로더)"""
         for exam_num in self.exam_numbers:
-            data_path = DATA_DIR / f"{exam_num}회_분석결과.json"
+            data = corpus.load_analysis(exam_num)
 
-            if not data_path.exists():
-                print(f"⚠️  {exam_num}회 분석 결과를 찾을 수 없습니다: {data_path}")
+            if data is None:
+                print(f"⚠️  {exam_num}회 분석 결과를 찾을 수 없습니다: {exam_store.legacy_paths(exam_num, DATA_DIR)[2]}")
                 continue
 
-            with open(data_path, "r", encoding="utf-8") as f:
-                self.analysis_data[exam_num] = json.load(f)
+            self.analysis_data[exam_num] = data
+            self._summary = None
 
             print(f"✓ {exam_num}회 분석 데이터 로드 완료")
 
+    def load_cube(self):
+        """집계 큐브 로드 (비교 리포트는 회차별 문제 대신 큐브만 사용)"""
+        self.cube = aggregate_cube.load_cube()
+        self._summary = None
+        for exam_num in self.exam_numbers:
+            if not self.cube.has_round(exam_num):
+                print(f"⚠️  {exam_num}회 분석 결과를 찾을 수 없습니다: {exam_store.legacy_paths(exam_num, DATA_DIR)[2]}")
+                continue
+            print(f"✓ {exam_num}회 집계 로드 완료")
+
+    def summary(self):
+        """리포트 전체에서 공유하는 집계 (집계 큐브에서 한 번 계산, 다시 로드할 때까지 재사용)
+
+        - rounds: 분석 결과가 있는 회차 (exam_numbers 순서)
+        - round_counts / round_shares: 회차별 {카테고리: 문제 수 / 비율(%)}
+        - category_totals / category_shares: 전체 회차 카테고리별 문제 수 / 비율(%)
+        - ranked / ranked_ascending: 문제 수 내림차순 / 오름차순 (카테고리, 문제 수) 목록
+        - round_top: 회차별 최다 출제 카테고리 (카테고리, 문제 수) ("미분류" 제외)
+        - moving_averages: 카테고리별 [(회차, 최근 MOVING_AVERAGE_WINDOW회 평균 비율), ...] (회차 오름차순)
+        - latest / latest_classes: 최신 회차 (없으면 None)와 그 회차의 {TITLE_CLASSES 분류: 문제 수}
+        """
+        if self._summary is not None:
+            return self._summary
+        if self.cube is None:
+            self.cube = aggregate_cube.load_cube()
+
+        with profiling.stage("aggregate"):
+            cube = self.cube
+            rounds = [exam_num for exam_num in self.exam_numbers if cube.has_round(exam_num)]
+            category_totals = dict.fromkeys(self.syllabus_categories, 0)
+            round_counts = {}
+            round_shares = {}
+            round_top = {}
+            grand_total = 0
+
+            for exam_num in rounds:
+                all_counts = cube.category_counts(exam_num)
+                total = sum(all_counts.values())
+                grand_total += total
+
+                counts = {cat: all_counts.get(cat, 0) for cat in self.syllabus_categories}
+                for cat, count in counts.items():
+                    category_totals[cat] += count
+                round_counts[exam_num] = counts
+                round_shares[exam_num] = {cat: (count / total * 100) if total > 0 else 0
+                                          for cat, count in counts.items()}
+                round_top[exam_num] = max(all_counts.items(),
+                                          key=lambda x: x[1] if x[0] != "미분류" else 0, default=None)
+
+            # 최신 회차 제목 분류 (최신 회차 문제만 읽음)
+            latest = self.exam_numbers[0] if self.exam_numbers and cube.has_round(self.exam_numbers[0]) else None
+            latest_classes = dict.fromkeys(TITLE_CLASSES, 0)
+            if latest is not None:
+                classifier = KeywordClassifier(TITLE_CLASSES, syllabus=False)
+                for question in corpus.load_questions([latest]):
+                    for label in classifier.classify(question.title):
+                        latest_classes[label] += 1
+
+            self._summary = {
+                "rounds": rounds,
+                "round_counts": round_counts,
+                "round_shares": round_shares,
+                "category_totals": category_totals,
+                "category_shares": {cat: (count / grand_total * 100) if grand_total > 0 else 0
+                                    for cat, count in category_totals.items()},
+                "ranked": sorted(category_totals.items(), key=lambda x: x[1], reverse=True),
+                "ranked_ascending": sorted(category_totals.items(), key=lambda x: x[1]),
+                "round_top": round_top,
+                "moving_averages": {cat: cube.moving_average(cat, MOVING_AVERAGE_WINDOW, rounds)
+                                    for cat in self.syllabus_categories},
+                "latest": latest,
+                "latest_classes": latest_classes,
+            }
+        return self._summary
+
     def generate_single_report(self, exam_num):
-        """단일 회차 리포트 생성"""
+        """단일 회차 리포트 생성 (Markdown 문자열)"""
         if exam_num not in self.analysis_data:
             print(f"⚠️  {exam_num}회 데이터가 없습니다.")
             return
 
+        return "".join(self.render_single_report(exam_num))
+
+    def render_single_report(self, exam_num):
+        """단일 회차 리포트를 Markdown 조각 단위로 생성"""
         data = self.analysis_data[exam_num]
         stats = data["statistics"]
 
-        report = f"""# {exam_num}회 정보관리기술사 출제기준 분석 리포트
+        yield f"""# {exam_num}회 정보관리기술사 출제기준 분석 리포트
 
 **분석일자**: {datetime.now().strftime('%Y-%m-%d')}
 **시험회차**: {exam_num}회
@@ -70,29 +159,30 @@ class ReportGenerator:
 |---------|--------|------|--------|
 """
 
-        total = stats['total_questions']
+        summary = self.summary()
+        counts = summary["round_counts"][exam_num]
+        shares = summary["round_shares"][exam_num]
         for category in self.syllabus_categories:
-            count = stats['category_count'].get(category, 0)
-            percentage = (count / total * 100) if total > 0 else 0
-            bar = "■" * int(percentage / 5)
-            report += f"| {category} | {count}문제 | {percentage:.1f}% | {bar} |\n"
+            bar = "■" * int(shares[category] / 5)
+            yield f"| {category} | {counts[category]}문제 | {shares[category]:.1f}% | {bar} |\n"
 
-        report += "\n---\n\n## 📝 카테고리별 출제 문제 상세\n\n"
+        yield "\n---\n\n## 📝 카테고리별 출제 문제 상세\n\n"
 
         for category in self.syllabus_categories:
-            count = stats['category_count'].get(category, 0)
+            count = counts[category]
             if count > 0:
-                report += f"### {category} ({count}문제)\n\n"
-                questions = stats['category_questions'].get(category, [])
-                for q in questions:
-                    report += f"- {q}\n"
-                report += "\n"
-
-        return report
+                yield f"### {category} ({count}문제)\n\n"
+                for q in stats['category_questions'].get(category, []):
+                    yield f"- {q}\n"
+                yield "\n"
 
     def generate_comparison_report(self):
-        """여러 회차 비교 리포트 생성"""
-        report = f"""# 정보관리기술사 기출문제 출제 경향 분석
+        """여러 회차 비교 리포트 생성 (Markdown 문자열)"""
+        return "".join(self.render_comparison_report())
+
+    def render_comparison_report(self):
+        """여러 회차 비교 리포트를 Markdown 조각 단위로 생성"""
+        yield f"""# 정보관리기술사 기출문제 출제 경향 분석
 
 **분석 대상**: {', '.join([f'{n}회' for n in self.exam_numbers])}
 **분석일자**: {datetime.now().strftime('%Y-%m-%d')}
@@ -104,137 +194,144 @@ class ReportGenerator:
 
 """
 
-        # 회차별 카테고리 통계
-        report += "| 주요항목 |"
-        for exam_num in self.exam_numbers:
-            report += f" {exam_num}회 |"
-        report += " 평균 |\n"
-
-        report += "|" + "-" * 40 + "|"
-        for _ in self.exam_numbers:
-            report += "---------|"
-        report += "---------|\n"
+        # 회차별 카테고리 통계 (공유 집계에서 행 단위로 출력)
+        yield "| 주요항목 |" + "".join(f" {exam_num}회 |" for exam_num in self.exam_numbers) + " 평균 |\n"
+        yield "|" + "-" * 40 + "|" + "---------|" * len(self.exam_numbers) + "---------|\n"
 
+        summary = self.summary()
+        round_counts = summary["round_counts"]
+        round_shares = summary["round_shares"]
         for category in self.syllabus_categories:
-            report += f"| {category} |"
-            counts = []
-
+            cells = []
             for exam_num in self.exam_numbers:
-                if exam_num in self.analysis_data:
-                    count = self.analysis_data[exam_num]["statistics"]["category_count"].get(category, 0)
-                    total = self.analysis_data[exam_num]["statistics"]["total_questions"]
-                    percentage = (count / total * 100) if total > 0 else 0
-                    report += f" {count}({percentage:.0f}%) |"
-                    counts.append(count)
+                if exam_num in round_counts:
+                    cells.append(f" {round_counts[exam_num][category]}({round_shares[exam_num][category]:.0f}%) |")
                 else:
-                    report += " N/A |"
+                    cells.append(" N/A |")
 
+            counts = [round_counts[exam_num][category] for exam_num in summary["rounds"]]
             avg = sum(counts) / len(counts) if counts else 0
-            report += f" {avg:.1f} |\n"
+            yield f"| {category} |" + "".join(cells) + f" {avg:.1f} |\n"
 
-        report += "\n---\n\n## 💡 출제 경향 분석\n\n"
+        yield from self._share_trends()
 
-        # 경향 분석
-        report += self._analyze_trends()
+        yield "\n---\n\n## 💡 출제 경향 분석\n\n"
 
-        report += "\n---\n\n## 🎯 향후 대비 전략\n\n"
-        report += self._generate_strategy()
+        # 경향 분석
+        yield from self._analyze_trends()
 
-        return report
+        yield "\n---\n\n## 🎯 향후 대비 전략\n\n"
+        yield from self._generate_strategy()
 
-    def _analyze_trends(self):
-        """출제 경향 분석"""
-        trends = "### 주요 발견사항\n\n"
+    def _share_trends(self):
+        """카테고리별 출제 비율 추이 (Markdown 조각, 분석된 회차가 2개 이상일 때만)"""
+        summary = self.summary()
+        if len(summary["rounds"]) < 2:
+            return
 
-        # 가장 많이 출제된 카테고리 찾기
-        category_totals = {cat: 0 for cat in self.syllabus_categories}
+        # 분석된 회차가 이동평균 구간보다 적으면 실제로 평균한 회차 수로 표시
+        window = min(MOVING_AVERAGE_WINDOW, len(summary["rounds"]))
+        # 직전 구간은 최근 구간과 겹치지 않는 그 앞 window개 회차 (회차가 부족하면 생략)
+        has_previous = len(summary["rounds"]) > window
+        yield f"\n### 카테고리별 출제 비율 추이 (최근 {window}회 이동평균)\n\n"
+        if has_previous:
+            yield f"| 주요항목 | 전체 비율 | 최근 {window}회 평균 | 직전 {window}회 평균 | 변화 |\n"
+            yield "|---------|-----------|-------------|-------------|------|\n"
+        else:
+            yield f"| 주요항목 | 전체 비율 | 최근 {window}회 평균 |\n"
+            yield "|---------|-----------|-------------|\n"
 
-        for exam_num in self.exam_numbers:
-            if exam_num in self.analysis_data:
-                stats = self.analysis_data[exam_num]["statistics"]
-                for cat in self.syllabus_categories:
-                    category_totals[cat] += stats["category_count"].get(cat, 0)
+        for category in self.syllabus_categories:
+            averages = summary["moving_averages"][category]
+            recent = averages[-1][1]
+            row = f"| {category} | {summary['category_shares'][category]:.1f}% | {recent:.1f}% |"
+            if has_previous:
+                previous = averages[-1 - window][1]
+                change = recent - previous
+                arrow = "▲" if change > 0.05 else "▼" if change < -0.05 else "-"
+                row += f" {previous:.1f}% | {arrow} {abs(change):.1f}%p |"
+            yield row + "\n"
 
-        sorted_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
+    def _analyze_trends(self):
+        """출제 경향 분석 (Markdown 조각)"""
+        summary = self.summary()
+        ranked = summary["ranked"]
 
-        trends += f"1. **최다 출제 영역**: {sorted_categories[0][0]} ({sorted_categories[0][1]}문제)\n"
-        trends += f"2. **최소 출제 영역**: {sorted_categories[-1][0]} ({sorted_categories[-1][1]}문제)\n\n"
+        yield "### 주요 발견사항\n\n"
+        yield f"1. **최다 출제 영역**: {ranked[0][0]} ({ranked[0][1]}문제)\n"
+        yield f"2. **최소 출제 영역**: {ranked[-1][0]} ({ranked[-1][1]}문제)\n\n"
 
         # 최신 회차의 특징
-        if self.exam_numbers and self.exam_numbers[0] in self.analysis_data:
-            latest = self.exam_numbers[0]
-            latest_stats = self.analysis_data[latest]["statistics"]
+        latest = summary["latest"]
+        if latest is not None:
+            yield f"### {latest}회 특징\n\n"
 
-            trends += f"### {latest}회 특징\n\n"
-
-            max_cat = max(latest_stats["category_count"].items(), key=lambda x: x[1] if x[0] != "미분류" else 0)
-            trends += f"- 최다 출제 영역: {max_cat[0]} ({max_cat[1]}문제)\n"
-
-            # AI 관련 문제 카운트
-            ai_count = 0
-            for period, questions in self.analysis_data[latest]["questions"].items():
-                for q in questions:
-                    if any(keyword in q["제목"].lower() for keyword in ["ai", "인공지능", "gnn", "transformer"]):
-                        ai_count += 1
+            max_cat = summary["round_top"][latest]
+            yield f"- 최다 출제 영역: {max_cat[0]} ({max_cat[1]}문제)\n"
 
+            ai_count = summary["latest_classes"]["AI"]
             if ai_count > 0:
-                trends += f"- AI 관련 문제: {ai_count}문제\n"
-
-        return trends
+                yield f"- AI 관련 문제: {ai_count}문제\n"
 
     def _generate_strategy(self):
-        """대비 전략 생성"""
-        strategy = ""
+        """대비 전략 생성 (Markdown 조각)"""
+        # 출제 빈도가 낮은 영역
+        ranked_ascending = self.summary()["ranked_ascending"]
 
-        # 출제 빈도가 낮은 영역 찾기
-        category_totals = {cat: 0 for cat in self.syllabus_categories}
+        yield "### 단기 전략\n\n"
+        yield f"1. **과소 출제 영역 보완**: {ranked_ascending[0][0]}, {ranked_ascending[1][0]}\n"
+        yield "2. **최신 기술 트렌드 학습**: AI, 클라우드, 보안 분야\n"
+        yield "3. **실무 사례 준비**: 이론 + 실무 결합 답안 작성 연습\n\n"
 
-        for exam_num in self.exam_numbers:
-            if exam_num in self.analysis_data:
-                stats = self.analysis_data[exam_num]["statistics"]
-                for cat in self.syllabus_categories:
-                    category_totals[cat] += stats["category_count"].get(cat, 0)
-
-        sorted_categories = sorted(category_totals.items(), key=lambda x: x[1])
-
-        strategy += "### 단기 전략\n\n"
-        strategy += f"1. **과소 출제 영역 보완**: {sorted_categories[0][0]}, {sorted_categories[1][0]}\n"
-        strategy += "2. **최신 기술 트렌드 학습**: AI, 클라우드, 보안 분야\n"
-        strategy += "3. **실무 사례 준비**: 이론 + 실무 결합 답안 작성 연습\n\n"
-
-        strategy += "### 중장기 전략\n\n"
-        strategy += "1. **6개 주요항목 균형있게 학습**\n"
-        strategy += "2. **최신 정책 및 가이드라인 지속 모니터링**\n"
-        strategy += "3. **과거 기출문제 패턴 분석 및 예상 문제 도출**\n"
-
-        return strategy
+        yield "### 중장기 전략\n\n"
+        yield "1. **6개 주요항목 균형있게 학습**\n"
+        yield "2. **최신 정책 및 가이드라인 지속 모니터링**\n"
+        yield "3. **과거 기출문제 패턴 분석 및 예상 문제 도출**\n"
 
     def save_report(self, content, filename):
-        """리포트 저장"""
+        """리포트 저장 (문자열 또는 Markdown 조각 이터러블을 파일에 바로 기록)
+
+        임시 파일에 쓴 뒤 교체하므로 렌더링 중 오류가 나도 기존 리포트는 그대로 남습니다.
+        """
         REPORTS_DIR.mkdir(parents=True, exist_ok=True)
         output_path = REPORTS_DIR / filename
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+
+        with profiling.stage("write"):
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    if isinstance(content, str):
+                        f.write(content)
+                    else:
+                        f.writelines(content)
+                os.replace(tmp_path, output_path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
 
         print(f"✓ 리포트 저장: {output_path}")
         return output_path
 
     def generate(self):
         """리포트 생성 메인 함수"""
-        self.load_analysis_data()
-
+        # 렌더링한 조각을 바로 파일에 기록 (리포트 전체를 메모리에 만들지 않음)
         if len(self.exam_numbers) == 1:
-            # 단일 회차 리포트
+            # 단일 회차 리포트 (문제 목록이 필요하므로 회차 분석 데이터 로드)
+            with profiling.stage("load"):
+                self.load_analysis_data()
             exam_num = self.exam_numbers[0]
-            report = self.generate_single_report(exam_num)
-            if report:
-                self.save_report(report, f"{exam_num}회_분석_리포트.md")
+            if exam_num not in self.analysis_data:
+                print(f"⚠️  {exam_num}회 데이터가 없습니다.")
+                return
+            with profiling.stage("render"):
+                self.save_report(self.render_single_report(exam_num), f"{exam_num}회_분석_리포트.md")
         else:
-            # 비교 리포트
-            report = self.generate_comparison_report()
+            # 비교 리포트 (집계 큐브만 사용)
+            with profiling.stage("load"):
+                self.load_cube()
             filename = f"{self.exam_numbers[-1]}-{self.exam_numbers[0]}회_비교_분석.md"
-            self.save_report(report, filename)
+            with profiling.stage("render"):
+                self.save_report(self.render_comparison_report(), filename)
 
 
 def main():
@@ -251,4 +348,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with profiling.session("report_generator"):
+        main()
@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+출제기준 컴파일러
+
+출제기준 PDF에서 추출한 data/syllabus/출제기준_전체텍스트.txt를 파싱해
+주요항목(카테고리) → 세부항목 계층을 만들고, data/syllabus/출제기준_보강용어.json의
+보강 용어(기출문제 분석으로 추가한 세부항목/키워드)를 합쳐 매칭 인덱스(SyllabusIndex)로
+컴파일합니다. analyze.py 등은 매번 인덱스를 만드는 대신 디스크에 저장된 인덱스를 읽습니다.
+
+컴파일 결과: data/syllabus/.syllabus_index.pickle
+- 원본 두 파일의 수정 시각/크기가 그대로면 바로 사용
+- 바뀌었으면 내용 해시(SHA-256)를 비교해 내용이 다를 때만 다시 컴파일
+
+보강용어 파일 형식 (카테고리 이름은 출제기준 텍스트의 주요항목과 같아야 함):
+    {
+      "1. 정보 전략 및 관리": {
+        "세부항목": ["SLA", ...],   # 출제기준 세부항목에 추가할 용어 (매칭 키워드로 기록)
+        "키워드": ["경영", ...],     # 점수에만 반영되는 용어
+        "제외": ["..."]             # (선택) 출제기준 텍스트에서 가져오지 않을 용어
+      },
+      ...
+    }
+
+사용법:
+    python syllabus_compiler.py          # 컴파일 (원본이 그대로면 기존 인덱스 사용)
+    python syllabus_compiler.py --force  # 강제 재컴파일
+    python syllabus_compiler.py --show   # 파싱된 출제기준 계층 출력
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import profiling
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SYLLABUS_DIR = PROJECT_ROOT / "data" / "syllabus"
+SYLLABUS_TEXT_PATH = SYLLABUS_DIR / "출제기준_전체텍스트.txt"
+OVERRIDE_PATH = SYLLABUS_DIR / "출제기준_보강용어.json"
+INDEX_PATH = SYLLABUS_DIR / ".syllabus_index.pickle"
+
+# 파싱 규칙이나 SyllabusIndex 구조를 바꾸면 올려서 저장된 인덱스를 무효화
+COMPILER_VERSION = "1"
+
+# 필기과목명 열 - PDF 추출 시 각 페이지 왼쪽 줄 앞부분에 조각조각 섞여 들어옴
+SUBJECT_COLUMN = ("정보의 구조, 수집, 정리, 축적, 검색 등 정보시스템의 설계 및 수치계산, "
+                  "그 밖에 정보의 분석, 관리 및 기본적인 응용에 관한 사항")
+
+PAGE_SEPARATOR = re.compile(r"^=+\n페이지 \d+\n=+\n", re.M)
+CATEGORY_LINE = re.compile(r"^(\d+)\. (.+?) (?=\d+\. )")
+ITEM_MARKER = re.compile(r"(?:^|\s)(\d+)\.\s")
+EXAMPLE_MARKER = re.compile(r"(?:^|\s)[가나다라마바사]\s?\.\s")
+TRAILING_ETC = re.compile(r"\s등(\s.*)?$")
+HANGUL = re.compile(r"[가-힣]")
+
+
+def written_exam_lines(text):
+    """필기 출제기준 페이지의 본문 줄 (페이지 머리말과 필기과목명 열 제거)"""
+    for page in PAGE_SEPARATOR.split(text):
+        if "( 면 접 )" in page:
+            break
+        lines = page.split("\n")
+        header = next((i for i, line in enumerate(lines) if line.startswith("필기과목명")), None)
+        if header is None:
+            continue
+
+        # 필기과목명 열은 페이지마다 처음부터 다시 시작
+        position = 0
+        for line in lines[header + 1:]:
+            rest = SUBJECT_COLUMN[position:]
+            common = 0
+            while common < min(len(line), len(rest)) and line[common] == rest[common]:
+                common += 1
+            if common >= 4:
+                position += common
+                line = line[common:]
+            line = line.strip()
+            if line:
+                yield line
+
+
+def join_wrapped(text, line):
+    """줄바꿈으로 잘린 텍스트 잇기 (한글 단어 중간에서 잘린 경우 공백 없이)"""
+    if not text:
+        return line
+    if HANGUL.match(text[-1]) and HANGUL.match(line[0]):
+        last_word = text.split()[-1]
+        first_word = re.match(r"[가-힣]+", line).group()
+        if last_word not in ("및", "등") and first_word not in ("및", "등"):
+            return text + line
+    return text + " " + line
+
+
+def parse_items(body):
+    """주요항목 본문 -> [{"세부항목", "예시", "내용"}, ...]
+
+    - 세부항목: "1. 정보전략" 같은 번호 항목
+    - 예시: "가. 운영체제 나. 시스템 프로그래밍" 또는 "가. 인공지능, IoT 등 ..." 목록
+    - 내용: "-정보기술 전략 기획" 같은 하이픈 항목
+    """
+    items = []
+    parts = ITEM_MARKER.split(body)
+    for content in parts[2::2]:
+        head, *examples = EXAMPLE_MARKER.split(content)
+        name, _, details = head.partition("-")
+        listed = []
+        for example in examples:
+            listed.extend(term.strip() for term in TRAILING_ETC.sub("", example.strip()).split(","))
+        items.append({
+            "세부항목": name.strip(),
+            "예시": [term for term in listed if term],
+            "내용": [detail.strip() for detail in details.split("-") if detail.strip()],
+        })
+    return items
+
+
+def parse_syllabus_text(text):
+    """출제기준 텍스트 -> {"1. 정보 전략 및 관리": [세부항목, ...], ...} (주요항목 순서 유지)"""
+    bodies = {}
+    names = []
+    fragment = None
+    expect_wrap = False
+
+    for line in written_exam_lines(text):
+        number = len(names)
+        match = CATEGORY_LINE.match(line)
+
+        if expect_wrap:
+            # 주요항목 열에서 줄바꿈된 글자 (예: "정보통" + "신")
+            expect_wrap = False
+            first, _, rest = line.partition(" ")
+            if len(first) == 1 and HANGUL.match(first):
+                names[-1] = names[-1] + first if is_new else names[-1]
+                line = rest
+
+        if names and line.startswith(f"{number}. {fragment}"):
+            # 다음 페이지 첫 줄에 반복되는 주요항목
+            line = line[len(f"{number}. {fragment}"):].strip()
+            expect_wrap, is_new = names[-1] != fragment, False
+        elif match and int(match.group(1)) == number + 1:
+            fragment = match.group(2)
+            names.append(fragment)
+            bodies[fragment] = ""
+            line = line[match.end():]
+            expect_wrap, is_new = bool(HANGUL.match(fragment[-1])), True
+
+        if line:
+            key = next(reversed(bodies))
+            bodies[key] = join_wrapped(bodies[key], line)
+
+    return {
+        f"{number}. {name}": parse_items(body)
+        for number, (name, body) in enumerate(zip(names, bodies.values()), 1)
+    }
+
+
+def official_terms(items):
+    """세부항목 계층에서 매칭 용어 추출 (세부항목 이름, 괄호 안 용어, 예시 목록)"""
+    terms = []
+    for item in items:
+        name = item["세부항목"]
+        inner = re.search(r"\((.+?)\)", name)
+        terms.append(re.sub(r"\(.*?\)", "", name).strip())
+        if inner:
+            terms.append(TRAILING_ETC.sub("", inner.group(1)).strip())
+        terms.extend(item["예시"])
+    return terms
+
+
+def compile_structure(outline, overrides):
+    """출제기준 계층 + 보강 용어 -> {카테고리: {"세부항목": [...], "키워드": [...]}}
+
+    보강 용어 목록은 중복까지 그대로 유지합니다 (중복된 용어는 점수에 두 번 반영).
+    """
+    unknown = [category for category in overrides if category not in outline]
+    if unknown:
+        raise ValueError(
+            f"출제기준 텍스트에 없는 카테고리: {', '.join(unknown)} "
+            f"(파싱된 주요항목: {', '.join(outline)})")
+
+    structure = {}
+    for category, items in outline.items():
+        extra = overrides.get(category, {})
+        existing = {term.lower() for term in extra.get("세부항목", [])}
+        excluded = set(extra.get("제외", []))
+
+        official = []
+        for term in official_terms(items):
+            if term and term not in excluded and term.lower() not in existing:
+                existing.add(term.lower())
+                official.append(term)
+
+        structure[category] = {
+            "세부항목": official + list(extra.get("세부항목", [])),
+            "키워드": list(extra.get("키워드", [])),
+        }
+    return structure
+
+
+@lru_cache(maxsize=None)
+def boundary_pattern(keyword_lower):
+    """단어 경계 매칭용 정규식 (키워드별로 한 번만 컴파일)"""
+    return re.compile(r'\b' + re.escape(keyword_lower) + r'\b')
+
+
+class AhoCorasick:
+    """다중 패턴 문자열 매칭 오토마톤 (Aho-Corasick)
+
+    패턴 목록을 한 번 컴파일해 두고, 텍스트를 한 번 훑으면서
+    등장하는 모든 패턴(겹치는 위치 포함)을 찾습니다.
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._lengths = []
+
+        for pattern_id, pattern in enumerate(patterns):
+            self._lengths.append(len(pattern))
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern_id)
+
+        # BFS로 실패 링크 구성
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def to_state(self):
+        """저장용 상태 (기본 자료형만 사용)"""
+        return self._goto, self._fail, self._output, self._lengths
+
+    @classmethod
+    def from_state(cls, state):
+        """to_state() 결과로 오토마톤 복원"""
+        automaton = cls.__new__(cls)
+        automaton._goto, automaton._fail, automaton._output, automaton._lengths = state
+        return automaton
+
+    def iter_matches(self, text):
+        """(시작 위치, 패턴 ID)를 등장 순서대로 반환"""
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                yield index - lengths[pattern_id] + 1, pattern_id
+
+
+class SyllabusIndex:
+    """출제기준 구조 전체를 한 번에 컴파일한 매칭 인덱스 (INDEX_PATH에 저장되어 재사용)
+
+    - terms: (소문자 용어, 단어경계 필요 여부) 목록
+    - boundary_patterns: 단어경계가 필요한 용어 ID -> 컴파일된 정규식
+    - term_categories: 소문자 용어 -> 해당 용어가 속한 카테고리 목록
+    - 정방향(출제기준 용어 ⊂ 문제 키워드/제목): Aho-Corasick 한 번 스캔
+    - 역방향(문제 키워드 ⊂ 출제기준 용어): 용어의 모든 부분문자열 인덱스 조회
+
+    대소문자를 무시하고 한쪽이 다른 쪽에 포함되면 매칭하되, 포함되는 쪽이 3글자 이하
+    영문이면 단어 경계로 구분될 때만 매칭합니다.
+    """
+
+    def __init__(self, syllabus):
+        self.categories = list(syllabus.keys())
+
+        # 용어 ID -> [(카테고리, 세부항목 여부, 원래 용어), ...]
+        self.terms = []
+        self._entries = []
+        term_ids = {}
+        for category, details in syllabus.items():
+            for kind in ("세부항목", "키워드"):
+                for term in details[kind]:
+                    key = (term.lower(), len(term) <= 3 and term.isascii())
+                    term_id = term_ids.get(key)
+                    if term_id is None:
+                        term_id = term_ids[key] = len(self.terms)
+                        self.terms.append(key)
+                        self._entries.append([])
+                    self._entries[term_id].append((category, kind == "세부항목", term))
+
+        self._compile_boundary_patterns()
+
+        self.term_categories = {}
+        for term_id, (lowered, _) in enumerate(self.terms):
+            categories = self.term_categories.setdefault(lowered, [])
+            for category, _, _ in self._entries[term_id]:
+                if category not in categories:
+                    categories.append(category)
+
+        self._automaton = AhoCorasick([lowered for lowered, _ in self.terms])
+
+        # 역방향 매칭용: 용어(소문자)의 모든 부분문자열 -> 용어 ID 집합
+        self._substrings = {}
+        for term_id, (lowered, _) in enumerate(self.terms):
+            for start in range(len(lowered) + 1):
+                for end in range(start, len(lowered) + 1):
+                    self._substrings.setdefault(lowered[start:end], set()).add(term_id)
+
+    def _compile_boundary_patterns(self):
+        self.boundary_patterns = {
+            term_id: boundary_pattern(lowered)
+            for term_id, (lowered, boundary) in enumerate(self.terms) if boundary
+        }
+
+    def to_state(self):
+        """저장용 상태 (정규식/오토마톤 객체 대신 기본 자료형만 사용)"""
+        return {
+            "categories": self.categories,
+            "terms": self.terms,
+            "entries": self._entries,
+            "term_categories": self.term_categories,
+            "automaton": self._automaton.to_state(),
+            "substrings": self._substrings,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """to_state() 결과로 인덱스 복원 (용어 추출/부분문자열 계산 생략)"""
+        index = cls.__new__(cls)
+        index.categories = state["categories"]
+        index.terms = state["terms"]
+        index._entries = state["entries"]
+        index.term_categories = state["term_categories"]
+        index._automaton = AhoCorasick.from_state(state["automaton"])
+        index._substrings = state["substrings"]
+        index._compile_boundary_patterns()
+        return index
+
+    def scan(self, text):
+        """텍스트에 포함된 출제기준 용어 ID 집합 (정방향)"""
+        text_lower = text.lower()
+        found = set()
+        for start, term_id in self._automaton.iter_matches(text_lower):
+            if term_id in found:
+                continue
+            pattern = self.boundary_patterns.get(term_id)
+            if pattern is not None and not pattern.match(text_lower, start):
+                continue
+            found.add(term_id)
+        return found
+
+    def contained_in(self, keyword):
+        """키워드를 포함하는 출제기준 용어 ID 집합 (역방향)"""
+        keyword_lower = keyword.lower()
+        candidates = self._substrings.get(keyword_lower, set())
+        if len(keyword) <= 3 and keyword.isascii():
+            pattern = boundary_pattern(keyword_lower)
+            return {term_id for term_id in candidates if pattern.search(self.terms[term_id][0])}
+        return candidates
+
+    def matching_terms(self, keyword):
+        """문제 키워드와 양방향으로 매칭되는 출제기준 용어 ID 집합"""
+        return self.scan(keyword) | self.contained_in(keyword)
+
+    def category_term_counts(self):
+        """(용어 ID, 카테고리 번호, 등장 횟수) 목록 - 용어×카테고리 가중치 행렬 구성용"""
+        category_ids = {category: i for i, category in enumerate(self.categories)}
+        counts = []
+        for term_id, entries in enumerate(self._entries):
+            per_category = {}
+            for category, _, _ in entries:
+                per_category[category] = per_category.get(category, 0) + 1
+            counts.extend((term_id, category_ids[category], count) for category, count in per_category.items())
+        return counts
+
+    def matched_terms(self, category, keyword_term_ids, title_term_ids):
+        """카테고리에 반영된 매칭 키워드 (제목 매칭은 세부항목만 포함)"""
+        matched = set()
+        for term_id in keyword_term_ids:
+            matched.update(term for cat, _, term in self._entries[term_id] if cat == category)
+        for term_id in title_term_ids:
+            matched.update(term for cat, is_item, term in self._entries[term_id] if cat == category and is_item)
+        return sorted(matched)
+
+    def score(self, question_dict):
+        """카테고리별 점수와 매칭 키워드 계산 (점수 0인 카테고리 제외)"""
+        scores = dict.fromkeys(self.categories, 0)
+        matched = {category: [] for category in self.categories}
+
+        # 문제 키워드와 양방향 매칭
+        for q_keyword in question_dict["키워드"]:
+            for term_id in self.matching_terms(q_keyword):
+                for category, _, term in self._entries[term_id]:
+                    scores[category] += 3
+                    matched[category].append(term)
+
+        # 제목 매칭 (카테고리 키워드는 점수만 반영)
+        for term_id in self.scan(question_dict["제목"]):
+            for category, is_item, term in self._entries[term_id]:
+                scores[category] += 3
+                if is_item:
+                    matched[category].append(term)
+
+        if profiling.enabled():
+            for category, score in scores.items():
+                if score:
+                    profiling.count_matches(category, score // 3)
+
+        return {
+            category: {"score": scores[category], "matched_keywords": sorted(set(matched[category]))}
+            for category in self.categories if scores[category] > 0
+        }
+
+
+def source_state(path):
+    """원본 파일의 수정 시각/크기/내용 해시"""
+    stat = os.stat(path)
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(Path(path).read_bytes()).hexdigest(),
+    }
+
+
+def is_fresh(compiled, sources, version=COMPILER_VERSION):
+    """저장된 인덱스가 원본과 일치하는지 (수정 시각/크기가 같으면 해시 비교 생략)"""
+    if compiled.get("version") != version or set(compiled["sources"]) != set(sources):
+        return False
+    for name, path in sources.items():
+        saved = compiled["sources"][name]
+        stat = os.stat(path)
+        if (stat.st_mtime_ns, stat.st_size) == (saved["mtime_ns"], saved["size"]):
+            continue
+        if hashlib.sha256(Path(path).read_bytes()).hexdigest() != saved["sha256"]:
+            return False
+        # 내용은 같고 수정 시각만 바뀐 경우: 다음 확인부터 해시 계산 생략
+        saved["mtime_ns"], saved["size"] = stat.st_mtime_ns, stat.st_size
+        compiled["touched"] = True
+    return True
+
+
+def compiled_fingerprint(compiled):
+    """컴파일 결과의 지문 (버전 + 원본 파일 내용 해시, 파생 캐시의 유효성 확인용)"""
+    sources = sorted((name, state["sha256"]) for name, state in compiled["sources"].items())
+    payload = json.dumps([compiled["version"], sources], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def write_index(compiled, path):
+    """인덱스 저장 (병렬 실행 중 다른 프로세스가 읽어도 안전하도록 임시 파일 후 교체)"""
+    compiled.pop("touched", None)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def compile_syllabus(text_path=None, override_path=None):
+    """출제기준 텍스트 + 보강 용어 파일을 컴파일한 결과 (저장하지 않음)"""
+    text_path = Path(text_path or SYLLABUS_TEXT_PATH)
+    override_path = Path(override_path or OVERRIDE_PATH)
+
+    outline = parse_syllabus_text(text_path.read_text(encoding="utf-8"))
+    overrides = {}
+    if override_path.exists():
+        with open(override_path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+
+    structure = compile_structure(outline, overrides)
+    return {
+        "version": COMPILER_VERSION,
+        "sources": {"text": source_state(text_path), "override": source_state(override_path)},
+        "outline": outline,
+        "structure": structure,
+        "index": SyllabusIndex(structure).to_state(),
+    }
+
+
+_COMPILED = None
+_INDEX = None
+
+
+def load_compiled(force=False):
+    """저장된 인덱스를 읽고, 없거나 원본이 바뀌었으면 다시 컴파일해 저장 (프로세스당 1회)"""
+    global _COMPILED, _INDEX
+    if _COMPILED is not None and not force:
+        return _COMPILED
+
+    sources = {"text": SYLLABUS_TEXT_PATH, "override": OVERRIDE_PATH}
+    compiled = None
+    with profiling.stage("load syllabus"):
+        if not force and INDEX_PATH.exists():
+            try:
+                with open(INDEX_PATH, "rb") as f:
+                    compiled = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                compiled = None
+            if compiled is not None and not is_fresh(compiled, sources):
+                compiled = None
+            elif compiled is not None and compiled.get("touched"):
+                write_index(compiled, INDEX_PATH)
+
+        if compiled is None:
+            compiled = compile_syllabus()
+            write_index(compiled, INDEX_PATH)
+
+    _COMPILED, _INDEX = compiled, None
+    return compiled
+
+
+def get_syllabus_structure():
+    """출제기준 구조 {카테고리: {"세부항목": [...], "키워드": [...]}}"""
+    return load_compiled()["structure"]
+
+
+def get_syllabus_index():
+    """컴파일된 출제기준 매칭 인덱스 (프로세스당 1회 로드)"""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = SyllabusIndex.from_state(load_compiled()["index"])
+    return _INDEX
+
+
+def syllabus_index_fingerprint():
+    """현재 출제기준 인덱스의 지문 (출제기준 텍스트/보강 용어 파일이 바뀌면 달라짐)"""
+    return compiled_fingerprint(load_compiled())
+
+
+def print_outline(outline):
+    """파싱된 출제기준 계층 출력"""
+    for category, items in outline.items():
+        print(f"\n{category}")
+        for item in items:
+            print(f"  - {item['세부항목']}")
+            for example in item["예시"]:
+                print(f"      · {example}")
+            for detail in item["내용"]:
+                print(f"      - {detail}")
+
+
+def main():
+    """메인 함수"""
+    force = "--force" in sys.argv
+
+    try:
+        compiled = load_compiled(force=force)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  출제기준 컴파일 실패: {e}")
+        sys.exit(1)
+
+    if "--show" in sys.argv:
+        print_outline(compiled["outline"])
+        print()
+
+    index = get_syllabus_index()
+    print(f"✓ 출제기준 인덱스: {INDEX_PATH}")
+    print(f"  카테고리 {len(index.categories)}개, 매칭 용어 {len(index.terms)}개")
+    for category, details in compiled["structure"].items():
+        print(f"  {category}: 세부항목 {len(details['세부항목'])}개, 키워드 {len(details['키워드'])}개")
+
+
+if __name__ == "__main__":
+    with profiling.session("syllabus_compiler"):
+        main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+기술 용어 사전과 최장 일치 토크나이저
+
+출제기준 용어(세부항목/키워드), 서브노트 제목(sub-notes/**/*.md의 '# ' 제목과 파일 이름),
+data/syllabus/기술용어사전.txt의 보강 용어로 사전을 만들고, 제목을 왼쪽부터 훑으며
+사전에 있는 가장 긴 용어 단위로 자릅니다. "[가-힣]{3,}" 같은 정규식과 달리 "설명하시오" 같은
+일반 어절은 나오지 않고, "클라우드보안시스템"처럼 붙여 쓴 복합어는 사전 용어 단위로 나뉩니다.
+
+사전은 syllabus_compiler.AhoCorasick 오토마톤(트라이 + 실패 링크)으로 컴파일되어 제목 길이에
+비례하는 시간에 한 번 훑으며, data/syllabus/.term_dictionary.pickle에 저장됩니다.
+- 원본 파일의 수정 시각/크기가 그대로면 바로 사용
+- 바뀌었으면 내용 해시(SHA-256)를 비교해 내용이 다를 때만 다시 생성
+
+매칭 규칙:
+- 대소문자 구분 없음, 연속된 공백/줄바꿈은 공백 하나로 취급
+- 띄어 쓴 용어는 붙여 쓴 표기도 함께 찾음 ("디지털 트윈" -> "디지털트윈")
+- 영문/숫자로 시작하거나 끝나는 용어는 영단어 중간에서 찾지 않음 ("AI"는 "RAID"에서 찾지 않음)
+- 한 글자 용어와 숫자로만 된 용어는 제외
+- 같은 용어의 여러 표기는 먼저 등록된 표기로 반환 (보강 용어 -> 출제기준 -> 서브노트 순)
+
+사용법:
+    from term_dictionary import extract_terms, tokenize
+
+    tokenize("클라우드 네이티브 아키텍처의 구성요소")  # [(0, 9, "클라우드 네이티브"), ...]
+    extract_terms(title)                              # {"클라우드 네이티브", "아키텍처", ...}
+
+    python term_dictionary.py               # 사전 생성 (원본이 그대로면 기존 사전 사용)
+    python term_dictionary.py --force       # 강제 재생성
+    python term_dictionary.py "문제 제목"    # 제목 분절 결과 출력
+"""
+
+import pickle
+import re
+import sys
+
+import profiling
+from syllabus_compiler import (
+    COMPILER_VERSION, OVERRIDE_PATH, PROJECT_ROOT, SYLLABUS_DIR, SYLLABUS_TEXT_PATH,
+    AhoCorasick, compiled_fingerprint, get_syllabus_structure, is_fresh, source_state, write_index,
+)
+
+SUB_NOTES_DIR = PROJECT_ROOT / "sub-notes"
+CURATED_PATH = SYLLABUS_DIR / "기술용어사전.txt"
+DICTIONARY_PATH = SYLLABUS_DIR / ".term_dictionary.pickle"
+
+# 사전 구성 규칙이나 저장 형식을 바꾸면 올려서 저장된 사전을 무효화
+# (출제기준 컴파일 규칙이 바뀌어도 다시 생성되도록 COMPILER_VERSION을 함께 기록)
+DICTIONARY_VERSION = "1"
+
+WHITESPACE = re.compile(r"\s+")
+IRREGULAR_SPACE = re.compile(r"\s{2,}|[^\S ]")
+NOTE_NUMBER = re.compile(r"^\d+_")
+PARENTHESIZED = re.compile(r"\s*\(([^)]*)\)")
+
+
+def normalize_term(term):
+    """사전 키 (소문자, 연속 공백은 하나로)"""
+    return WHITESPACE.sub(" ", term).strip().lower()
+
+
+def is_word_char(char):
+    """영단어를 이루는 글자인지 (영문/숫자)"""
+    return char.isascii() and char.isalnum()
+
+
+def curated_terms(path=CURATED_PATH):
+    """보강 용어 파일의 용어 목록 (빈 줄과 '#' 주석 제외)"""
+    if not path.exists():
+        return []
+    terms = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            terms.append(line)
+    return terms
+
+
+def syllabus_terms():
+    """출제기준 구조의 세부항목/키워드 (카테고리 순서)"""
+    return [term for details in get_syllabus_structure().values()
+            for kind in ("세부항목", "키워드") for term in details[kind]]
+
+
+def note_paths():
+    """서브노트 파일 목록 (경로 순)"""
+    return sorted(SUB_NOTES_DIR.glob("**/*.md")) if SUB_NOTES_DIR.exists() else []
+
+
+def note_terms(path):
+    """서브노트 하나의 용어 ('# ' 제목, 제목의 괄호 안 용어, 파일 이름의 '_' 구분 조각)"""
+    terms = []
+    with open(path, "r", encoding="utf-8") as f:
+        heading = next((line[2:].strip() for line in f if line.startswith("# ")), "")
+    if heading:
+        terms.append(PARENTHESIZED.sub("", heading).strip())
+        for inner in PARENTHESIZED.findall(heading):
+            terms.extend(part.strip() for part in inner.split(","))
+    terms.extend(NOTE_NUMBER.sub("", path.stem).split("_"))
+    return terms
+
+
+def dictionary_sources():
+    """사전 원본 파일 {이름: 경로}"""
+    sources = {"text": SYLLABUS_TEXT_PATH, "override": OVERRIDE_PATH}
+    if CURATED_PATH.exists():
+        sources["curated"] = CURATED_PATH
+    for path in note_paths():
+        sources[f"note:{path.relative_to(SUB_NOTES_DIR).as_posix()}"] = path
+    return sources
+
+
+def build_dictionary():
+    """세 원본의 용어로 사전 생성 (저장하지 않음)
+
+    terms는 반환용 표기, patterns는 찾을 문자열(소문자, 붙여 쓴 표기 포함),
+    pattern_terms는 찾을 문자열 -> terms 번호입니다.
+    """
+    terms = []
+    pattern_ids = {}
+    pattern_terms = []
+
+    def add(term):
+        term = WHITESPACE.sub(" ", term).strip()
+        key = normalize_term(term)
+        compact = key.replace(" ", "")
+        if len(compact) < 2 or compact.isdigit() or key in pattern_ids:
+            return
+        term_id = len(terms)
+        terms.append(term)
+        for pattern in (key, compact):
+            if pattern not in pattern_ids:
+                pattern_ids[pattern] = len(pattern_terms)
+                pattern_terms.append(term_id)
+
+    for term in curated_terms():
+        add(term)
+    for term in syllabus_terms():
+        add(term)
+    for path in note_paths():
+        for term in note_terms(path):
+            add(term)
+
+    patterns = list(pattern_ids)
+    return {
+        "version": f"{DICTIONARY_VERSION}/{COMPILER_VERSION}",
+        "sources": {name: source_state(path) for name, path in dictionary_sources().items()},
+        "terms": terms,
+        "pattern_terms": pattern_terms,
+        "pattern_lengths": [len(pattern) for pattern in patterns],
+        "automaton": AhoCorasick(patterns).to_state(),
+    }
+
+
+class TermDictionary:
+    """컴파일된 용어 사전 (build_dictionary() 결과로 생성)"""
+
+    def __init__(self, compiled):
+        self.terms = compiled["terms"]
+        self._pattern_terms = compiled["pattern_terms"]
+        self._pattern_lengths = compiled["pattern_lengths"]
+        self._automaton = AhoCorasick.from_state(compiled["automaton"])
+        self.fingerprint = compiled_fingerprint(compiled)
+
+    def tokenize(self, text):
+        """왼쪽부터 가장 긴 사전 용어 단위로 자른 결과 -> [(시작, 끝, 용어), ...] (원문 위치)"""
+        normalized, positions = self._normalize(text)
+
+        # 시작 위치별로 가장 긴 용어 (영단어 중간에서 시작하거나 끝나는 용어 제외)
+        longest = [None] * len(normalized)
+        for start, pattern_id in self._automaton.iter_matches(normalized):
+            end = start + self._pattern_lengths[pattern_id]
+            best = longest[start]
+            if best is not None and best[0] >= end:
+                continue
+            if start > 0 and is_word_char(normalized[start]) and is_word_char(normalized[start - 1]):
+                continue
+            if end < len(normalized) and is_word_char(normalized[end - 1]) and is_word_char(normalized[end]):
+                continue
+            longest[start] = (end, pattern_id)
+
+        tokens = []
+        cursor = 0
+        for start, best in enumerate(longest):
+            if best is None or start < cursor:
+                continue
+            end, pattern_id = best
+            tokens.append((positions[start], positions[end - 1] + 1, self.terms[self._pattern_terms[pattern_id]]))
+            cursor = end
+        return tokens
+
+    def extract_terms(self, text):
+        """텍스트에 나온 사전 용어 집합"""
+        return {term for _, _, term in self.tokenize(text)}
+
+    @staticmethod
+    def _normalize(text):
+        """소문자 + 연속 공백을 하나로 줄인 텍스트와 각 글자의 원문 위치"""
+        lowered = text.lower()
+        if len(lowered) == len(text) and not IRREGULAR_SPACE.search(text):
+            return lowered, range(len(text))
+
+        chars = []
+        positions = []
+        for index, char in enumerate(text):
+            if char.isspace():
+                if chars and chars[-1] == " ":
+                    continue
+                char = " "
+            for lowered_char in char.lower():
+                chars.append(lowered_char)
+                positions.append(index)
+        return "".join(chars), positions
+
+
+_DICTIONARY = None
+
+
+def load_dictionary(force=False):
+    """저장된 사전을 읽고, 없거나 원본이 바뀌었으면 다시 생성해 저장 (프로세스당 1회)"""
+    global _DICTIONARY
+    if _DICTIONARY is not None and not force:
+        return _DICTIONARY
+
+    compiled = None
+    with profiling.stage("load term dictionary"):
+        if not force and DICTIONARY_PATH.exists():
+            try:
+                with open(DICTIONARY_PATH, "rb") as f:
+                    compiled = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+                compiled = None
+            version = f"{DICTIONARY_VERSION}/{COMPILER_VERSION}"
+            if compiled is not None and not is_fresh(compiled, dictionary_sources(), version):
+                compiled = None
+            elif compiled is not None and compiled.get("touched"):
+                write_index(compiled, DICTIONARY_PATH)
+
+        if compiled is None:
+            compiled = build_dictionary()
+            write_index(compiled, DICTIONARY_PATH)
+
+        _DICTIONARY = TermDictionary(compiled)
+    return _DICTIONARY
+
+
+def dictionary_fingerprint():
+    """현재 용어 사전의 지문 (사전 원본 파일이 바뀌면 달라짐)"""
+    return load_dictionary().fingerprint
+
+
+def tokenize(text):
+    """왼쪽부터 가장 긴 사전 용어 단위로 자른 결과 -> [(시작, 끝, 용어), ...]"""
+    return load_dictionary().tokenize(text)
+
+
+def extract_terms(text):
+    """텍스트에 나온 사전 용어 집합"""
+    return load_dictionary().extract_terms(text)
+
+
+def main():
+    """메인 함수"""
+    args = sys.argv[1:]
+    force = "--force" in args
+    texts = [arg for arg in args if not arg.startswith("--")]
+
+    try:
+        dictionary = load_dictionary(force=force)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  용어 사전 생성 실패: {e}")
+        sys.exit(1)
+
+    if not texts:
+        print(f"✓ 기술 용어 사전: {DICTIONARY_PATH}")
+        print(f"  용어 {len(dictionary.terms)}개 (보강 용어 {len(curated_terms())}개, "
+              f"서브노트 {len(note_paths())}개 포함)")
+        return
+
+    for text in texts:
+        print(f"📌 {text}")
+        for start, end, term in dictionary.tokenize(text):
+            print(f"  {start:3d}-{end:<3d} {text[start:end]!r:30s} -> {term}")
+        print()
+
+
+if __name__ == "__main__":
+    with profiling.session("term_dictionary"):
+        main()